@@ -0,0 +1 @@
+"""Benchmarks de rendimiento de la capa de datos (no forman parte de la app)."""
@@ -0,0 +1,55 @@
+"""
+Benchmark de búsqueda: FTS5 (bm25) frente a la subcadena en Python.
+
+La variante "subcadena" es el comportamiento anterior (y el de respaldo sin
+FTS5): cargar las tareas del usuario y filtrar con `in`.
+
+Ejecución (desde la raíz del proyecto):
+    python -m benchmarks.busqueda_fts --tareas 100000 --consulta "tarea 00012"
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.datos import preparar_bd
+from src.modelo.repositorio_tareas import RepositorioTareasSQLite
+
+
+def _ms(funcion, repeticiones: int) -> float:
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion()
+    return (time.perf_counter() - inicio) / repeticiones * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tareas", type=int, default=100_000)
+    parser.add_argument("--consulta", default="tarea 00012")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{Path(tmp) / 'busqueda.sqlite'}"
+        engine, factory, id_usuario = preparar_bd(url, args.tareas)
+        fts = RepositorioTareasSQLite(session_factory=factory)
+        subcadena = RepositorioTareasSQLite(session_factory=factory, usar_fts=False)
+
+        print(f"{'variante':<12}{'ms/búsqueda':>14}{'resultados':>12}")
+        for nombre, repo in (("fts5", fts), ("subcadena", subcadena)):
+            resultados = len(repo.buscar_tareas(id_usuario, args.consulta))
+            ms = _ms(
+                lambda: repo.buscar_tareas(id_usuario, args.consulta),
+                args.repeticiones,
+            )
+            print(f"{nombre:<12}{ms:>14.2f}{resultados:>12}")
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark del refresco del dashboard con y sin RepositorioTareasCache.
+
+Cada ciclo hace lo que `_refrescar_dashboard`: `contar_tareas` más
+`listar_tareas_lectura`; cada `--escribir-cada` ciclos se marca una tarea
+(lo que invalida al usuario en el caché). Reporta ciclos por segundo y la
+tasa de aciertos del caché.
+
+Ejecución (desde la raíz del proyecto):
+    python -m benchmarks.cache_repositorio --tareas 2000 --ciclos 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.datos import preparar_bd
+from src.modelo.repositorio_cache import RepositorioTareasCache
+from src.modelo.repositorio_tareas import RepositorioTareasSQLite
+
+
+def medir(repo, id_usuario: int, ciclos: int, escribir_cada: int) -> float:
+    ids = [f.id_tarea for f in repo.listar_tareas_lectura(id_usuario)[:50]]
+    inicio = time.perf_counter()
+    for i in range(ciclos):
+        if escribir_cada and i % escribir_cada == 0:
+            repo.marcar_completada(id_usuario, ids[i % len(ids)], i % 2 == 0)
+        repo.contar_tareas(id_usuario)
+        repo.listar_tareas_lectura(id_usuario)
+    return ciclos / (time.perf_counter() - inicio)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tareas", type=int, default=2000)
+    parser.add_argument("--ciclos", type=int, default=500)
+    parser.add_argument("--escribir-cada", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{Path(tmp) / 'cache.sqlite'}"
+        engine, factory, id_usuario = preparar_bd(url, args.tareas)
+
+        directo = RepositorioTareasSQLite(session_factory=factory)
+        cacheado = RepositorioTareasCache(directo)
+        print(
+            f"{'variante':<12}{'ciclos/s':>12}  "
+            f"(tareas={args.tareas}, escribir cada {args.escribir_cada})"
+        )
+        for nombre, repo in (("directo", directo), ("cache", cacheado)):
+            ciclos_s = medir(repo, id_usuario, args.ciclos, args.escribir_cada)
+            print(f"{nombre:<12}{ciclos_s:>12.1f}")
+
+        stats = cacheado.estadisticas()
+        print(
+            f"cache: {stats.aciertos} aciertos / {stats.fallos} fallos "
+            f"({stats.tasa_aciertos:.1%}), {stats.desalojos} desalojos"
+        )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark de refresco incremental: listado completo frente a cambios_desde.
+
+Para cada tamaño toma la revisión actual, edita/marca/elimina `--cambios`
+tareas y mide el refresco del dashboard de dos formas: volviendo a leer todo
+con `listar_tareas_lectura` o pidiendo solo el delta con `cambios_desde`.
+El costo del delta debe depender de `--cambios`, no del tamaño de la tabla.
+
+Ejecución (desde la raíz del proyecto):
+    python -m benchmarks.cambios_incrementales --tamanos 10000 100000 --cambios 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.datos import preparar_bd
+from src.modelo.repositorio_tareas import RepositorioTareasSQLite
+
+
+def _ms_por_llamada(funcion, repeticiones: int) -> float:
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion()
+    return (time.perf_counter() - inicio) * 1000 / repeticiones
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--cambios", type=int, default=10)
+    parser.add_argument("--repeticiones", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'tareas':>9}  {'variante':<14}{'filas':>8}{'ms/refresco':>14}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for tareas in args.tamanos:
+            url = f"sqlite:///{Path(tmp) / f'cambios_{tareas}.sqlite'}"
+            engine, factory, id_usuario = preparar_bd(url, tareas)
+            repo = RepositorioTareasSQLite(session_factory=factory)
+
+            revision = repo.cambios_desde(id_usuario).revision
+            ids = [t.id_tarea for t in repo.iter_tareas(id_usuario)][: args.cambios]
+            for i, id_tarea in enumerate(ids):
+                if i % 3 == 0:
+                    repo.editar_tarea(id_usuario, id_tarea, f"Editada {i}")
+                elif i % 3 == 1:
+                    repo.marcar_completada(id_usuario, id_tarea, True)
+                else:
+                    repo.eliminar_tarea(id_usuario, id_tarea)
+
+            delta = repo.cambios_desde(id_usuario, revision)
+            variantes = {
+                "completo": (
+                    lambda: repo.listar_tareas_lectura(id_usuario),
+                    tareas - len(delta.eliminadas),
+                ),
+                "cambios_desde": (
+                    lambda: repo.cambios_desde(id_usuario, revision),
+                    len(delta.tareas) + len(delta.eliminadas),
+                ),
+            }
+            for nombre, (refresco, filas) in variantes.items():
+                ms = _ms_por_llamada(refresco, args.repeticiones)
+                print(f"{tareas:>9}  {nombre:<14}{filas:>8}{ms:>14.3f}")
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
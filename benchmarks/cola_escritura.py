@@ -0,0 +1,81 @@
+"""
+Benchmark de escrituras en ráfaga: una transacción por llamada frente a
+ColaEscrituraTareas (write-behind).
+
+Crea `--tareas` tareas y luego marca cada una dos veces (clics repetidos),
+primero con el repositorio directo y después a través de la cola, sobre el
+perfil indicado ("safe" = synchronous=FULL, un fsync por commit).
+
+Ejecución (desde la raíz del proyecto):
+    python -m benchmarks.cola_escritura --tareas 500 --perfil safe
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.datos import preparar_bd
+from src.modelo.cola_escritura import ColaEscrituraTareas
+from src.modelo.repositorio_tareas import RepositorioTareasSQLite
+
+
+def directo(repo: RepositorioTareasSQLite, id_usuario: int, tareas: int) -> float:
+    inicio = time.perf_counter()
+    ids = [
+        repo.crear_tarea(id_usuario, f"Directa {i}", "")[0].id_tarea
+        for i in range(tareas)
+    ]
+    for id_tarea in ids:
+        repo.marcar_completada(id_usuario, id_tarea, True)
+        repo.marcar_completada(id_usuario, id_tarea, False)
+    return time.perf_counter() - inicio
+
+
+def con_cola(
+    repo: RepositorioTareasSQLite,
+    id_usuario: int,
+    tareas: int,
+    max_operaciones: int,
+) -> tuple[float, int]:
+    inicio = time.perf_counter()
+    with ColaEscrituraTareas(repo, max_operaciones=max_operaciones) as cola:
+        creadas = [cola.crear_tarea(id_usuario, f"Cola {i}", "") for i in range(tareas)]
+        ids = [futuro.result()[0].id_tarea for futuro in creadas]
+        marcas = []
+        for id_tarea in ids:
+            marcas.append(cola.marcar_completada(id_usuario, id_tarea, True))
+            marcas.append(cola.marcar_completada(id_usuario, id_tarea, False))
+    segundos = time.perf_counter() - inicio
+    return segundos, sum(1 for futuro in marcas if futuro.result().ok)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tareas", type=int, default=500)
+    parser.add_argument("--perfil", default="safe")
+    parser.add_argument("--max-operaciones", type=int, default=100)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{Path(tmp) / 'cola.sqlite'}"
+        engine, factory, id_usuario = preparar_bd(url, 0, perfil=args.perfil)
+        repo = RepositorioTareasSQLite(session_factory=factory)
+
+        s_directo = directo(repo, id_usuario, args.tareas)
+        s_cola, marcas_ok = con_cola(
+            repo, id_usuario, args.tareas, args.max_operaciones
+        )
+        engine.dispose()
+
+    escrituras = args.tareas * 3
+    print(f"{'variante':<10}{'s':>8}{'escrituras/s':>14}  (perfil={args.perfil})")
+    print(f"{'directo':<10}{s_directo:>8.2f}{escrituras / s_directo:>14.1f}")
+    print(f"{'cola':<10}{s_cola:>8.2f}{escrituras / s_cola:>14.1f}")
+    print(f"marcas coalescidas: {marcas_ok} futuros resueltos con éxito")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark de creación de tareas: una transacción por tarea frente al lote.
+
+"individual" llama a `crear_tarea` N veces (una transacción y un fsync por
+tarea); "lote" usa `crear_tareas_lote`, que inserta por bloques con
+executemany dentro de una sola transacción.
+
+Ejecución (desde la raíz del proyecto):
+    python -m benchmarks.creacion_lote --tareas 2000 --perfil safe
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.datos import preparar_bd
+from src.modelo.repositorio_tareas import RepositorioTareasSQLite
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tareas", type=int, default=2000)
+    parser.add_argument("--perfil", default="safe")
+    args = parser.parse_args()
+
+    items = [(f"Importada {i}", "benchmark") for i in range(args.tareas)]
+    print(f"{'variante':<12}{'segundos':>10}{'tareas/s':>12}  (perfil={args.perfil})")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for variante in ("individual", "lote"):
+            url = f"sqlite:///{Path(tmp) / f'{variante}.sqlite'}"
+            engine, factory, id_usuario = preparar_bd(url, 0, perfil=args.perfil)
+            repo = RepositorioTareasSQLite(session_factory=factory)
+
+            inicio = time.perf_counter()
+            if variante == "individual":
+                creadas = sum(
+                    repo.crear_tarea(id_usuario, titulo, desc)[0] is not None
+                    for titulo, desc in items
+                )
+            else:
+                creadas = repo.crear_tareas_lote(id_usuario, items).creadas
+            segundos = time.perf_counter() - inicio
+
+            assert creadas == args.tareas
+            print(f"{variante:<12}{segundos:>10.2f}{creadas / segundos:>12.0f}")
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Utilidades compartidas por los benchmarks: BD temporal poblada con tareas."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.modelo.bd_model import Tarea, Usuario
+from src.modelo.conexion import _create_engine, init_db
+
+LOTE_INSERCION = 5_000
+
+
+def preparar_bd(
+    url: str,
+    tareas: int,
+    *,
+    perfil: str = "fast",
+) -> tuple[Engine, sessionmaker, int]:
+    """
+    Crea el esquema en `url` y un usuario con `tareas` tareas.
+
+    Las tareas alternan pendiente/completada, tienen títulos en orden no
+    alfabético y una `creada_en` distinta cada una. Devuelve
+    (engine, session_factory, id_usuario).
+    """
+    engine = _create_engine(url, perfil=perfil)
+    init_db(engine=engine)
+    factory = sessionmaker(
+        bind=engine,
+        autoflush=False,
+        autocommit=False,
+        future=True,
+        class_=Session,
+    )
+
+    with factory.begin() as session:
+        usuario = Usuario(username="bench", password_hash="x")
+        session.add(usuario)
+        session.flush()
+        id_usuario = usuario.id_usuario
+
+    base = datetime(2024, 1, 1)
+    with engine.begin() as conn:
+        for inicio in range(0, tareas, LOTE_INSERCION):
+            filas = [
+                {
+                    "id_usuario": id_usuario,
+                    "titulo": f"Tarea {(i * 7919) % tareas:07d} {'ab'[i % 2]}",
+                    "descripcion": "benchmark",
+                    "completada": i % 2 == 0,
+                    "creada_en": base + timedelta(seconds=i),
+                    "actualizada_en": base + timedelta(seconds=i),
+                }
+                for i in range(inicio, min(tareas, inicio + LOTE_INSERCION))
+            ]
+            conn.execute(insert(Tarea), filas)
+        conn.exec_driver_sql("ANALYZE")
+
+    return engine, factory, id_usuario
@@ -0,0 +1,86 @@
+"""
+Benchmark de listados: entidades ORM frente a filas TareaLectura.
+
+Para cada tamaño mide la latencia y la memoria retenida (tracemalloc) por
+`listar_tareas_ordenadas` (entidades Tarea hidratadas) y por
+`listar_tareas_lectura` (NamedTuple sin estado ORM), más la conversión a
+dicts que hace el controlador.
+
+Ejecución (desde la raíz del proyecto):
+    python -m benchmarks.dto_lectura --tamanos 10000 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from benchmarks.datos import preparar_bd
+from src.modelo.repositorio_tareas import RepositorioTareasSQLite
+
+
+def _medir(funcion) -> tuple[float, float, float]:
+    """(ms, MB retenidos por el resultado, MB pico) de una llamada."""
+    gc.collect()
+    inicio = time.perf_counter()
+    funcion()
+    ms = (time.perf_counter() - inicio) * 1000
+
+    gc.collect()
+    tracemalloc.start()
+    resultado = funcion()
+    actual, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del resultado
+    return ms, actual / 1024 / 1024, pico / 1024 / 1024
+
+
+def _a_dict(tarea) -> dict:
+    # Misma forma que ControladorTareasVista._tarea_a_dict
+    return {
+        "id_tarea": tarea.id_tarea,
+        "titulo": tarea.titulo,
+        "descripcion": tarea.descripcion or "",
+        "completada": bool(tarea.completada),
+        "creada_en": tarea.creada_en,
+        "actualizada_en": tarea.actualizada_en,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    print(
+        f"{'tareas':>8}  {'variante':<14}{'ms':>10}{'ms + dicts':>12}"
+        f"{'MB retenidos':>14}{'MB pico':>10}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for tareas in args.tamanos:
+            url = f"sqlite:///{Path(tmp) / f'dto_{tareas}.sqlite'}"
+            engine, factory, id_usuario = preparar_bd(url, tareas)
+            repo = RepositorioTareasSQLite(session_factory=factory)
+
+            variantes = {
+                "orm": lambda: repo.listar_tareas_ordenadas(id_usuario),
+                "tarea_lectura": lambda: repo.listar_tareas_lectura(id_usuario),
+            }
+            for nombre, funcion in variantes.items():
+                ms, retenidos, pico = _medir(funcion)
+                inicio = time.perf_counter()
+                [_a_dict(t) for t in funcion()]
+                ms_dicts = (time.perf_counter() - inicio) * 1000
+                print(
+                    f"{tareas:>8}  {nombre:<14}{ms:>10.1f}{ms_dicts:>12.1f}"
+                    f"{retenidos:>14.1f}{pico:>10.1f}"
+                )
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark de recorridos completos: listado materializado frente a iter_tareas.
+
+Para cada tamaño recorre todas las tareas del usuario contando filas y mide
+tiempo y memoria pico (tracemalloc) con `listar_tareas_lectura` (lista
+completa) y con `iter_tareas` (lotes de `--lote` filas). El pico del
+recorrido en streaming debe mantenerse plano al crecer la tabla.
+
+Ejecución (desde la raíz del proyecto):
+    python -m benchmarks.iteracion_streaming --tamanos 100000 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from benchmarks.datos import preparar_bd
+from src.modelo.repositorio_tareas import (
+    TAMANO_LOTE_ITERACION,
+    RepositorioTareasSQLite,
+)
+
+
+def _medir(recorrido) -> tuple[int, float, float]:
+    """(filas, ms, MB pico) de un recorrido completo."""
+    gc.collect()
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    filas = sum(1 for _ in recorrido())
+    ms = (time.perf_counter() - inicio) * 1000
+    _actual, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return filas, ms, pico / 1024 / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--lote", type=int, default=TAMANO_LOTE_ITERACION)
+    args = parser.parse_args()
+
+    print(f"{'tareas':>9}  {'variante':<12}{'filas':>10}{'ms':>10}{'MB pico':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for tareas in args.tamanos:
+            url = f"sqlite:///{Path(tmp) / f'iter_{tareas}.sqlite'}"
+            engine, factory, id_usuario = preparar_bd(url, tareas)
+            repo = RepositorioTareasSQLite(session_factory=factory)
+
+            variantes = {
+                "lista": lambda: repo.listar_tareas_lectura(id_usuario),
+                "iter_tareas": lambda: repo.iter_tareas(id_usuario, args.lote),
+            }
+            for nombre, recorrido in variantes.items():
+                filas, ms, pico = _medir(recorrido)
+                print(f"{tareas:>9}  {nombre:<12}{filas:>10}{ms:>10.1f}{pico:>10.1f}")
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
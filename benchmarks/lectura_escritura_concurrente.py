@@ -0,0 +1,158 @@
+"""
+Benchmark multi-hilo: engine compartido vs escritor único + lectores mode=ro.
+
+N hilos lectores llaman a listar_tareas/obtener_tarea mientras un hilo
+escritor crea tareas durante `--segundos`. Se cuentan operaciones y errores
+"database is locked" en cada configuración.
+
+Ejecución (desde la raíz del proyecto):
+    python -m benchmarks.lectura_escritura_concurrente --lectores 8 --segundos 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.modelo.bd_model import Usuario
+from src.modelo.conexion import _create_engine, init_db, url_solo_lectura
+from src.modelo.repositorio_tareas import RepositorioTareasSQLite
+
+
+def _factory(engine) -> sessionmaker:
+    return sessionmaker(
+        bind=engine,
+        autoflush=False,
+        autocommit=False,
+        future=True,
+        class_=Session,
+    )
+
+
+def _preparar(url: str, perfil: str, tareas_iniciales: int) -> tuple[int, list[int]]:
+    engine = _create_engine(url, perfil=perfil)
+    init_db(engine=engine)
+    factory = _factory(engine)
+    with factory.begin() as session:
+        usuario = Usuario(username="bench", password_hash="x")
+        session.add(usuario)
+        session.flush()
+        id_usuario = usuario.id_usuario
+
+    repo = RepositorioTareasSQLite(session_factory=factory)
+    ids = [
+        repo.crear_tarea(id_usuario, f"Inicial {i}", "benchmark")[0].id_tarea
+        for i in range(tareas_iniciales)
+    ]
+    engine.dispose()
+    return id_usuario, ids
+
+
+def medir(
+    nombre: str,
+    repo: RepositorioTareasSQLite,
+    id_usuario: int,
+    ids: list[int],
+    lectores: int,
+    segundos: float,
+) -> dict:
+    fin = time.perf_counter() + segundos
+    contadores = {"lecturas": 0, "escrituras": 0, "bloqueos": 0}
+    lock = threading.Lock()
+
+    def _sumar(clave: str) -> None:
+        with lock:
+            contadores[clave] += 1
+
+    def _lector(n: int) -> None:
+        i = n
+        while time.perf_counter() < fin:
+            try:
+                if i % 4 == 0:
+                    repo.listar_tareas(id_usuario)
+                else:
+                    repo.obtener_tarea(id_usuario, ids[i % len(ids)])
+                _sumar("lecturas")
+            except OperationalError:
+                _sumar("bloqueos")
+            i += 1
+
+    def _escritor() -> None:
+        i = 0
+        while time.perf_counter() < fin:
+            try:
+                repo.crear_tarea(id_usuario, f"{nombre} {i}", "")
+                _sumar("escrituras")
+            except OperationalError:
+                _sumar("bloqueos")
+            i += 1
+
+    hilos = [threading.Thread(target=_lector, args=(n,)) for n in range(lectores)]
+    hilos.append(threading.Thread(target=_escritor))
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+
+    return {"config": nombre, **contadores}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lectores", type=int, default=8)
+    parser.add_argument("--segundos", type=float, default=3.0)
+    parser.add_argument("--perfil", default="fast")
+    parser.add_argument("--tareas", type=int, default=1000)
+    args = parser.parse_args()
+
+    resultados = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for config in ("compartido", "escritor+lectores"):
+            url = f"sqlite:///{Path(tmp) / f'{config}.sqlite'}"
+            id_usuario, ids = _preparar(url, args.perfil, args.tareas)
+
+            if config == "compartido":
+                engines = [_create_engine(url, perfil=args.perfil)]
+                repo = RepositorioTareasSQLite(session_factory=_factory(engines[0]))
+            else:
+                engines = [
+                    _create_engine(url, perfil=args.perfil, tamano_pool=1),
+                    _create_engine(
+                        url_solo_lectura(url),
+                        perfil=args.perfil,
+                        tamano_pool=args.lectores,
+                        solo_lectura=True,
+                    ),
+                ]
+                repo = RepositorioTareasSQLite(
+                    session_factory=_factory(engines[0]),
+                    session_factory_lectura=_factory(engines[1]),
+                )
+
+            resultados.append(
+                medir(config, repo, id_usuario, ids, args.lectores, args.segundos)
+            )
+            for engine in engines:
+                engine.dispose()
+
+    print(
+        f"{'config':<20}{'lecturas/s':>12}{'escrituras/s':>14}{'bloqueos':>10}"
+        f"  (perfil={args.perfil}, lectores={args.lectores})"
+    )
+    for r in resultados:
+        print(
+            f"{r['config']:<20}"
+            f"{r['lecturas'] / args.segundos:>12.1f}"
+            f"{r['escrituras'] / args.segundos:>14.1f}"
+            f"{r['bloqueos']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark HU10: orden por nombre en Python frente a SQL con COLLATE NOCASE.
+
+"python" reproduce el comportamiento anterior (cargar todas las tareas y
+ordenar con claves `.lower()`); "sql" usa `listar_tareas_ordenadas`, que
+recorre ix_tareas_usuario_titulo_nocase. También se mide la primera página
+paginada por nombre y la variante combinada con el filtro de pendientes.
+
+Ejecución (desde la raíz del proyecto):
+    python -m benchmarks.orden_nombre --tareas 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.datos import preparar_bd
+from src.modelo.repositorio_tareas import ORDEN_NOMBRE, RepositorioTareasSQLite
+
+
+def _ms(funcion, repeticiones: int) -> float:
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion()
+    return (time.perf_counter() - inicio) / repeticiones * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tareas", type=int, default=100_000)
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--limite", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{Path(tmp) / 'orden.sqlite'}"
+        engine, factory, id_usuario = preparar_bd(url, args.tareas)
+        repo = RepositorioTareasSQLite(session_factory=factory)
+
+        def _python():
+            tareas = repo.listar_tareas(id_usuario)
+            return sorted(tareas, key=lambda t: (t.titulo or "").lower())
+
+        def _python_pendientes():
+            return [t for t in _python() if not t.completada]
+
+        casos = {
+            "python (todo)": _python,
+            "sql (todo)": lambda: repo.listar_tareas_ordenadas(
+                id_usuario, ORDEN_NOMBRE
+            ),
+            "python pendientes": _python_pendientes,
+            "sql pendientes": lambda: repo.listar_tareas_ordenadas(
+                id_usuario, ORDEN_NOMBRE, completada=False
+            ),
+            "sql página 1": lambda: repo.listar_tareas_pagina(
+                id_usuario, args.limite, orden=ORDEN_NOMBRE
+            ),
+        }
+
+        # Mismo resultado (salvo títulos que solo difieren fuera de ASCII).
+        esperado = [t.id_tarea for t in _python()]
+        obtenido = [t.id_tarea for t in casos["sql (todo)"]()]
+        assert esperado == obtenido, "el orden SQL no coincide con el de Python"
+
+        print(f"{'caso':<22}{'ms/llamada':>12}  (tareas={args.tareas})")
+        for nombre, funcion in casos.items():
+            print(f"{nombre:<22}{_ms(funcion, args.repeticiones):>12.2f}")
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark de paginación por keyset frente al listado completo.
+
+Para usuarios con distinta cantidad de tareas mide la latencia de
+`listar_tareas` (carga todo) y de `listar_tareas_pagina` en la primera
+página y en una página a mitad del listado. La latencia por página debe
+mantenerse plana aunque crezca el número de tareas.
+
+Ejecución (desde la raíz del proyecto):
+    python -m benchmarks.paginacion_keyset --tamanos 1000 10000 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.datos import preparar_bd
+from src.modelo.repositorio_tareas import RepositorioTareasSQLite
+
+
+def _ms_por_llamada(funcion, repeticiones: int) -> float:
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion()
+    return (time.perf_counter() - inicio) / repeticiones * 1000
+
+
+def medir(directorio: Path, tareas: int, limite: int, repeticiones: int) -> dict:
+    url = f"sqlite:///{directorio / f'pag_{tareas}.sqlite'}"
+    engine, factory, id_usuario = preparar_bd(url, tareas)
+    repo = RepositorioTareasSQLite(session_factory=factory)
+
+    # Cursor a mitad del listado: se avanza página a página una sola vez.
+    cursor = None
+    for _ in range(max(0, tareas // 2 // limite)):
+        cursor = repo.listar_tareas_pagina(id_usuario, limite, cursor).siguiente_cursor
+
+    resultado = {
+        "tareas": tareas,
+        "completo_ms": _ms_por_llamada(
+            lambda: repo.listar_tareas(id_usuario), max(1, repeticiones // 20)
+        ),
+        "primera_ms": _ms_por_llamada(
+            lambda: repo.listar_tareas_pagina(id_usuario, limite), repeticiones
+        ),
+        "mitad_ms": _ms_por_llamada(
+            lambda: repo.listar_tareas_pagina(id_usuario, limite, cursor),
+            repeticiones,
+        ),
+    }
+    engine.dispose()
+    return resultado
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--limite", type=int, default=50)
+    parser.add_argument("--repeticiones", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        resultados = [
+            medir(Path(tmp), n, args.limite, args.repeticiones) for n in args.tamanos
+        ]
+
+    print(
+        f"{'tareas':>10}{'completo ms':>14}{'pág. 1 ms':>12}{'pág. mitad ms':>16}"
+        f"  (limite={args.limite})"
+    )
+    for r in resultados:
+        print(
+            f"{r['tareas']:>10}"
+            f"{r['completo_ms']:>14.2f}"
+            f"{r['primera_ms']:>12.3f}"
+            f"{r['mitad_ms']:>16.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
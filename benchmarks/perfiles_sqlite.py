@@ -0,0 +1,99 @@
+"""
+Benchmark de perfiles SQLite ("safe" vs "fast") sobre RepositorioTareasSQLite.
+
+Mide escrituras (crear_tarea, una transacción por tarea) y lecturas
+(listar_tareas / obtener_tarea) contra una base temporal por perfil.
+
+Ejecución (desde la raíz del proyecto):
+    python -m benchmarks.perfiles_sqlite --tareas 500 --lecturas 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.modelo.bd_model import Usuario
+from src.modelo.conexion import PERFILES, Base, _create_engine
+from src.modelo.repositorio_tareas import RepositorioTareasSQLite
+
+
+def _ops_por_segundo(operaciones: int, segundos: float) -> float:
+    return operaciones / segundos if segundos > 0 else float("inf")
+
+
+def medir_perfil(nombre: str, directorio: Path, tareas: int, lecturas: int) -> dict:
+    """Ejecuta el benchmark para un perfil y devuelve sus métricas."""
+    ruta = directorio / f"bench_{nombre}.sqlite"
+    engine = _create_engine(f"sqlite:///{ruta}", perfil=nombre)
+    Base.metadata.create_all(bind=engine)
+
+    session_factory = sessionmaker(
+        bind=engine,
+        autoflush=False,
+        autocommit=False,
+        future=True,
+        class_=Session,
+    )
+    with session_factory.begin() as session:
+        usuario = Usuario(username=f"bench_{nombre}", password_hash="x")
+        session.add(usuario)
+        session.flush()
+        id_usuario = usuario.id_usuario
+
+    repo = RepositorioTareasSQLite(session_factory=session_factory)
+
+    inicio = time.perf_counter()
+    ids = []
+    for i in range(tareas):
+        tarea, _msg = repo.crear_tarea(id_usuario, f"Tarea {i}", "benchmark")
+        ids.append(tarea.id_tarea)
+    t_escritura = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    for i in range(lecturas):
+        repo.obtener_tarea(id_usuario, ids[i % len(ids)])
+    t_obtener = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    for _ in range(max(1, lecturas // 10)):
+        repo.listar_tareas(id_usuario)
+    t_listar = time.perf_counter() - inicio
+
+    engine.dispose()
+    return {
+        "perfil": nombre,
+        "escrituras_s": _ops_por_segundo(tareas, t_escritura),
+        "obtener_s": _ops_por_segundo(lecturas, t_obtener),
+        "listar_s": _ops_por_segundo(max(1, lecturas // 10), t_listar),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tareas", type=int, default=500)
+    parser.add_argument("--lecturas", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        resultados = [
+            medir_perfil(nombre, Path(tmp), args.tareas, args.lecturas)
+            for nombre in PERFILES
+        ]
+
+    print(f"{'perfil':<8}{'crear/s':>12}{'obtener/s':>12}{'listar/s':>12}")
+    for r in resultados:
+        print(
+            f"{r['perfil']:<8}"
+            f"{r['escrituras_s']:>12.1f}"
+            f"{r['obtener_s']:>12.1f}"
+            f"{r['listar_s']:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark de TaskManager sobre SQLite frente a RepositorioTareasMemoria.
+
+Misma carga en ambos repositorios: crear `--tareas` tareas una a una, marcar
+la mitad y refrescar el dashboard (`contar_tareas` + `listar_tareas_lectura`
+por fecha y por nombre) `--refrescos` veces. La diferencia entre columnas es
+el costo de E/S de SQLite; lo que queda en memoria es costo de Python.
+
+Ejecución (desde la raíz del proyecto):
+    python -m benchmarks.repositorio_memoria --tareas 2000 --refrescos 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.datos import preparar_bd
+from src.logica.task_manager import TaskManager
+from src.modelo.repositorio_memoria import RepositorioTareasMemoria
+from src.modelo.repositorio_tareas import RepositorioTareasSQLite
+
+
+def medir(manager: TaskManager, id_usuario: int, tareas: int, refrescos: int) -> dict:
+    tiempos: dict[str, float] = {}
+
+    inicio = time.perf_counter()
+    ids = [
+        manager.crear_tarea(id_usuario, f"Tarea {i:06d}", "benchmark").id_tarea
+        for i in range(tareas)
+    ]
+    tiempos["crear"] = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    for id_tarea in ids[::2]:
+        manager.marcar_completada(id_usuario, id_tarea, True)
+    tiempos["marcar"] = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    for i in range(refrescos):
+        manager.contar_tareas(id_usuario)
+        manager.listar_tareas_lectura(id_usuario, ("fecha", "nombre")[i % 2])
+    tiempos["refrescar"] = time.perf_counter() - inicio
+    return tiempos
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tareas", type=int, default=2000)
+    parser.add_argument("--refrescos", type=int, default=100)
+    args = parser.parse_args()
+
+    resultados = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{Path(tmp) / 'memoria.sqlite'}"
+        engine, factory, id_usuario = preparar_bd(url, 0)
+        repo = RepositorioTareasSQLite(session_factory=factory)
+        resultados["sqlite"] = medir(
+            TaskManager(repositorio=repo), id_usuario, args.tareas, args.refrescos
+        )
+        engine.dispose()
+
+    memoria = RepositorioTareasMemoria()
+    id_usuario = memoria.agregar_usuario()
+    resultados["memoria"] = medir(
+        TaskManager(repositorio=memoria), id_usuario, args.tareas, args.refrescos
+    )
+
+    print(
+        f"{'operación':<12}{'sqlite ms':>12}{'memoria ms':>12}"
+        f"  (tareas={args.tareas})"
+    )
+    for operacion in resultados["sqlite"]:
+        print(
+            f"{operacion:<12}"
+            f"{resultados['sqlite'][operacion] * 1000:>12.1f}"
+            f"{resultados['memoria'][operacion] * 1000:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
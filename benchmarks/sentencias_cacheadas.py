@@ -0,0 +1,114 @@
+"""
+Benchmark de sentencias precompiladas en las rutas calientes del repositorio.
+
+Compara el costo por llamada de reconstruir `select(Tarea)` en cada
+invocación frente a sentencias constantes con `bindparam` (STMT_LISTAR_TAREAS
+y una lectura por id equivalente) y reporta la tasa de aciertos del compiled
+cache de SQLAlchemy en cada caso. `obtener_tarea` ya no usa SQL en la ruta
+caliente (session.get + caché LRU); el caso "obtener" queda como referencia.
+
+Ejecución (desde la raíz del proyecto):
+    python -m benchmarks.sentencias_cacheadas --llamadas 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.modelo.bd_model import Tarea, Usuario
+from src.modelo.conexion import URL_MEMORIA, _create_engine, init_db
+from src.modelo.instrumentacion import InstrumentadorSQL
+from src.modelo.repositorio_tareas import STMT_LISTAR_TAREAS
+
+STMT_OBTENER = select(Tarea).where(
+    Tarea.id_usuario == bindparam("id_usuario"),
+    Tarea.id_tarea == bindparam("id_tarea"),
+)
+
+
+def _listar_reconstruido(session: Session, id_usuario: int, _id_tarea: int):
+    stmt = (
+        select(Tarea)
+        .where(Tarea.id_usuario == id_usuario)
+        .order_by(Tarea.creada_en.desc())
+    )
+    return session.execute(stmt).scalars().all()
+
+
+def _obtener_reconstruido(session: Session, id_usuario: int, id_tarea: int):
+    stmt = select(Tarea).where(
+        Tarea.id_usuario == id_usuario,
+        Tarea.id_tarea == id_tarea,
+    )
+    return session.execute(stmt).scalar_one_or_none()
+
+
+def _listar_constante(session: Session, id_usuario: int, _id_tarea: int):
+    params = {"id_usuario": id_usuario}
+    return session.execute(STMT_LISTAR_TAREAS, params).scalars().all()
+
+
+def _obtener_constante(session: Session, id_usuario: int, id_tarea: int):
+    params = {"id_usuario": id_usuario, "id_tarea": id_tarea}
+    return session.execute(STMT_OBTENER, params).scalar_one_or_none()
+
+
+CASOS = (
+    ("listar/reconstruido", _listar_reconstruido),
+    ("listar/constante", _listar_constante),
+    ("obtener/reconstruido", _obtener_reconstruido),
+    ("obtener/constante", _obtener_constante),
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--llamadas", type=int, default=20_000)
+    parser.add_argument("--tareas", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = _create_engine(URL_MEMORIA)
+    init_db(engine=engine)
+    factory = sessionmaker(bind=engine, autoflush=False, future=True, class_=Session)
+    with factory.begin() as session:
+        usuario = Usuario(username="bench", password_hash="x")
+        session.add(usuario)
+        session.flush()
+        id_usuario = usuario.id_usuario
+        tareas = [
+            Tarea(id_usuario=id_usuario, titulo=f"T{i}", descripcion="")
+            for i in range(args.tareas)
+        ]
+        session.add_all(tareas)
+        session.flush()
+        id_tarea = tareas[0].id_tarea
+
+    instr = InstrumentadorSQL(umbral_lento_ms=float("inf"))
+    instr.adjuntar(engine)
+
+    print(f"{'caso':<24}{'µs/llamada':>12}{'aciertos cache':>16}")
+    with factory() as session:
+        for nombre, funcion in CASOS:
+            funcion(session, id_usuario, id_tarea)  # calentamiento
+            instr.reiniciar()
+            inicio = time.perf_counter()
+            for _ in range(args.llamadas):
+                funcion(session, id_usuario, id_tarea)
+            segundos = time.perf_counter() - inicio
+            snap = instr.snapshot()
+            print(
+                f"{nombre:<24}"
+                f"{segundos / args.llamadas * 1e6:>12.1f}"
+                f"{snap.tasa_aciertos_cache:>16.1%}"
+            )
+
+    instr.desadjuntar()
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,7 @@ from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 
+from src.modelo.conexion import init_db
 from src.vista.ventana_principal import VentanaPrincipal
 
 
@@ -41,6 +42,9 @@ def main():
     # Cargar estilos QSS
     cargar_estilos(app)
 
+    # Crear/migrar el esquema de DB.sqlite antes de abrir la ventana
+    init_db()
+
     # Crear y mostrar la ventana principal
     ventana = VentanaPrincipal()
     ventana.showMaximized()
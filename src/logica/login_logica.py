@@ -1,5 +1,7 @@
 import hashlib
 
+from sqlalchemy.orm import sessionmaker
+
 from src.modelo.conexion import SessionLocal
 from src.modelo.bd_model import Usuario
 
@@ -7,6 +9,9 @@ from src.modelo.bd_model import Usuario
 class LoginLogica:
     """Lógica de autenticación (HU001 Login)."""
 
+    def __init__(self, session_factory: sessionmaker | None = None) -> None:
+        self._session_factory = session_factory or SessionLocal
+
     @staticmethod
     def generar_hash(password: str) -> str:
         """Genera hash SHA256 de la contraseña."""
@@ -14,7 +19,7 @@ class LoginLogica:
 
     def login(self, username: str, password: str) -> bool:
         """Valida usuario y contraseña contra la base de datos."""
-        session = SessionLocal()
+        session = self._session_factory()
 
         try:
             usuario = session.query(Usuario).filter_by(username=username).first()
@@ -30,7 +35,7 @@ class LoginLogica:
 
     def obtener_id_usuario(self, username: str) -> int | None:
         """Devuelve id_usuario del username, o None si no existe."""
-        session = SessionLocal()
+        session = self._session_factory()
         try:
             usuario = session.query(Usuario).filter_by(username=username).first()
             if usuario is None:
@@ -1,9 +1,24 @@
 # src/logica/task_manager.py
 from __future__ import annotations
 
-from datetime import datetime
-
-from src.modelo.repositorio_tareas import RepositorioTareasSQLite
+from typing import Iterable, Iterator
+
+from src.modelo.repositorio_tareas import (
+    LIMITE_BUSQUEDA_POR_DEFECTO,
+    LIMITE_PAGINA_POR_DEFECTO,
+    ORDEN_FECHA,
+    ORDENES,
+    TAMANO_LOTE_IDS,
+    TAMANO_LOTE_INSERCION,
+    TAMANO_LOTE_ITERACION,
+    CambiosTareas,
+    EstadisticasTareas,
+    ItemLote,
+    PaginaTareas,
+    RepositorioTareasSQLite,
+    ResultadoLote,
+    TareaLectura,
+)
 
 
 class TaskManager:
@@ -21,9 +36,60 @@ class TaskManager:
         # Duplicado -> None
         return tarea
 
+    def crear_tareas_lote(
+        self,
+        id_usuario: int,
+        items: Iterable[ItemLote],
+        tamano_lote: int = TAMANO_LOTE_INSERCION,
+    ) -> ResultadoLote:
+        """
+        Importa muchas tareas en una transacción.
+        Cada fila del resultado indica si se creó o por qué no (vacía/duplicada).
+        """
+        return self._repo.crear_tareas_lote(id_usuario, items, tamano_lote)
+
     def listar_tareas(self, id_usuario: int):
         return self._repo.listar_tareas(id_usuario)
 
+    def obtener_tarea(self, id_usuario: int, id_tarea: int):
+        """Una tarea del usuario (None si no existe o es de otro usuario)."""
+        return self._repo.obtener_tarea(id_usuario, id_tarea)
+
+    def buscar_tareas(
+        self,
+        id_usuario: int,
+        consulta: str,
+        limite: int = LIMITE_BUSQUEDA_POR_DEFECTO,
+        completada: bool | None = None,
+    ):
+        """Busca por título/descripción (prefijos de palabra, por relevancia)."""
+        return self._repo.buscar_tareas(id_usuario, consulta, limite, completada)
+
+    def contar_tareas(self, id_usuario: int) -> EstadisticasTareas:
+        """Contadores del dashboard (total, pendientes, completadas)."""
+        return self._repo.contar_tareas(id_usuario)
+
+    def listar_tareas_pagina(
+        self,
+        id_usuario: int,
+        limite: int = LIMITE_PAGINA_POR_DEFECTO,
+        cursor: str | None = None,
+        *,
+        orden: str = ORDEN_FECHA,
+        completada: bool | None = None,
+    ) -> PaginaTareas:
+        """
+        Lista tareas de a `limite` (orden y filtro como listar_tareas_ordenadas).
+        Para la página siguiente se pasa `pagina.siguiente_cursor`.
+        """
+        return self._repo.listar_tareas_pagina(
+            id_usuario,
+            limite,
+            cursor,
+            orden=orden,
+            completada=completada,
+        )
+
     def editar_tarea(
         self,
         id_usuario: int,
@@ -52,37 +118,87 @@ class TaskManager:
         resultado = self._repo.marcar_completada(id_usuario, id_tarea, completada)
         return bool(resultado.ok)
 
+    def marcar_completadas_lote(
+        self,
+        id_usuario: int,
+        ids: Iterable[int],
+        completada: bool = True,
+        tamano_lote: int = TAMANO_LOTE_IDS,
+    ) -> int:
+        """Marca varias tareas; devuelve cuántas se actualizaron."""
+        return self._repo.marcar_completadas_lote(
+            id_usuario, ids, completada, tamano_lote
+        )
+
+    def eliminar_tareas_lote(
+        self,
+        id_usuario: int,
+        ids: Iterable[int],
+        tamano_lote: int = TAMANO_LOTE_IDS,
+    ) -> int:
+        """Elimina varias tareas; devuelve cuántas se eliminaron."""
+        return self._repo.eliminar_tareas_lote(id_usuario, ids, tamano_lote)
+
     def listar_tareas_por_estado(self, id_usuario: int, completada: bool):
         """
         Lista tareas filtrando por estado (pendiente/completada).
         - completada=False -> pendientes
         - completada=True  -> completadas
         """
-        tareas = self.listar_tareas(id_usuario)
-        return [
-            t
-            for t in tareas
-            if bool(getattr(t, "completada", False)) == bool(completada)
-        ]
-
-    def listar_tareas_ordenadas(self, id_usuario: int, orden: str = "fecha"):
+        return self._repo.listar_tareas_por_estado(id_usuario, bool(completada))
+
+    def listar_tareas_ordenadas(
+        self,
+        id_usuario: int,
+        orden: str = ORDEN_FECHA,
+        completada: bool | None = None,
+    ):
         """
-        HU10: Lista tareas del usuario ordenadas.
+        HU10: Lista tareas del usuario ordenadas (en SQL).
         orden:
         - "fecha"  -> más recientes primero
-        - "nombre" -> alfabético por título
+        - "nombre" -> alfabético por título (sin distinguir mayúsculas)
+        completada: None = todas; True/False combina el filtro HU08.
         """
-        tareas = self.listar_tareas(id_usuario)
-        orden = (orden or "fecha").strip().lower()
+        return self._repo.listar_tareas_ordenadas(
+            id_usuario, self._orden_valido(orden), completada
+        )
 
-        if orden == "nombre":
-            return sorted(
-                tareas,
-                key=lambda t: (getattr(t, "titulo", "") or "").lower(),
-            )
+    def listar_tareas_lectura(
+        self,
+        id_usuario: int,
+        orden: str = ORDEN_FECHA,
+        completada: bool | None = None,
+    ) -> list[TareaLectura]:
+        """
+        Igual que listar_tareas_ordenadas, pero devuelve filas TareaLectura
+        (inmutables, sin ORM) para vistas de solo lectura.
+        """
+        return self._repo.listar_tareas_lectura(
+            id_usuario, self._orden_valido(orden), completada
+        )
 
-        def key_fecha(t):
-            v = getattr(t, "creada_en", None)
-            return v if v is not None else datetime.min
+    def iter_tareas(
+        self,
+        id_usuario: int | None = None,
+        tamano_lote: int = TAMANO_LOTE_ITERACION,
+    ) -> Iterator[TareaLectura]:
+        """
+        Recorrido en streaming (exportaciones, procesos completos); cerrar el
+        generador libera la sesión.
+        """
+        return self._repo.iter_tareas(id_usuario, tamano_lote)
+
+    def cambios_desde(self, id_usuario: int, revision: int = 0) -> CambiosTareas:
+        """
+        Refresco incremental: tareas creadas/modificadas y ids eliminados
+        desde `revision` (0 = todo). Guardar `resultado.revision` para la
+        siguiente llamada.
+        """
+        return self._repo.cambios_desde(id_usuario, revision)
 
-        return sorted(tareas, key=key_fecha, reverse=True)
\ No newline at end of file
+    @staticmethod
+    def _orden_valido(orden: str | None) -> str:
+        """HU10: un orden desconocido equivale a "fecha"."""
+        orden = (orden or ORDEN_FECHA).strip().lower()
+        return orden if orden in ORDENES else ORDEN_FECHA
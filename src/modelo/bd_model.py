@@ -128,8 +128,20 @@ class Tarea(Base):
             "titulo",
             name="uq_tareas_usuario_titulo",
         ),
-        Index("ix_tareas_usuario_completada", "id_usuario", "completada"),
+        # creada_en al final: HU08 filtra por estado y ordena sin paso de sort
+        Index(
+            "ix_tareas_usuario_completada",
+            "id_usuario",
+            "completada",
+            "creada_en",
+        ),
         Index("ix_tareas_usuario_creada", "id_usuario", "creada_en"),
+        # HU10: orden por nombre sin distinguir mayúsculas, resuelto por índice
+        Index(
+            "ix_tareas_usuario_titulo_nocase",
+            "id_usuario",
+            text("titulo COLLATE NOCASE"),
+        ),
     )
 
     def __repr__(self) -> str:
@@ -0,0 +1,250 @@
+# src/modelo/cola_escritura.py
+"""
+Cola de escritura diferida (write-behind) delante del repositorio.
+
+Con `synchronous=FULL` cada escritura individual paga su propio commit y
+fsync. La cola acumula las escrituras y las aplica juntas con
+`aplicar_operaciones` (una transacción, un SAVEPOINT por operación) cuando
+hay `max_operaciones` pendientes o la más antigua lleva `max_espera_ms`
+esperando. Cada llamada devuelve un Future con el mismo resultado que el
+método síncrono equivalente.
+
+Coalescencia: un editar/marcar reemplaza (gana el último valor) a la
+operación pendiente del mismo tipo sobre la misma tarea solo si es la última
+encolada para ese usuario; así el orden de aplicación es el de llamada (un
+crear intermedio puede depender del título anterior). Ambos Futures reciben
+el resultado de la que se aplica. Crear y eliminar nunca se fusionan.
+
+Usage:
+    with ColaEscrituraTareas(repo, max_operaciones=100, max_espera_ms=50) as cola:
+        futuros = [cola.crear_tarea(id_usuario, t) for t in titulos]
+    resultados = [f.result() for f in futuros]
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+
+from src.modelo.repositorio_tareas import (
+    OP_CREAR,
+    OP_EDITAR,
+    OP_ELIMINAR,
+    OP_MARCAR,
+    OperacionEscritura,
+    RepositorioTareasSQLite,
+)
+
+logger = logging.getLogger(__name__)
+
+MAX_OPERACIONES_COLA = 100
+MAX_ESPERA_COLA_MS = 50.0
+MSG_COLA_CERRADA = "La cola de escritura está cerrada."
+
+
+@dataclass
+class _Pendiente:
+    operacion: OperacionEscritura
+    futuros: list[Future] = field(default_factory=list)
+
+
+class ColaEscrituraTareas:
+    """
+    Agrupa escrituras en transacciones; un hilo daemon las aplica.
+
+    - max_operaciones: pendientes que disparan la escritura inmediata.
+    - max_espera_ms: espera máxima de la operación más antigua.
+
+    `vaciar()` aplica lo pendiente en el hilo actual; `cerrar()` detiene el
+    hilo tras aplicar todo (usar al salir de la aplicación).
+    """
+
+    def __init__(
+        self,
+        repositorio: RepositorioTareasSQLite | None = None,
+        *,
+        max_operaciones: int = MAX_OPERACIONES_COLA,
+        max_espera_ms: float = MAX_ESPERA_COLA_MS,
+    ) -> None:
+        if max_operaciones <= 0:
+            raise ValueError("max_operaciones debe ser mayor que 0.")
+        if max_espera_ms < 0:
+            raise ValueError("max_espera_ms no puede ser negativo.")
+
+        self._repo = repositorio or RepositorioTareasSQLite()
+        self.max_operaciones = int(max_operaciones)
+        self.max_espera_s = float(max_espera_ms) / 1000
+
+        self._cond = threading.Condition()
+        self._pendientes: list[_Pendiente] = []
+        # id_usuario -> su última operación pendiente (la única fusionable)
+        self._ultimas: dict[int, _Pendiente] = {}
+        self._primera_en = 0.0
+        self._cerrada = False
+        self._hilo: threading.Thread | None = None
+        # Serializa los vaciados: los lotes se aplican en orden de llegada.
+        # Reentrante: un callback de Future puede llamar a vaciar().
+        self._lock_vaciado = threading.RLock()
+
+    def __enter__(self) -> ColaEscrituraTareas:
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.cerrar()
+
+    @property
+    def pendientes(self) -> int:
+        with self._cond:
+            return len(self._pendientes)
+
+    # ---------------- Escrituras encoladas ----------------
+
+    def crear_tarea(
+        self,
+        id_usuario: int,
+        titulo: str,
+        descripcion: str | None = None,
+    ) -> Future:
+        """Future de (Tarea | None, mensaje)."""
+        op = OperacionEscritura(
+            OP_CREAR, id_usuario, titulo=titulo, descripcion=descripcion
+        )
+        return self._encolar(op)
+
+    def editar_tarea(
+        self,
+        id_usuario: int,
+        id_tarea: int,
+        nuevo_titulo: str,
+        nueva_descripcion: str | None = None,
+    ) -> Future:
+        """Future de ResultadoOperacion."""
+        op = OperacionEscritura(
+            OP_EDITAR,
+            id_usuario,
+            id_tarea,
+            titulo=nuevo_titulo,
+            descripcion=nueva_descripcion,
+        )
+        return self._encolar(op)
+
+    def eliminar_tarea(self, id_usuario: int, id_tarea: int) -> Future:
+        """Future de ResultadoOperacion."""
+        return self._encolar(OperacionEscritura(OP_ELIMINAR, id_usuario, id_tarea))
+
+    def marcar_completada(
+        self,
+        id_usuario: int,
+        id_tarea: int,
+        completada: bool,
+    ) -> Future:
+        """Future de ResultadoOperacion."""
+        op = OperacionEscritura(
+            OP_MARCAR, id_usuario, id_tarea, completada=bool(completada)
+        )
+        return self._encolar(op)
+
+    # ---------------- Vaciado ----------------
+
+    def vaciar(self) -> int:
+        """Aplica ahora lo pendiente; devuelve cuántas operaciones se aplicaron."""
+        with self._lock_vaciado:
+            with self._cond:
+                lote, self._pendientes = self._pendientes, []
+                self._ultimas.clear()
+
+            # Una operación cuyos Futures se cancelaron todos no se aplica.
+            vivos: list[_Pendiente] = []
+            for pendiente in lote:
+                pendiente.futuros = [
+                    f for f in pendiente.futuros if f.set_running_or_notify_cancel()
+                ]
+                if pendiente.futuros:
+                    vivos.append(pendiente)
+            if not vivos:
+                return 0
+
+            try:
+                resultados = self._repo.aplicar_operaciones(
+                    [p.operacion for p in vivos]
+                )
+            except BaseException as exc:
+                for pendiente in vivos:
+                    for futuro in pendiente.futuros:
+                        futuro.set_exception(exc)
+                raise
+
+            for pendiente, resultado in zip(vivos, resultados):
+                for futuro in pendiente.futuros:
+                    futuro.set_result(resultado)
+            return len(vivos)
+
+    def cerrar(self) -> None:
+        """Rechaza nuevas escrituras, aplica las pendientes y detiene el hilo."""
+        with self._cond:
+            self._cerrada = True
+            self._cond.notify_all()
+            hilo = self._hilo
+        if hilo is not None:
+            hilo.join()
+        self.vaciar()
+
+    def _encolar(self, op: OperacionEscritura) -> Future:
+        futuro: Future = Future()
+        with self._cond:
+            if self._cerrada:
+                raise RuntimeError(MSG_COLA_CERRADA)
+            if not self._pendientes:
+                self._primera_en = time.monotonic()
+
+            anterior = self._ultimas.get(op.id_usuario)
+            if (
+                op.tipo in (OP_EDITAR, OP_MARCAR)
+                and anterior is not None
+                and anterior.operacion.tipo == op.tipo
+                and anterior.operacion.id_tarea == op.id_tarea
+            ):
+                # En su lugar: lo encolado después es de otros usuarios.
+                anterior.operacion = op
+                anterior.futuros.append(futuro)
+            else:
+                pendiente = _Pendiente(op, [futuro])
+                self._pendientes.append(pendiente)
+                self._ultimas[op.id_usuario] = pendiente
+
+            self._iniciar_hilo()
+            self._cond.notify_all()
+        return futuro
+
+    def _iniciar_hilo(self) -> None:
+        if self._hilo is None:
+            self._hilo = threading.Thread(
+                target=self._trabajar, name="cola-escritura", daemon=True
+            )
+            self._hilo.start()
+
+    def _trabajar(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pendientes and not self._cerrada:
+                    self._cond.wait()
+                if self._cerrada:
+                    return  # cerrar() aplica lo que quede
+                limite = self._primera_en + self.max_espera_s
+                while (
+                    self._pendientes
+                    and len(self._pendientes) < self.max_operaciones
+                    and not self._cerrada
+                ):
+                    restante = limite - time.monotonic()
+                    if restante <= 0:
+                        break
+                    self._cond.wait(restante)
+
+            try:
+                self.vaciar()
+            except Exception:  # noqa: BLE001 - el error ya está en los Futures
+                logger.exception("Falló la escritura diferida de tareas.")
@@ -1,42 +1,406 @@
 # src/modelo/conexion.py
 from __future__ import annotations
 
+import os
+import threading
 from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterator
+from typing import Callable, Iterator
 
 from sqlalchemy import create_engine, event
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 DB_PATH = PROJECT_ROOT / "DB.sqlite"
 DATABASE_URL = f"sqlite:///{DB_PATH}"
 
+# BD en memoria (tests / sesiones efímeras): una única conexión compartida
+URL_MEMORIA = "sqlite://"
+
+# Variable de entorno para apuntar a otra BD (p. ej. un archivo por tenant)
+ENV_DATABASE_URL = "OOPRA_DATABASE_URL"
+
+# Variable de entorno para elegir el perfil de durabilidad ("safe" | "fast")
+ENV_PERFIL = "OOPRA_DB_PERFIL"
+PERFIL_POR_DEFECTO = "safe"
+
 
 class Base(DeclarativeBase):
     """Base declarativa para modelos ORM."""
 
 
-def _create_engine(*, echo: bool = False) -> Engine:
-    """Crea el engine SQLite y aplica PRAGMAs por conexión."""
-    engine = create_engine(DATABASE_URL, echo=echo, future=True)
+@dataclass(frozen=True)
+class PerfilSQLite:
+    """
+    Conjunto de PRAGMAs que se aplican a cada conexión SQLite.
+
+    - safe: rollback journal + synchronous=FULL (comportamiento histórico).
+    - fast: WAL + synchronous=NORMAL + caché/mmap en memoria + busy_timeout.
+    """
+
+    nombre: str
+    journal_mode: str
+    synchronous: str
+    cache_size: int | None = None  # negativo = KiB (PRAGMA cache_size)
+    mmap_size: int | None = None  # bytes
+    temp_store: str | None = None
+    busy_timeout: int | None = None  # milisegundos
+
+    def pragmas(self, *, solo_lectura: bool = False) -> list[str]:
+        """
+        Devuelve las sentencias PRAGMA en el orden en que se aplican.
+
+        Las conexiones de solo lectura no cambian journal_mode/synchronous
+        (no pueden) y se marcan con query_only.
+        """
+        sentencias = ["PRAGMA foreign_keys=ON"]
+        if solo_lectura:
+            sentencias.append("PRAGMA query_only=ON")
+        else:
+            sentencias.append(f"PRAGMA journal_mode={self.journal_mode}")
+            sentencias.append(f"PRAGMA synchronous={self.synchronous}")
+        if self.busy_timeout is not None:
+            sentencias.append(f"PRAGMA busy_timeout={int(self.busy_timeout)}")
+        if self.cache_size is not None:
+            sentencias.append(f"PRAGMA cache_size={int(self.cache_size)}")
+        if self.mmap_size is not None:
+            sentencias.append(f"PRAGMA mmap_size={int(self.mmap_size)}")
+        if self.temp_store is not None:
+            sentencias.append(f"PRAGMA temp_store={self.temp_store}")
+        return sentencias
+
+
+PERFILES: dict[str, PerfilSQLite] = {
+    "safe": PerfilSQLite(
+        nombre="safe",
+        journal_mode="DELETE",
+        synchronous="FULL",
+    ),
+    "fast": PerfilSQLite(
+        nombre="fast",
+        journal_mode="WAL",
+        synchronous="NORMAL",
+        cache_size=-20_000,  # ~20 MB
+        mmap_size=256 * 1024 * 1024,
+        temp_store="MEMORY",
+        busy_timeout=5_000,
+    ),
+}
+
+
+def resolver_perfil(perfil: str | PerfilSQLite | None = None) -> PerfilSQLite:
+    """
+    Obtiene el perfil a usar.
+
+    Prioridad: argumento explícito > variable OOPRA_DB_PERFIL > "safe".
+    """
+    if isinstance(perfil, PerfilSQLite):
+        return perfil
+
+    nombre = perfil or os.environ.get(ENV_PERFIL) or PERFIL_POR_DEFECTO
+    nombre = nombre.strip().lower()
+    try:
+        return PERFILES[nombre]
+    except KeyError:
+        disponibles = ", ".join(sorted(PERFILES))
+        raise ValueError(
+            f"Perfil SQLite desconocido: {nombre!r} (disponibles: {disponibles})."
+        ) from None
+
+
+def es_url_memoria(url: str) -> bool:
+    """
+    True si la URL apunta a una BD SQLite en memoria.
+
+    Admite `sqlite://`, `sqlite:///:memory:` y URIs con `mode=memory`
+    (p. ej. `sqlite:///file:nombre?mode=memory&cache=shared&uri=true`).
+    """
+    url_sa = make_url(url)
+    database = url_sa.database or ""
+    return database in ("", ":memory:") or url_sa.query.get("mode") == "memory"
+
+
+def url_solo_lectura(url: str) -> str:
+    """
+    URL `mode=ro` (URI de SQLite) para el mismo archivo que `url`.
+
+    Las BDs en memoria no admiten otra conexión de solo lectura: se devuelve
+    la misma URL.
+    """
+    if es_url_memoria(url):
+        return url
+    url_sa = make_url(url)
+    ruta = Path(url_sa.database or "").resolve()
+    return f"{url_sa.drivername}:///{ruta.as_uri()}?mode=ro&uri=true"
+
+
+def _opciones_pool(url: str, tamano_pool: int | None = None) -> dict:
+    """Opciones de create_engine según el tipo de BD (archivo o memoria)."""
+    opciones: dict = {}
+    if es_url_memoria(url):
+        # Todas las sesiones/hilos comparten la misma BD en memoria.
+        opciones["connect_args"] = {"check_same_thread": False}
+        if make_url(url).query.get("cache") != "shared":
+            opciones["poolclass"] = StaticPool
+    elif tamano_pool is not None:
+        opciones["pool_size"] = int(tamano_pool)
+        opciones["max_overflow"] = 0
+    return opciones
+
+
+def _registrar_eventos(
+    engine: Engine,
+    perfil_sqlite: PerfilSQLite,
+    *,
+    solo_lectura: bool = False,
+) -> None:
+    """PRAGMAs del perfil + transacciones explícitas (SAVEPOINT fiables)."""
 
     @event.listens_for(engine, "connect")
     def _set_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+        # pysqlite abre transacciones por su cuenta (y no antes de SAVEPOINT);
+        # se desactiva y SQLAlchemy emite BEGIN explícito en "begin".
+        dbapi_connection.isolation_level = None
+
         cursor = dbapi_connection.cursor()
-        cursor.execute("PRAGMA foreign_keys=ON")
-        cursor.execute("PRAGMA journal_mode=DELETE")  # solo DB.sqlite
-        cursor.execute("PRAGMA synchronous=FULL")
+        for sentencia in perfil_sqlite.pragmas(solo_lectura=solo_lectura):
+            cursor.execute(sentencia)
         cursor.close()
 
+    @event.listens_for(engine, "checkout")
+    def _sin_transaccion_implicita(dbapi_connection, _record, _proxy) -> None:
+        # SQLAlchemy restaura el nivel de aislamiento tras usar AUTOCOMMIT.
+        if dbapi_connection.isolation_level is not None:
+            dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _begin_explicito(conn) -> None:
+        # En AUTOCOMMIT (VACUUM, ANALYZE, ...) no se abre transacción.
+        if conn.get_execution_options().get("isolation_level") != "AUTOCOMMIT":
+            conn.exec_driver_sql("BEGIN")
+
+
+def _create_engine(
+    url: str = DATABASE_URL,
+    *,
+    echo: bool = False,
+    perfil: str | PerfilSQLite | None = None,
+    tamano_pool: int | None = None,
+    solo_lectura: bool = False,
+) -> Engine:
+    """
+    Crea el engine SQLite y aplica los PRAGMAs del perfil por conexión.
+
+    - tamano_pool: fija el pool (sin overflow); 1 = escritor único.
+    - solo_lectura: la URL debe ser `mode=ro` (ver `url_solo_lectura`).
+    """
+    engine = create_engine(
+        url,
+        echo=echo,
+        future=True,
+        **_opciones_pool(url, tamano_pool),
+    )
+    _registrar_eventos(engine, resolver_perfil(perfil), solo_lectura=solo_lectura)
+    return engine
+
+
+def url_async(url: str) -> str:
+    """Convierte una URL `sqlite://...` a su variante `sqlite+aiosqlite://...`."""
+    return make_url(url).set(drivername="sqlite+aiosqlite").render_as_string(
+        hide_password=False
+    )
+
+
+def _create_async_engine(
+    url: str = DATABASE_URL,
+    *,
+    echo: bool = False,
+    perfil: str | PerfilSQLite | None = None,
+) -> AsyncEngine:
+    """Engine asyncio (aiosqlite) con los mismos PRAGMAs y eventos que el síncrono."""
+    engine = create_async_engine(url_async(url), echo=echo, **_opciones_pool(url))
+    _registrar_eventos(engine.sync_engine, resolver_perfil(perfil))
+    return engine
+
+
+# Registro perezoso de engines: uno por URL, creado en la primera consulta.
+_ENGINES: dict[str, Engine] = {}
+_SESSION_FACTORIES: dict[str, sessionmaker] = {}
+_ENGINES_ASYNC: dict[str, AsyncEngine] = {}
+_ENGINES_LECTURA: dict[str, Engine] = {}
+_REGISTRO_LOCK = threading.RLock()
+
+
+# SQLite admite un solo escritor: el engine principal usa una única conexión
+# (las escrituras esperan en el pool en vez de fallar con "database is locked")
+# y las lecturas van a un pool aparte de conexiones mode=ro.
+TAMANO_POOL_ESCRITURA = 1
+TAMANO_POOL_LECTURA = 4
+
+
+def url_por_defecto() -> str:
+    """URL de la BD principal: variable OOPRA_DATABASE_URL o DB.sqlite en la raíz."""
+    return os.environ.get(ENV_DATABASE_URL) or DATABASE_URL
+
+
+def get_engine(
+    url: str | None = None,
+    *,
+    perfil: str | PerfilSQLite | None = None,
+) -> Engine:
+    """
+    Devuelve (creándolo si hace falta) el engine asociado a `url`.
+
+    El perfil solo se usa al crear el engine; llamadas posteriores con la
+    misma URL reutilizan el engine ya registrado.
+    """
+    clave = url or url_por_defecto()
+    engine = _ENGINES.get(clave)
+    if engine is not None:
+        return engine
+
+    with _REGISTRO_LOCK:
+        engine = _ENGINES.get(clave)
+        if engine is None:
+            engine = _create_engine(
+                clave,
+                perfil=perfil,
+                tamano_pool=TAMANO_POOL_ESCRITURA,
+            )
+            _ENGINES[clave] = engine
+    return engine
+
+
+def get_engine_lectura(
+    url: str | None = None,
+    *,
+    perfil: str | PerfilSQLite | None = None,
+    tamano_pool: int = TAMANO_POOL_LECTURA,
+) -> Engine:
+    """
+    Engine de solo lectura (pool de conexiones `mode=ro`) para `url`.
+
+    En BDs en memoria devuelve el engine principal (no hay archivo que abrir
+    dos veces). El archivo debe existir (`init_db`) antes de la primera lectura.
+    """
+    clave = url or url_por_defecto()
+    if es_url_memoria(clave):
+        return get_engine(clave, perfil=perfil)
+
+    engine = _ENGINES_LECTURA.get(clave)
+    if engine is not None:
+        return engine
+
+    with _REGISTRO_LOCK:
+        engine = _ENGINES_LECTURA.get(clave)
+        if engine is None:
+            engine = _create_engine(
+                url_solo_lectura(clave),
+                perfil=perfil,
+                tamano_pool=tamano_pool,
+                solo_lectura=True,
+            )
+            _ENGINES_LECTURA[clave] = engine
     return engine
 
 
-ENGINE = _create_engine(echo=False)
+def get_session_factory(url: str | None = None) -> sessionmaker:
+    """sessionmaker ligado al engine de `url` (uno por URL)."""
+    clave = url or url_por_defecto()
+    factory = _SESSION_FACTORIES.get(clave)
+    if factory is not None:
+        return factory
+
+    with _REGISTRO_LOCK:
+        factory = _SESSION_FACTORIES.get(clave)
+        if factory is None:
+            factory = sessionmaker(
+                bind=get_engine(clave),
+                autoflush=False,
+                autocommit=False,
+                future=True,
+                class_=Session,
+            )
+            _SESSION_FACTORIES[clave] = factory
+    return factory
+
+
+def get_async_engine(
+    url: str | None = None,
+    *,
+    perfil: str | PerfilSQLite | None = None,
+) -> AsyncEngine:
+    """
+    Engine asyncio (aiosqlite) asociado a `url`, creado en el primer uso.
+
+    Las conexiones aiosqlite pertenecen a un event loop: usar un loop por
+    proceso o liberar con `cerrar_engines_async()` antes de cambiar de loop.
+    """
+    clave = url or url_por_defecto()
+    engine = _ENGINES_ASYNC.get(clave)
+    if engine is not None:
+        return engine
+
+    with _REGISTRO_LOCK:
+        engine = _ENGINES_ASYNC.get(clave)
+        if engine is None:
+            engine = _create_async_engine(clave, perfil=perfil)
+            _ENGINES_ASYNC[clave] = engine
+    return engine
+
+
+async def cerrar_engines_async() -> None:
+    """Libera los engines asyncio registrados."""
+    with _REGISTRO_LOCK:
+        engines = list(_ENGINES_ASYNC.values())
+        _ENGINES_ASYNC.clear()
+    for engine in engines:
+        await engine.dispose()
+
+
+def cerrar_engines() -> None:
+    """Libera todos los engines registrados (útil en tests y benchmarks)."""
+    with _REGISTRO_LOCK:
+        engines = [*_ENGINES.values(), *_ENGINES_LECTURA.values()]
+        _ENGINES.clear()
+        _ENGINES_LECTURA.clear()
+        _SESSION_FACTORIES.clear()
+    for engine in engines:
+        engine.dispose()
+
+
+class _SessionMakerPerezoso(sessionmaker):
+    """sessionmaker que resuelve el engine por defecto al abrir cada sesión."""
+
+    def __init__(self, resolver: Callable[[], Engine] = get_engine, **kw) -> None:
+        super().__init__(**kw)
+        self._resolver = resolver
 
-SessionLocal = sessionmaker(
-    bind=ENGINE,
+    def __call__(self, **local_kw) -> Session:
+        if local_kw.get("bind") is None and self.kw.get("bind") is None:
+            local_kw["bind"] = self._resolver()
+        return super().__call__(**local_kw)
+
+
+SessionLocal = _SessionMakerPerezoso(
+    autoflush=False,
+    autocommit=False,
+    future=True,
+    class_=Session,
+)
+
+# Sesiones de consulta: pool de lectores mode=ro sobre la BD por defecto.
+SessionLectura = _SessionMakerPerezoso(
+    get_engine_lectura,
     autoflush=False,
     autocommit=False,
     future=True,
@@ -44,15 +408,39 @@ SessionLocal = sessionmaker(
 )
 
 
-def crear_db_sqlite() -> Path:
-    """Asegura que DB.sqlite exista."""
-    with ENGINE.connect():
+class _AsyncSessionMakerPerezoso(async_sessionmaker):
+    """async_sessionmaker que resuelve el engine asyncio por defecto al abrir."""
+
+    def __call__(self, **local_kw) -> AsyncSession:
+        if local_kw.get("bind") is None and self.kw.get("bind") is None:
+            local_kw["bind"] = get_async_engine()
+        return super().__call__(**local_kw)
+
+
+AsyncSessionLocal = _AsyncSessionMakerPerezoso(
+    autoflush=False,
+    expire_on_commit=False,
+    class_=AsyncSession,
+)
+
+
+def __getattr__(nombre: str):
+    # Compatibilidad: `ENGINE` se resuelve recién al primer acceso.
+    if nombre == "ENGINE":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+
+
+def crear_db_sqlite(url: str | None = None) -> Path:
+    """Asegura que el archivo SQLite exista y devuelve su ruta."""
+    engine = get_engine(url)
+    with engine.connect():
         pass
-    return DB_PATH
+    return Path(engine.url.database or "")
 
 
 @contextmanager
-def get_session() -> Iterator[Session]:
+def get_session(url: str | None = None) -> Iterator[Session]:
     """
     Provee una sesión SQLAlchemy y garantiza cierre.
 
@@ -60,16 +448,41 @@ def get_session() -> Iterator[Session]:
         with get_session() as session:
             ...
     """
-    session = SessionLocal()
+    session = SessionLocal() if url is None else get_session_factory(url)()
     try:
         yield session
     finally:
         session.close()
 
 
-def init_db() -> None:
-    """Crea/verifica tablas en DB.sqlite según los modelos ORM."""
+def init_db(url: str | None = None, *, engine: Engine | None = None) -> None:
+    """
+    Crea/verifica tablas en la BD (DB.sqlite por defecto) según los modelos ORM
+    y aplica las migraciones pendientes (índices, ANALYZE, PRAGMA optimize).
+    """
+
+    from src.modelo.bd_model import Tarea, Usuario  # noqa: F401
+    from src.modelo.migraciones import aplicar_migraciones
+
+    engine = engine or get_engine(url)
+    Base.metadata.create_all(bind=engine)
+    aplicar_migraciones(engine)
+
+
+async def init_db_async(
+    url: str | None = None,
+    *,
+    engine: AsyncEngine | None = None,
+) -> None:
+    """
+    Crea/verifica tablas desde un engine asyncio.
+
+    Solo ejecuta `create_all`; en BDs de archivo las migraciones se aplican
+    con `init_db(url)` (síncrono) al arrancar.
+    """
 
     from src.modelo.bd_model import Tarea, Usuario  # noqa: F401
 
-    Base.metadata.create_all(bind=ENGINE)
+    engine = engine or get_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
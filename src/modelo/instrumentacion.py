@@ -0,0 +1,295 @@
+# src/modelo/instrumentacion.py
+"""
+Instrumentación opcional de SQL (conteo y latencia por sentencia).
+
+Se adjunta a un Engine con listeners `before_cursor_execute` /
+`after_cursor_execute`, agrupa por sentencia normalizada, cuenta aciertos
+del compiled cache de SQLAlchemy y permite tomar
+un snapshot para tests ("el refresco emite como máximo N consultas") o
+para volcarlo en modo debug.
+
+Usage:
+    instr = InstrumentadorSQL(umbral_lento_ms=50)
+    instr.adjuntar(get_engine())
+    ...
+    print(instr.snapshot().como_texto())
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.interfaces import CacheStats
+
+logger = logging.getLogger(__name__)
+
+# Límites superiores (ms) de los buckets del histograma de latencia
+BUCKETS_MS: tuple[float, ...] = (0.1, 0.5, 1.0, 5.0, 10.0, 50.0, 100.0, 500.0)
+
+_RE_ESPACIOS = re.compile(r"\s+")
+_RE_CADENA = re.compile(r"'(?:[^']|'')*'")
+_RE_NUMERO = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_RE_LISTA_PARAMS = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_RE_FILAS_VALUES = re.compile(r"(\(\?\))(?:\s*,\s*\(\?\))+")
+
+
+def normalizar_sentencia(sql: str) -> str:
+    """
+    Reduce una sentencia a su "forma": sin literales ni listas de parámetros.
+
+    `... WHERE id IN (?, ?, ?) AND x = 'a'` -> `... WHERE id IN (?) AND x = ?`
+    """
+    sql = _RE_ESPACIOS.sub(" ", sql).strip()
+    sql = _RE_CADENA.sub("?", sql)
+    sql = _RE_NUMERO.sub("?", sql)
+    sql = _RE_LISTA_PARAMS.sub("(?)", sql)
+    return _RE_FILAS_VALUES.sub(r"\1", sql)
+
+
+def _percentil(muestras_ordenadas: list[float], p: float) -> float:
+    """Percentil por rango más cercano (muestras ya ordenadas)."""
+    if not muestras_ordenadas:
+        return 0.0
+    rango = max(1, math.ceil(p / 100.0 * len(muestras_ordenadas)))
+    return muestras_ordenadas[rango - 1]
+
+
+def _etiqueta_bucket(limite: float) -> str:
+    return f"<={limite:g}ms" if math.isfinite(limite) else f">{BUCKETS_MS[-1]:g}ms"
+
+
+@dataclass(frozen=True)
+class EstadisticaSentencia:
+    """Métricas agregadas de una sentencia normalizada."""
+
+    sentencia: str
+    ejecuciones: int
+    total_ms: float
+    min_ms: float
+    max_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    histograma: dict[str, int]
+
+    @property
+    def promedio_ms(self) -> float:
+        return self.total_ms / self.ejecuciones if self.ejecuciones else 0.0
+
+
+@dataclass(frozen=True)
+class SnapshotSQL:
+    """Foto inmutable de la instrumentación en un instante."""
+
+    total_sentencias: int
+    total_ms: float
+    lentas: int
+    sentencias: tuple[EstadisticaSentencia, ...] = ()
+    cache_aciertos: int = 0
+    cache_fallos: int = 0
+
+    @property
+    def tasa_aciertos_cache(self) -> float:
+        """Fracción de sentencias compiladas servidas desde el compiled cache."""
+        total = self.cache_aciertos + self.cache_fallos
+        return self.cache_aciertos / total if total else 0.0
+
+    def ejecuciones_de(self, fragmento: str) -> int:
+        """Suma de ejecuciones de las sentencias que contienen `fragmento`."""
+        fragmento = fragmento.lower()
+        return sum(
+            e.ejecuciones for e in self.sentencias if fragmento in e.sentencia.lower()
+        )
+
+    def como_texto(self, limite: int = 20) -> str:
+        """Volcado legible (ordenado por tiempo total) para depuración."""
+        lineas = [
+            f"SQL: {self.total_sentencias} sentencias, "
+            f"{self.total_ms:.2f} ms, {self.lentas} lentas, "
+            f"compiled cache {self.tasa_aciertos_cache:.1%} "
+            f"({self.cache_aciertos} aciertos / {self.cache_fallos} fallos)"
+        ]
+        for e in self.sentencias[:limite]:
+            lineas.append(
+                f"  {e.ejecuciones:>6}x total={e.total_ms:9.2f}ms "
+                f"p50={e.p50_ms:.3f} p95={e.p95_ms:.3f} p99={e.p99_ms:.3f} "
+                f"max={e.max_ms:.3f} | {e.sentencia}"
+            )
+        return "\n".join(lineas)
+
+
+@dataclass
+class _Acumulador:
+    ejecuciones: int = 0
+    total_ms: float = 0.0
+    min_ms: float = math.inf
+    max_ms: float = 0.0
+    muestras: deque = field(default_factory=deque)
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(BUCKETS_MS) + 1))
+
+    def registrar(self, duracion_ms: float) -> None:
+        self.ejecuciones += 1
+        self.total_ms += duracion_ms
+        self.min_ms = min(self.min_ms, duracion_ms)
+        self.max_ms = max(self.max_ms, duracion_ms)
+        self.muestras.append(duracion_ms)
+
+        for i, limite in enumerate(BUCKETS_MS):
+            if duracion_ms <= limite:
+                self.buckets[i] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+
+
+class InstrumentadorSQL:
+    """
+    Recolector de métricas SQL por sentencia normalizada.
+
+    - Se activa solo al llamar `adjuntar(engine)` (opt-in).
+    - Guarda hasta `max_muestras` latencias por sentencia para percentiles.
+    - Registra en el logger las sentencias que superan `umbral_lento_ms`.
+    """
+
+    def __init__(
+        self,
+        umbral_lento_ms: float = 100.0,
+        max_muestras: int = 1024,
+    ) -> None:
+        self.umbral_lento_ms = float(umbral_lento_ms)
+        self._max_muestras = int(max_muestras)
+        self._clave_inicio = f"instrumentacion_sql_{id(self)}"
+        self._lock = threading.Lock()
+        self._acumuladores: dict[str, _Acumulador] = {}
+        self._lentas = 0
+        self._cache_aciertos = 0
+        self._cache_fallos = 0
+        self._engines: list[Engine] = []
+
+    # ---------------- ciclo de vida ----------------
+
+    def adjuntar(self, engine: Engine) -> "InstrumentadorSQL":
+        if engine in self._engines:
+            return self
+        event.listen(engine, "before_cursor_execute", self._antes)
+        event.listen(engine, "after_cursor_execute", self._despues)
+        self._engines.append(engine)
+        return self
+
+    def desadjuntar(self, engine: Engine | None = None) -> None:
+        engines = [engine] if engine is not None else list(self._engines)
+        for e in engines:
+            if e not in self._engines:
+                continue
+            event.remove(e, "before_cursor_execute", self._antes)
+            event.remove(e, "after_cursor_execute", self._despues)
+            self._engines.remove(e)
+
+    def reiniciar(self) -> None:
+        with self._lock:
+            self._acumuladores.clear()
+            self._lentas = 0
+            self._cache_aciertos = 0
+            self._cache_fallos = 0
+
+    @contextmanager
+    def medir(self) -> Iterator["InstrumentadorSQL"]:
+        """Reinicia las métricas y las expone durante el bloque."""
+        self.reiniciar()
+        yield self
+
+    # ---------------- listeners ----------------
+
+    def _antes(self, conn, _cursor, _statement, _parameters, _context, _executemany):
+        conn.info.setdefault(self._clave_inicio, []).append(time.perf_counter())
+
+    def _despues(self, conn, _cursor, statement, parameters, context, executemany):
+        pila = conn.info.get(self._clave_inicio)
+        if not pila:
+            return
+        duracion_ms = (time.perf_counter() - pila.pop()) * 1000.0
+        clave = normalizar_sentencia(statement)
+
+        with self._lock:
+            acumulador = self._acumuladores.get(clave)
+            if acumulador is None:
+                acumulador = _Acumulador(muestras=deque(maxlen=self._max_muestras))
+                self._acumuladores[clave] = acumulador
+            acumulador.registrar(duracion_ms)
+            lenta = duracion_ms >= self.umbral_lento_ms
+            if lenta:
+                self._lentas += 1
+
+            # Sentencias compiladas (no SQL crudo): ¿salió del compiled cache?
+            cache_hit = getattr(context, "cache_hit", None)
+            if getattr(context, "compiled", None) is not None:
+                if cache_hit is CacheStats.CACHE_HIT:
+                    self._cache_aciertos += 1
+                elif cache_hit is CacheStats.CACHE_MISS:
+                    self._cache_fallos += 1
+
+        if lenta:
+            logger.warning(
+                "Consulta lenta (%.2f ms%s): %s | params=%r",
+                duracion_ms,
+                ", executemany" if executemany else "",
+                clave,
+                parameters,
+            )
+
+    # ---------------- lectura ----------------
+
+    def snapshot(self) -> SnapshotSQL:
+        with self._lock:
+            copia = {
+                clave: (
+                    a.ejecuciones,
+                    a.total_ms,
+                    a.min_ms,
+                    a.max_ms,
+                    sorted(a.muestras),
+                    list(a.buckets),
+                )
+                for clave, a in self._acumuladores.items()
+            }
+            lentas = self._lentas
+            cache_aciertos = self._cache_aciertos
+            cache_fallos = self._cache_fallos
+
+        etiquetas = [_etiqueta_bucket(b) for b in (*BUCKETS_MS, math.inf)]
+        estadisticas = [
+            EstadisticaSentencia(
+                sentencia=clave,
+                ejecuciones=ejecuciones,
+                total_ms=total_ms,
+                min_ms=min_ms,
+                max_ms=max_ms,
+                p50_ms=_percentil(muestras, 50),
+                p95_ms=_percentil(muestras, 95),
+                p99_ms=_percentil(muestras, 99),
+                histograma=dict(zip(etiquetas, buckets)),
+            )
+            for clave, (ejecuciones, total_ms, min_ms, max_ms, muestras, buckets) in (
+                copia.items()
+            )
+        ]
+        estadisticas.sort(key=lambda e: e.total_ms, reverse=True)
+
+        return SnapshotSQL(
+            total_sentencias=sum(e.ejecuciones for e in estadisticas),
+            total_ms=sum(e.total_ms for e in estadisticas),
+            lentas=lentas,
+            sentencias=tuple(estadisticas),
+            cache_aciertos=cache_aciertos,
+            cache_fallos=cache_fallos,
+        )
@@ -0,0 +1,273 @@
+# src/modelo/mantenimiento.py
+"""
+Mantenimiento de la BD en tiempo ocioso.
+
+Con `auto_vacuum=INCREMENTAL` (migración 2) las páginas que dejan las
+tareas eliminadas quedan en la freelist; aquí se devuelven al sistema en
+porciones pequeñas de `incremental_vacuum` dentro de un presupuesto de
+tiempo, y luego se ejecuta `PRAGMA optimize`.
+
+La pasada nunca espera a la aplicación: si la conexión del escritor está en
+uso o la BD está bloqueada (más de `espera_bloqueo_ms`), se omite y el
+resultado queda con `omitido=True`.
+
+Usage:
+    mantenimiento = MantenimientoBD()
+    futuro = mantenimiento.ejecutar_en_segundo_plano()
+    resultado = futuro.result()
+    print(resultado.bytes_antes, resultado.bytes_despues)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError
+
+from src.modelo.conexion import get_engine
+
+AUTO_VACUUM_INCREMENTAL = 2
+
+
+@dataclass(frozen=True)
+class EstadoBD:
+    """Conteo de páginas de la BD (tamaño lógico = page_count * page_size)."""
+
+    page_size: int
+    page_count: int
+    freelist_count: int
+    auto_vacuum: int
+
+    @property
+    def bytes_totales(self) -> int:
+        return self.page_size * self.page_count
+
+    @property
+    def bytes_libres(self) -> int:
+        return self.page_size * self.freelist_count
+
+    @property
+    def incremental(self) -> bool:
+        return self.auto_vacuum == AUTO_VACUUM_INCREMENTAL
+
+
+@dataclass(frozen=True)
+class PorcionMantenimiento:
+    """Resultado de una porción de incremental_vacuum."""
+
+    paginas_liberadas: int
+    segundos: float
+
+
+@dataclass(frozen=True)
+class ResultadoMantenimiento:
+    """Métricas de una pasada de mantenimiento."""
+
+    bytes_antes: int
+    bytes_despues: int
+    porciones: tuple[PorcionMantenimiento, ...] = ()
+    optimizado: bool = False
+    omitido: bool = False  # BD ocupada: se reintenta en la siguiente pasada
+
+    @property
+    def bytes_recuperados(self) -> int:
+        return max(0, self.bytes_antes - self.bytes_despues)
+
+    @property
+    def segundos_totales(self) -> float:
+        return sum(p.segundos for p in self.porciones)
+
+
+class MantenimientoBD:
+    """
+    Reclama páginas libres en porciones acotadas.
+
+    - paginas_por_porcion: páginas devueltas por cada incremental_vacuum.
+    - presupuesto_s: tiempo máximo por pasada de `ejecutar_en_reposo`.
+    - min_paginas_libres: por debajo de este umbral no se hace nada.
+    - espera_bloqueo_ms: busy_timeout de la pasada (0 = no esperar el lock).
+    """
+
+    def __init__(
+        self,
+        engine: Engine | None = None,
+        *,
+        paginas_por_porcion: int = 64,
+        presupuesto_s: float = 0.05,
+        min_paginas_libres: int = 1,
+        espera_bloqueo_ms: int = 0,
+    ) -> None:
+        if paginas_por_porcion <= 0:
+            raise ValueError("paginas_por_porcion debe ser mayor que 0.")
+        if espera_bloqueo_ms < 0:
+            raise ValueError("espera_bloqueo_ms no puede ser negativo.")
+
+        self._engine = engine
+        self.paginas_por_porcion = int(paginas_por_porcion)
+        self.presupuesto_s = float(presupuesto_s)
+        self.min_paginas_libres = int(min_paginas_libres)
+        self.espera_bloqueo_ms = int(espera_bloqueo_ms)
+        self._lock = threading.Lock()
+
+    @property
+    def engine(self) -> Engine:
+        return self._engine or get_engine()
+
+    def estado(self) -> EstadoBD:
+        with self.engine.connect() as conn:
+            return self._estado(conn)
+
+    @staticmethod
+    def _estado(conn: Connection) -> EstadoBD:
+        def pragma(nombre: str) -> int:
+            return int(conn.exec_driver_sql(f"PRAGMA {nombre}").scalar() or 0)
+
+        return EstadoBD(
+            page_size=pragma("page_size"),
+            page_count=pragma("page_count"),
+            freelist_count=pragma("freelist_count"),
+            auto_vacuum=pragma("auto_vacuum"),
+        )
+
+    def ejecutar_porcion(self) -> PorcionMantenimiento:
+        """Devuelve al sistema hasta `paginas_por_porcion` páginas libres."""
+        with self.engine.connect() as conn:
+            conn.execution_options(isolation_level="AUTOCOMMIT")
+            return self._porcion(conn)
+
+    def _porcion(
+        self,
+        conn: Connection,
+        limite: float | None = None,
+    ) -> PorcionMantenimiento:
+        # pysqlite libera una sola página por ejecución de incremental_vacuum(N)
+        # (no recorre las filas del PRAGMA), así que la porción son N
+        # incremental_vacuum(1) en una transacción: un solo commit por porción,
+        # cortando antes si se alcanza `limite` (perf_counter).
+        antes = self._estado(conn).freelist_count
+        inicio = time.perf_counter()
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+        try:
+            for _ in range(min(self.paginas_por_porcion, antes)):
+                conn.exec_driver_sql("PRAGMA incremental_vacuum(1)")
+                if limite is not None and time.perf_counter() >= limite:
+                    break
+        except BaseException:
+            conn.exec_driver_sql("ROLLBACK")
+            raise
+        conn.exec_driver_sql("COMMIT")
+        segundos = time.perf_counter() - inicio
+        despues = self._estado(conn).freelist_count
+        return PorcionMantenimiento(
+            paginas_liberadas=max(0, antes - despues),
+            segundos=segundos,
+        )
+
+    def ejecutar_en_reposo(
+        self,
+        presupuesto_s: float | None = None,
+        *,
+        optimizar: bool = True,
+    ) -> ResultadoMantenimiento:
+        """
+        Ejecuta porciones hasta vaciar la freelist o agotar el presupuesto.
+
+        Pensado para un temporizador mientras la app está ociosa, fuera del hilo
+        de la UI (`ejecutar_en_segundo_plano`); si la BD está ocupada no espera.
+        """
+        presupuesto = self.presupuesto_s if presupuesto_s is None else presupuesto_s
+
+        # Una pasada a la vez: si otra está en curso, esta se omite.
+        if not self._lock.acquire(blocking=False):
+            return ResultadoMantenimiento(0, 0, omitido=True)
+        try:
+            return self._en_reposo(presupuesto, optimizar)
+        finally:
+            self._lock.release()
+
+    def ejecutar_en_segundo_plano(
+        self,
+        presupuesto_s: float | None = None,
+        *,
+        optimizar: bool = True,
+    ) -> Future:
+        """Lanza `ejecutar_en_reposo()` en un hilo daemon y devuelve un Future."""
+        futuro: Future = Future()
+
+        def _trabajo() -> None:
+            if not futuro.set_running_or_notify_cancel():
+                return
+            try:
+                futuro.set_result(
+                    self.ejecutar_en_reposo(presupuesto_s, optimizar=optimizar)
+                )
+            except BaseException as exc:  # noqa: BLE001
+                futuro.set_exception(exc)
+
+        threading.Thread(
+            target=_trabajo, name="mantenimiento-sqlite", daemon=True
+        ).start()
+        return futuro
+
+    def _pool_ocupado(self) -> bool:
+        # Escritor único (pool de 1 conexión sin overflow): si la conexión está
+        # prestada, conectar esperaría a que la app termine de escribir.
+        pool = self.engine.pool
+        tamano = getattr(pool, "size", None)
+        return callable(tamano) and pool.checkedout() >= tamano()
+
+    def _en_reposo(self, presupuesto: float, optimizar: bool) -> ResultadoMantenimiento:
+        if self._pool_ocupado():
+            return ResultadoMantenimiento(0, 0, omitido=True)
+
+        with self.engine.connect() as conn:
+            conn.execution_options(isolation_level="AUTOCOMMIT")
+            espera_previa = int(conn.exec_driver_sql("PRAGMA busy_timeout").scalar())
+            conn.exec_driver_sql(f"PRAGMA busy_timeout={self.espera_bloqueo_ms}")
+            try:
+                return self._pasada(conn, presupuesto, optimizar)
+            except OperationalError as exc:
+                if "locked" not in str(exc.orig):
+                    raise
+                # Otra conexión tiene el lock: se reintenta en la siguiente pasada.
+                return ResultadoMantenimiento(0, 0, omitido=True)
+            finally:
+                conn.exec_driver_sql(f"PRAGMA busy_timeout={espera_previa}")
+
+    def _pasada(
+        self,
+        conn: Connection,
+        presupuesto: float,
+        optimizar: bool,
+    ) -> ResultadoMantenimiento:
+        estado = self._estado(conn)
+        bytes_antes = estado.bytes_totales
+
+        porciones: list[PorcionMantenimiento] = []
+        if estado.incremental and estado.freelist_count >= self.min_paginas_libres:
+            limite = time.perf_counter() + presupuesto
+            while True:
+                porcion = self._porcion(conn, limite)
+                porciones.append(porcion)
+                if porcion.paginas_liberadas == 0:
+                    break
+                if self._estado(conn).freelist_count == 0:
+                    break
+                if time.perf_counter() >= limite:
+                    break
+
+        optimizado = False
+        if optimizar and porciones:
+            conn.exec_driver_sql("PRAGMA optimize")
+            optimizado = True
+
+        return ResultadoMantenimiento(
+            bytes_antes=bytes_antes,
+            bytes_despues=self._estado(conn).bytes_totales,
+            porciones=tuple(porciones),
+            optimizado=optimizado,
+        )
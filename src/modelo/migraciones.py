@@ -0,0 +1,220 @@
+# src/modelo/migraciones.py
+"""
+Migraciones versionadas del esquema SQLite.
+
+La versión aplicada se guarda en `PRAGMA user_version`. Cada migración es
+idempotente (`IF NOT EXISTS`) para convivir con `Base.metadata.create_all`,
+que ya crea el esquema completo en bases nuevas. Tras aplicar migraciones se
+ejecuta `ANALYZE`; siempre se termina con `PRAGMA optimize`.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Callable, Sequence
+
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Migracion:
+    """
+    Paso de migración.
+
+    - sentencias: SQL que se ejecuta en orden.
+    - aplicar: función opcional para pasos que necesitan lógica (columnas, etc.).
+    - transaccional: False para pasos que SQLite no admite dentro de una
+      transacción (p. ej. VACUUM).
+    """
+
+    version: int
+    descripcion: str
+    sentencias: tuple[str, ...] = ()
+    aplicar: Callable[[Connection], None] | None = None
+    transaccional: bool = True
+
+    def ejecutar(self, conn: Connection) -> None:
+        for sentencia in self.sentencias:
+            conn.exec_driver_sql(sentencia)
+        if self.aplicar is not None:
+            self.aplicar(conn)
+
+
+# Índice de texto completo (FTS5, tabla "external content" sobre tareas).
+# unicode61 + remove_diacritics: "cancion" encuentra "canción"; los índices de
+# prefijo aceleran las búsquedas "pal*" de 2 y 3 caracteres.
+SQL_CREAR_TAREAS_FTS = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS tareas_fts USING fts5("
+    "titulo, descripcion, content='tareas', content_rowid='id_tarea', "
+    "tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+)
+
+SQL_TRIGGERS_TAREAS_FTS = (
+    "CREATE TRIGGER IF NOT EXISTS tareas_fts_ai AFTER INSERT ON tareas BEGIN "
+    "INSERT INTO tareas_fts(rowid, titulo, descripcion) "
+    "VALUES (new.id_tarea, new.titulo, new.descripcion); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS tareas_fts_ad AFTER DELETE ON tareas BEGIN "
+    "INSERT INTO tareas_fts(tareas_fts, rowid, titulo, descripcion) "
+    "VALUES ('delete', old.id_tarea, old.titulo, old.descripcion); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS tareas_fts_au "
+    "AFTER UPDATE OF titulo, descripcion ON tareas BEGIN "
+    "INSERT INTO tareas_fts(tareas_fts, rowid, titulo, descripcion) "
+    "VALUES ('delete', old.id_tarea, old.titulo, old.descripcion); "
+    "INSERT INTO tareas_fts(rowid, titulo, descripcion) "
+    "VALUES (new.id_tarea, new.titulo, new.descripcion); "
+    "END",
+)
+
+
+# Registro de cambios (change feed): cada escritura en tareas deja una fila
+# con una revisión creciente (AUTOINCREMENT: nunca se reutiliza). Solo se
+# guarda el último cambio por (id_usuario, id_tarea): INSERT OR REPLACE borra
+# el anterior, así el registro crece con las tareas, no con las escrituras.
+# Los borrados quedan como lápidas (eliminada = 1).
+SQL_CAMBIOS_TAREAS = (
+    "CREATE TABLE IF NOT EXISTS tareas_cambios ("
+    "revision INTEGER PRIMARY KEY AUTOINCREMENT, "
+    "id_usuario INTEGER NOT NULL, "
+    "id_tarea INTEGER NOT NULL, "
+    "eliminada INTEGER NOT NULL DEFAULT 0, "
+    "UNIQUE (id_usuario, id_tarea))",
+    "CREATE INDEX IF NOT EXISTS ix_tareas_cambios_usuario_revision "
+    "ON tareas_cambios (id_usuario, revision)",
+    "CREATE TRIGGER IF NOT EXISTS tareas_cambios_ai AFTER INSERT ON tareas BEGIN "
+    "INSERT OR REPLACE INTO tareas_cambios (id_usuario, id_tarea, eliminada) "
+    "VALUES (new.id_usuario, new.id_tarea, 0); "
+    "END",
+    # Si la tarea cambia de usuario, el anterior la ve como eliminada.
+    "CREATE TRIGGER IF NOT EXISTS tareas_cambios_au AFTER UPDATE ON tareas BEGIN "
+    "INSERT OR REPLACE INTO tareas_cambios (id_usuario, id_tarea, eliminada) "
+    "SELECT old.id_usuario, old.id_tarea, 1 "
+    "WHERE old.id_usuario <> new.id_usuario; "
+    "INSERT OR REPLACE INTO tareas_cambios (id_usuario, id_tarea, eliminada) "
+    "VALUES (new.id_usuario, new.id_tarea, 0); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS tareas_cambios_ad AFTER DELETE ON tareas BEGIN "
+    "INSERT OR REPLACE INTO tareas_cambios (id_usuario, id_tarea, eliminada) "
+    "VALUES (old.id_usuario, old.id_tarea, 1); "
+    "END",
+    # Las tareas previas a la migración entran con una revisión inicial.
+    "INSERT OR IGNORE INTO tareas_cambios (id_usuario, id_tarea) "
+    "SELECT id_usuario, id_tarea FROM tareas ORDER BY id_tarea",
+)
+
+
+def _crear_busqueda_fts(conn: Connection) -> None:
+    """Crea tareas_fts + triggers e indexa las tareas existentes."""
+    try:
+        conn.exec_driver_sql(SQL_CREAR_TAREAS_FTS)
+    except OperationalError:
+        # SQLite compilado sin FTS5: la búsqueda cae a coincidencia por subcadena.
+        logger.warning("SQLite sin FTS5; se omite el índice de búsqueda.")
+        return
+
+    for sentencia in SQL_TRIGGERS_TAREAS_FTS:
+        conn.exec_driver_sql(sentencia)
+    conn.exec_driver_sql("INSERT INTO tareas_fts(tareas_fts) VALUES ('rebuild')")
+
+
+MIGRACIONES: tuple[Migracion, ...] = (
+    Migracion(
+        version=1,
+        descripcion="Índices de tareas por estado y por fecha de creación",
+        sentencias=(
+            "CREATE INDEX IF NOT EXISTS ix_tareas_usuario_completada "
+            "ON tareas (id_usuario, completada)",
+            "CREATE INDEX IF NOT EXISTS ix_tareas_usuario_creada "
+            "ON tareas (id_usuario, creada_en)",
+        ),
+    ),
+    Migracion(
+        version=2,
+        descripcion="auto_vacuum=INCREMENTAL (requiere VACUUM para tomar efecto)",
+        sentencias=(
+            "PRAGMA auto_vacuum=INCREMENTAL",
+            "VACUUM",
+        ),
+        transaccional=False,
+    ),
+    Migracion(
+        version=3,
+        descripcion="ix_tareas_usuario_completada cubre también el orden por fecha",
+        sentencias=(
+            "DROP INDEX IF EXISTS ix_tareas_usuario_completada",
+            "CREATE INDEX IF NOT EXISTS ix_tareas_usuario_completada "
+            "ON tareas (id_usuario, completada, creada_en)",
+        ),
+    ),
+    Migracion(
+        version=4,
+        descripcion="Índice de tareas por título sin distinguir mayúsculas (HU10)",
+        sentencias=(
+            "CREATE INDEX IF NOT EXISTS ix_tareas_usuario_titulo_nocase "
+            "ON tareas (id_usuario, titulo COLLATE NOCASE)",
+        ),
+    ),
+    Migracion(
+        version=5,
+        descripcion="Búsqueda de texto completo (FTS5) sobre título y descripción",
+        aplicar=_crear_busqueda_fts,
+    ),
+    Migracion(
+        version=6,
+        descripcion="Registro de cambios de tareas con revisiones (change feed)",
+        sentencias=SQL_CAMBIOS_TAREAS,
+    ),
+)
+
+
+def version_actual(conn: Connection) -> int:
+    """Versión de esquema registrada en la BD (0 si nunca se migró)."""
+    return int(conn.exec_driver_sql("PRAGMA user_version").scalar() or 0)
+
+
+def aplicar_migraciones(
+    engine: Engine,
+    migraciones: Sequence[Migracion] = MIGRACIONES,
+) -> list[int]:
+    """
+    Aplica en orden las migraciones con versión mayor a `user_version`.
+
+    Devuelve las versiones aplicadas (lista vacía si el esquema estaba al día).
+    """
+    with engine.connect() as conn:
+        actual = version_actual(conn)
+
+    aplicadas: list[int] = []
+    for migracion in sorted(migraciones, key=lambda m: m.version):
+        if migracion.version <= actual:
+            continue
+
+        marcar_version = f"PRAGMA user_version={int(migracion.version)}"
+        with engine.connect() as conn:
+            if migracion.transaccional:
+                with conn.begin():
+                    migracion.ejecutar(conn)
+                    conn.exec_driver_sql(marcar_version)
+            else:
+                conn.execution_options(isolation_level="AUTOCOMMIT")
+                migracion.ejecutar(conn)
+                conn.exec_driver_sql(marcar_version)
+
+        aplicadas.append(migracion.version)
+
+    optimizar(engine, analizar=bool(aplicadas))
+    return aplicadas
+
+
+def optimizar(engine: Engine, *, analizar: bool = False) -> None:
+    """Actualiza estadísticas del planificador (ANALYZE) y ejecuta PRAGMA optimize."""
+    with engine.connect() as conn:
+        conn.execution_options(isolation_level="AUTOCOMMIT")
+        if analizar:
+            conn.exec_driver_sql("ANALYZE")
+        conn.exec_driver_sql("PRAGMA optimize")
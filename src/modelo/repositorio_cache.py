@@ -0,0 +1,330 @@
+# src/modelo/repositorio_cache.py
+"""
+Caché de lecturas por usuario delante de RepositorioTareasSQLite.
+
+Los listados, búsquedas y conteos de cada usuario se guardan en un LRU de
+`max_usuarios` usuarios, cada uno con un LRU de `max_entradas` resultados y
+caducidad `ttl_s`. Toda escritura que pasa por
+el caché (crear/editar/eliminar/marcar, individuales o en lote) descarta los
+resultados de ese usuario, así la siguiente lectura vuelve a SQLite. El resto
+de la interfaz (obtener_tarea, paginación, iter_tareas...) se delega tal cual.
+
+Solo es correcto si todas las escrituras pasan por esta instancia; las que
+se hagan por fuera requieren `limpiar_cache()`.
+
+Usage:
+    repo = RepositorioTareasCache(RepositorioTareasSQLite(), ttl_s=30)
+    manager = TaskManager(repositorio=repo)
+    print(repo.estadisticas().tasa_aciertos)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator
+
+from src.modelo.bd_model import Tarea
+from src.modelo.repositorio_tareas import (
+    LIMITE_BUSQUEDA_POR_DEFECTO,
+    ORDEN_FECHA,
+    TAMANO_LOTE_IDS,
+    TAMANO_LOTE_INSERCION,
+    EstadisticasTareas,
+    ItemLote,
+    OperacionEscritura,
+    RepositorioTareasSQLite,
+    ResultadoEscritura,
+    ResultadoLote,
+    ResultadoOperacion,
+    TareaLectura,
+)
+
+MAX_USUARIOS_CACHE = 32
+MAX_ENTRADAS_USUARIO = 64
+TTL_CACHE_S = 60.0
+
+
+@dataclass(frozen=True)
+class EstadisticasCache:
+    """Contadores del caché desde su creación."""
+
+    aciertos: int = 0
+    fallos: int = 0
+    desalojos: int = 0
+    caducadas: int = 0
+    usuarios: int = 0
+    entradas: int = 0
+
+    @property
+    def tasa_aciertos(self) -> float:
+        total = self.aciertos + self.fallos
+        return self.aciertos / total if total else 0.0
+
+
+class RepositorioTareasCache:
+    """
+    Decorador de RepositorioTareasSQLite con la misma interfaz.
+
+    - max_usuarios: usuarios con resultados en memoria; al superarlo se
+      desaloja el usuario usado hace más tiempo (con todas sus entradas).
+    - max_entradas: resultados guardados por usuario; cada consulta distinta
+      (p. ej. cada texto de búsqueda) es una entrada, y al superarlo se
+      desaloja la usada hace más tiempo.
+    - ttl_s: segundos de validez de cada resultado (None = sin caducidad).
+    - reloj: fuente de tiempo monotónica (inyectable en pruebas).
+    """
+
+    def __init__(
+        self,
+        repositorio: RepositorioTareasSQLite | None = None,
+        *,
+        max_usuarios: int = MAX_USUARIOS_CACHE,
+        max_entradas: int = MAX_ENTRADAS_USUARIO,
+        ttl_s: float | None = TTL_CACHE_S,
+        reloj: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_usuarios <= 0:
+            raise ValueError("max_usuarios debe ser mayor que 0.")
+        if max_entradas <= 0:
+            raise ValueError("max_entradas debe ser mayor que 0.")
+        if ttl_s is not None and ttl_s <= 0:
+            raise ValueError("ttl_s debe ser mayor que 0.")
+
+        self._repo = repositorio or RepositorioTareasSQLite()
+        self.max_usuarios = int(max_usuarios)
+        self.max_entradas = int(max_entradas)
+        self.ttl_s = ttl_s
+        self._reloj = reloj
+
+        # id_usuario -> {(método, argumentos): (expira_en, resultado)}
+        self._usuarios: OrderedDict[
+            int, OrderedDict[tuple, tuple[float, Any]]
+        ] = OrderedDict()
+        # Generación por usuario (y época global para limpiar_cache): una
+        # lectura que se cruzó con una escritura no guarda su resultado.
+        self._generaciones: dict[int, int] = {}
+        self._epoca = 0
+        self._aciertos = 0
+        self._fallos = 0
+        self._desalojos = 0
+        self._caducadas = 0
+        self._lock = threading.Lock()
+
+    def __getattr__(self, nombre: str) -> Any:
+        # Solo se invoca para atributos que esta clase no define.
+        return getattr(self._repo, nombre)
+
+    # ---------------- Lecturas cacheadas ----------------
+
+    def listar_tareas(self, id_usuario: int) -> list[Tarea]:
+        return self._leer("listar_tareas", id_usuario)
+
+    def listar_tareas_por_estado(
+        self,
+        id_usuario: int,
+        completada: bool,
+    ) -> list[Tarea]:
+        return self._leer("listar_tareas_por_estado", id_usuario, bool(completada))
+
+    def listar_tareas_ordenadas(
+        self,
+        id_usuario: int,
+        orden: str = ORDEN_FECHA,
+        completada: bool | None = None,
+    ) -> list[Tarea]:
+        return self._leer("listar_tareas_ordenadas", id_usuario, orden, completada)
+
+    def listar_tareas_lectura(
+        self,
+        id_usuario: int,
+        orden: str = ORDEN_FECHA,
+        completada: bool | None = None,
+    ) -> list[TareaLectura]:
+        return self._leer("listar_tareas_lectura", id_usuario, orden, completada)
+
+    def buscar_tareas(
+        self,
+        id_usuario: int,
+        consulta: str,
+        limite: int = LIMITE_BUSQUEDA_POR_DEFECTO,
+        completada: bool | None = None,
+    ) -> list[Tarea]:
+        return self._leer("buscar_tareas", id_usuario, consulta, limite, completada)
+
+    def contar_tareas(self, id_usuario: int) -> EstadisticasTareas:
+        return self._leer("contar_tareas", id_usuario)
+
+    # ---------------- Escrituras (invalidan al usuario) ----------------
+
+    def crear_tarea(
+        self,
+        id_usuario: int,
+        titulo: str,
+        descripcion: str | None = None,
+    ) -> tuple[Tarea | None, str]:
+        with self._invalidando(id_usuario):
+            return self._repo.crear_tarea(id_usuario, titulo, descripcion)
+
+    def crear_tareas_lote(
+        self,
+        id_usuario: int,
+        items: Iterable[ItemLote],
+        tamano_lote: int = TAMANO_LOTE_INSERCION,
+    ) -> ResultadoLote:
+        with self._invalidando(id_usuario):
+            return self._repo.crear_tareas_lote(id_usuario, items, tamano_lote)
+
+    def editar_tarea(
+        self,
+        id_usuario: int,
+        id_tarea: int,
+        nuevo_titulo: str,
+        nueva_descripcion: str | None = None,
+    ) -> ResultadoOperacion:
+        with self._invalidando(id_usuario):
+            return self._repo.editar_tarea(
+                id_usuario, id_tarea, nuevo_titulo, nueva_descripcion
+            )
+
+    def eliminar_tarea(self, id_usuario: int, id_tarea: int) -> ResultadoOperacion:
+        with self._invalidando(id_usuario):
+            return self._repo.eliminar_tarea(id_usuario, id_tarea)
+
+    def marcar_completada(
+        self,
+        id_usuario: int,
+        id_tarea: int,
+        completada: bool,
+    ) -> ResultadoOperacion:
+        with self._invalidando(id_usuario):
+            return self._repo.marcar_completada(id_usuario, id_tarea, completada)
+
+    def marcar_completadas_lote(
+        self,
+        id_usuario: int,
+        ids: Iterable[int],
+        completada: bool = True,
+        tamano_lote: int = TAMANO_LOTE_IDS,
+    ) -> int:
+        with self._invalidando(id_usuario):
+            return self._repo.marcar_completadas_lote(
+                id_usuario, ids, completada, tamano_lote
+            )
+
+    def eliminar_tareas_lote(
+        self,
+        id_usuario: int,
+        ids: Iterable[int],
+        tamano_lote: int = TAMANO_LOTE_IDS,
+    ) -> int:
+        with self._invalidando(id_usuario):
+            return self._repo.eliminar_tareas_lote(id_usuario, ids, tamano_lote)
+
+    def aplicar_operaciones(
+        self,
+        operaciones: Iterable[OperacionEscritura],
+    ) -> list[ResultadoEscritura]:
+        operaciones = list(operaciones)
+        try:
+            return self._repo.aplicar_operaciones(operaciones)
+        finally:
+            for id_usuario in {op.id_usuario for op in operaciones}:
+                self.invalidar_usuario(id_usuario)
+
+    # ---------------- Gestión del caché ----------------
+
+    def estadisticas(self) -> EstadisticasCache:
+        with self._lock:
+            return EstadisticasCache(
+                aciertos=self._aciertos,
+                fallos=self._fallos,
+                desalojos=self._desalojos,
+                caducadas=self._caducadas,
+                usuarios=len(self._usuarios),
+                entradas=sum(len(e) for e in self._usuarios.values()),
+            )
+
+    def invalidar_usuario(self, id_usuario: int) -> None:
+        """Descarta los resultados guardados de `id_usuario`."""
+        with self._lock:
+            self._invalidar(id_usuario)
+
+    def limpiar_cache(self) -> None:
+        """Vacía este caché y el de obtener_tarea del repositorio envuelto."""
+        with self._lock:
+            self._usuarios.clear()
+            self._epoca += 1
+        self._repo.limpiar_cache()
+
+    def _leer(self, metodo: str, id_usuario: int, *args) -> Any:
+        clave = (metodo, *args)
+        ahora = self._reloj()
+        with self._lock:
+            entradas = self._usuarios.get(id_usuario)
+            if entradas is not None:
+                self._usuarios.move_to_end(id_usuario)
+                guardado = entradas.get(clave)
+                if guardado is not None:
+                    expira_en, resultado = guardado
+                    if expira_en > ahora:
+                        entradas.move_to_end(clave)
+                        self._aciertos += 1
+                        return _copia(resultado)
+                    del entradas[clave]
+                    self._caducadas += 1
+            self._fallos += 1
+            generacion = self._generacion(id_usuario)
+
+        resultado = getattr(self._repo, metodo)(id_usuario, *args)
+
+        expira_en = ahora + self.ttl_s if self.ttl_s is not None else float("inf")
+        with self._lock:
+            if self._generacion(id_usuario) == generacion:
+                self._guardar(id_usuario, clave, (expira_en, resultado), ahora)
+        return _copia(resultado)
+
+    def _guardar(
+        self, id_usuario: int, clave: tuple, valor: tuple, ahora: float
+    ) -> None:
+        entradas = self._usuarios.setdefault(id_usuario, OrderedDict())
+        caducadas = [c for c, (expira_en, _r) in entradas.items() if expira_en <= ahora]
+        for c in caducadas:
+            del entradas[c]
+        self._caducadas += len(caducadas)
+
+        entradas[clave] = valor
+        entradas.move_to_end(clave)
+        while len(entradas) > self.max_entradas:
+            entradas.popitem(last=False)
+            self._desalojos += 1
+
+        self._usuarios.move_to_end(id_usuario)
+        while len(self._usuarios) > self.max_usuarios:
+            _id, desalojadas = self._usuarios.popitem(last=False)
+            self._desalojos += len(desalojadas)
+
+    def _generacion(self, id_usuario: int) -> tuple[int, int]:
+        return self._epoca, self._generaciones.get(id_usuario, 0)
+
+    def _invalidar(self, id_usuario: int) -> None:
+        self._usuarios.pop(id_usuario, None)
+        self._generaciones[id_usuario] = self._generaciones.get(id_usuario, 0) + 1
+
+    @contextmanager
+    def _invalidando(self, id_usuario: int) -> Iterator[None]:
+        # Se invalida al terminar (también si falla): las lecturas que se
+        # crucen con la escritura ven otra generación y no guardan nada.
+        try:
+            yield
+        finally:
+            self.invalidar_usuario(id_usuario)
+
+
+def _copia(resultado: Any) -> Any:
+    # Las listas se copian para que quien llama pueda modificarlas sin
+    # alterar lo guardado; los demás resultados son inmutables.
+    return list(resultado) if isinstance(resultado, list) else resultado
@@ -0,0 +1,555 @@
+# src/modelo/repositorio_memoria.py
+"""
+Repositorio de tareas en memoria, sin SQLite.
+
+Misma interfaz, reglas y mensajes que RepositorioTareasSQLite, pensado para
+benchmarks de lógica/UI (aísla el costo de Python y Qt del de la BD) y para
+un modo demo sin E/S. Las filas se guardan como TareaLectura en un dict por
+id_tarea, con índices por usuario:
+
+- por fecha: lista ordenada de (creada_en, id_tarea) -> orden "fecha".
+- por nombre: lista ordenada de (titulo NOCASE, id_tarea) -> orden "nombre".
+- por estado: conjuntos de ids pendientes / completadas.
+- por título: título exacto -> id_tarea (restricción de duplicados).
+- cambios: id_tarea -> (revisión, eliminada), en orden de revisión.
+
+Los listados y las búsquedas devuelven entidades Tarea nuevas (no
+asociadas a ninguna sesión) en cada llamada, como el repositorio SQLite.
+
+Usage:
+    repo = RepositorioTareasMemoria()
+    id_usuario = repo.agregar_usuario()
+    manager = TaskManager(repositorio=repo)
+"""
+
+from __future__ import annotations
+
+import string
+import threading
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+from typing import Iterable, Iterator
+
+from src.modelo.bd_model import Tarea
+from src.modelo.repositorio_tareas import (
+    LIMITE_BUSQUEDA_POR_DEFECTO,
+    LIMITE_PAGINA_POR_DEFECTO,
+    MSG_CURSOR_INVALIDO,
+    MSG_ESTADO_ACTUALIZADO,
+    MSG_TAREA_ACTUALIZADA,
+    MSG_TAREA_CREADA,
+    MSG_TAREA_ELIMINADA,
+    MSG_TAREA_NO_EXISTE,
+    MSG_TITULO_DUPLICADO,
+    MSG_TITULO_VACIO,
+    MSG_USUARIO_NO_EXISTE,
+    ORDEN_FECHA,
+    ORDEN_NOMBRE,
+    OP_CREAR,
+    OP_EDITAR,
+    OP_MARCAR,
+    OPERACIONES,
+    TAMANO_LOTE_IDS,
+    TAMANO_LOTE_INSERCION,
+    TAMANO_LOTE_ITERACION,
+    EstadisticasTareas,
+    ItemLote,
+    OperacionEscritura,
+    PaginaTareas,
+    ResultadoFilaLote,
+    ResultadoLote,
+    ResultadoEscritura,
+    ResultadoOperacion,
+    CambiosTareas,
+    TareaLectura,
+    _codificar_cursor,
+    _decodificar_cursor,
+    normalizar_descripcion,
+    normalizar_orden,
+    normalizar_titulo,
+)
+
+# COLLATE NOCASE de SQLite: solo pliega mayúsculas ASCII.
+_NOCASE = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+def _clave_nombre(titulo: str) -> str:
+    return titulo.translate(_NOCASE)
+
+
+def _ahora() -> datetime:
+    # Igual que datetime('now','localtime'): hora local, sin microsegundos.
+    return datetime.now().replace(microsecond=0)
+
+
+def _a_entidad(fila: TareaLectura) -> Tarea:
+    return Tarea(**fila._asdict())
+
+
+class RepositorioTareasMemoria:
+    """Implementación en memoria (dicts + índices ordenados con bisect)."""
+
+    def __init__(self, usuarios: Iterable[int] = ()) -> None:
+        self._lock = threading.RLock()
+        self._usuarios: set[int] = set()
+        self._siguiente_usuario = 1
+        self._siguiente_tarea = 1
+
+        self._tareas: dict[int, TareaLectura] = {}
+        self._por_fecha: dict[int, list[tuple[datetime, int]]] = {}
+        self._por_nombre: dict[int, list[tuple[str, int]]] = {}
+        self._por_estado: dict[tuple[int, bool], set[int]] = {}
+        self._por_titulo: dict[int, dict[str, int]] = {}
+        # Como tareas_cambios: la última revisión de cada tarea por usuario.
+        # Reinsertar al final mantiene cada dict ordenado por revisión.
+        self._cambios: dict[int, dict[int, tuple[int, bool]]] = {}
+        self._revision = 0
+
+        for id_usuario in usuarios:
+            self.agregar_usuario(id_usuario)
+
+    def agregar_usuario(self, id_usuario: int | None = None) -> int:
+        """Registra un usuario (id automático si es None) y devuelve su id."""
+        with self._lock:
+            if id_usuario is None:
+                id_usuario = self._siguiente_usuario
+            id_usuario = int(id_usuario)
+            self._usuarios.add(id_usuario)
+            self._siguiente_usuario = max(self._siguiente_usuario, id_usuario + 1)
+            return id_usuario
+
+    # ---------------- Escrituras ----------------
+
+    def crear_tarea(
+        self,
+        id_usuario: int,
+        titulo: str,
+        descripcion: str | None = None,
+    ) -> tuple[Tarea | None, str]:
+        titulo = normalizar_titulo(titulo)
+        descripcion = normalizar_descripcion(descripcion)
+
+        if not titulo:
+            return None, MSG_TITULO_VACIO
+
+        with self._lock:
+            if id_usuario not in self._usuarios:
+                return None, MSG_USUARIO_NO_EXISTE
+            if titulo in self._por_titulo.get(id_usuario, {}):
+                return None, MSG_TITULO_DUPLICADO
+            fila = self._insertar(id_usuario, titulo, descripcion)
+
+        return _a_entidad(fila), MSG_TAREA_CREADA
+
+    def crear_tareas_lote(
+        self,
+        id_usuario: int,
+        items: Iterable[ItemLote],
+        tamano_lote: int = TAMANO_LOTE_INSERCION,
+    ) -> ResultadoLote:
+        """Mismas reglas por fila que RepositorioTareasSQLite.crear_tareas_lote."""
+        if tamano_lote <= 0:
+            raise ValueError("tamano_lote debe ser mayor que 0.")
+
+        filas: list[ResultadoFilaLote] = []
+        vistos: set[str] = set()
+        with self._lock:
+            usuario_existe = id_usuario in self._usuarios
+            for indice, item in enumerate(items):
+                titulo, descripcion = (item, None) if isinstance(item, str) else item
+                titulo = normalizar_titulo(titulo)
+                if not titulo:
+                    mensaje = MSG_TITULO_VACIO
+                elif titulo in vistos:
+                    mensaje = MSG_TITULO_DUPLICADO
+                elif not usuario_existe:
+                    vistos.add(titulo)
+                    mensaje = MSG_USUARIO_NO_EXISTE
+                elif titulo in self._por_titulo.get(id_usuario, ()):
+                    vistos.add(titulo)
+                    mensaje = MSG_TITULO_DUPLICADO
+                else:
+                    vistos.add(titulo)
+                    fila = self._insertar(
+                        id_usuario, titulo, normalizar_descripcion(descripcion)
+                    )
+                    filas.append(
+                        ResultadoFilaLote(
+                            indice, titulo, True, MSG_TAREA_CREADA, fila.id_tarea
+                        )
+                    )
+                    continue
+                filas.append(ResultadoFilaLote(indice, titulo, False, mensaje))
+
+        return ResultadoLote(tuple(filas))
+
+    def editar_tarea(
+        self,
+        id_usuario: int,
+        id_tarea: int,
+        nuevo_titulo: str,
+        nueva_descripcion: str | None = None,
+    ) -> ResultadoOperacion:
+        nuevo_titulo = normalizar_titulo(nuevo_titulo)
+        nueva_descripcion = normalizar_descripcion(nueva_descripcion)
+
+        if not nuevo_titulo:
+            return ResultadoOperacion(False, MSG_TITULO_VACIO)
+
+        with self._lock:
+            fila = self._fila_del_usuario(id_usuario, id_tarea)
+            if fila is None:
+                return ResultadoOperacion(False, MSG_TAREA_NO_EXISTE)
+            otra = self._por_titulo[id_usuario].get(nuevo_titulo)
+            if otra is not None and otra != id_tarea:
+                return ResultadoOperacion(False, MSG_TITULO_DUPLICADO)
+
+            # En el sitio: reinsertar en _tareas rompería el orden por id.
+            self._tareas[id_tarea] = fila._replace(
+                titulo=nuevo_titulo,
+                descripcion=nueva_descripcion,
+                actualizada_en=_ahora(),
+            )
+            if nuevo_titulo != fila.titulo:
+                nombres = self._por_nombre[id_usuario]
+                _quitar_ordenado(nombres, (_clave_nombre(fila.titulo), id_tarea))
+                insort(nombres, (_clave_nombre(nuevo_titulo), id_tarea))
+                titulos = self._por_titulo[id_usuario]
+                del titulos[fila.titulo]
+                titulos[nuevo_titulo] = id_tarea
+            self._registrar_cambio(id_usuario, id_tarea, False)
+        return ResultadoOperacion(True, MSG_TAREA_ACTUALIZADA)
+
+    def eliminar_tarea(self, id_usuario: int, id_tarea: int) -> ResultadoOperacion:
+        with self._lock:
+            fila = self._fila_del_usuario(id_usuario, id_tarea)
+            if fila is None:
+                return ResultadoOperacion(False, MSG_TAREA_NO_EXISTE)
+            self._quitar_de_indices(fila)
+        return ResultadoOperacion(True, MSG_TAREA_ELIMINADA)
+
+    def marcar_completada(
+        self,
+        id_usuario: int,
+        id_tarea: int,
+        completada: bool,
+    ) -> ResultadoOperacion:
+        with self._lock:
+            if not self._marcar(id_usuario, id_tarea, bool(completada)):
+                return ResultadoOperacion(False, MSG_TAREA_NO_EXISTE)
+        return ResultadoOperacion(True, MSG_ESTADO_ACTUALIZADO)
+
+    def marcar_completadas_lote(
+        self,
+        id_usuario: int,
+        ids: Iterable[int],
+        completada: bool = True,
+        tamano_lote: int = TAMANO_LOTE_IDS,
+    ) -> int:
+        if tamano_lote <= 0:
+            raise ValueError("tamano_lote debe ser mayor que 0.")
+        with self._lock:
+            return sum(
+                self._marcar(id_usuario, id_tarea, bool(completada))
+                for id_tarea in {int(i) for i in ids}
+            )
+
+    def eliminar_tareas_lote(
+        self,
+        id_usuario: int,
+        ids: Iterable[int],
+        tamano_lote: int = TAMANO_LOTE_IDS,
+    ) -> int:
+        if tamano_lote <= 0:
+            raise ValueError("tamano_lote debe ser mayor que 0.")
+        eliminadas = 0
+        with self._lock:
+            for id_tarea in {int(i) for i in ids}:
+                fila = self._fila_del_usuario(id_usuario, id_tarea)
+                if fila is not None:
+                    self._quitar_de_indices(fila)
+                    eliminadas += 1
+        return eliminadas
+
+    def aplicar_operaciones(
+        self,
+        operaciones: Iterable[OperacionEscritura],
+    ) -> list[ResultadoEscritura]:
+        """Aplica las escrituras en orden, sin que otras se intercalen."""
+        operaciones = list(operaciones)
+        for op in operaciones:
+            if op.tipo not in OPERACIONES:
+                raise ValueError(f"Operación no soportada: {op.tipo!r}.")
+        with self._lock:
+            return [self._aplicar(op) for op in operaciones]
+
+    def _aplicar(self, op: OperacionEscritura) -> ResultadoEscritura:
+        if op.tipo == OP_CREAR:
+            return self.crear_tarea(op.id_usuario, op.titulo, op.descripcion)
+        if op.tipo == OP_EDITAR:
+            return self.editar_tarea(
+                op.id_usuario, op.id_tarea, op.titulo, op.descripcion
+            )
+        if op.tipo == OP_MARCAR:
+            return self.marcar_completada(op.id_usuario, op.id_tarea, op.completada)
+        return self.eliminar_tarea(op.id_usuario, op.id_tarea)  # OP_ELIMINAR
+
+    # ---------------- Lecturas ----------------
+
+    def obtener_tarea(self, id_usuario: int, id_tarea: int) -> Tarea | None:
+        with self._lock:
+            fila = self._fila_del_usuario(id_usuario, id_tarea)
+        return _a_entidad(fila) if fila is not None else None
+
+    def listar_tareas(self, id_usuario: int) -> list[Tarea]:
+        return self.listar_tareas_ordenadas(id_usuario)
+
+    def listar_tareas_por_estado(
+        self,
+        id_usuario: int,
+        completada: bool,
+    ) -> list[Tarea]:
+        return self.listar_tareas_ordenadas(id_usuario, completada=completada)
+
+    def listar_tareas_ordenadas(
+        self,
+        id_usuario: int,
+        orden: str = ORDEN_FECHA,
+        completada: bool | None = None,
+    ) -> list[Tarea]:
+        filas = self.listar_tareas_lectura(id_usuario, orden, completada)
+        return [_a_entidad(fila) for fila in filas]
+
+    def listar_tareas_lectura(
+        self,
+        id_usuario: int,
+        orden: str = ORDEN_FECHA,
+        completada: bool | None = None,
+    ) -> list[TareaLectura]:
+        orden = normalizar_orden(orden)
+        with self._lock:
+            return list(self._recorrer(id_usuario, orden, completada))
+
+    def iter_tareas(
+        self,
+        id_usuario: int | None = None,
+        tamano_lote: int = TAMANO_LOTE_ITERACION,
+    ) -> Iterator[TareaLectura]:
+        """Tareas en orden de id_tarea (instantánea tomada al llamar)."""
+        if tamano_lote <= 0:
+            raise ValueError("tamano_lote debe ser mayor que 0.")
+        with self._lock:
+            # Los ids son crecientes: el orden de inserción del dict es el de id.
+            filas = [
+                fila
+                for fila in self._tareas.values()
+                if id_usuario is None or fila.id_usuario == id_usuario
+            ]
+        return iter(filas)
+
+    def listar_tareas_pagina(
+        self,
+        id_usuario: int,
+        limite: int = LIMITE_PAGINA_POR_DEFECTO,
+        cursor: str | None = None,
+        *,
+        orden: str = ORDEN_FECHA,
+        completada: bool | None = None,
+    ) -> PaginaTareas:
+        """Página por keyset con la misma semántica de cursor que SQLite."""
+        if limite <= 0:
+            raise ValueError("limite debe ser mayor que 0.")
+        orden = normalizar_orden(orden)
+
+        desde = None
+        if cursor is not None:
+            orden_cursor, clave, id_tarea = _decodificar_cursor(cursor, 3)
+            if orden_cursor != orden:
+                raise ValueError(MSG_CURSOR_INVALIDO)
+            try:
+                if orden == ORDEN_NOMBRE:
+                    desde = (_clave_nombre(str(clave)), int(id_tarea))
+                else:
+                    desde = (datetime.fromisoformat(str(clave)), int(id_tarea))
+            except ValueError as exc:
+                raise ValueError(MSG_CURSOR_INVALIDO) from exc
+
+        filas: list[TareaLectura] = []
+        with self._lock:
+            for fila in self._recorrer(id_usuario, orden, completada, desde):
+                filas.append(fila)
+                if len(filas) > limite:
+                    break
+
+        siguiente = None
+        if len(filas) > limite:
+            filas = filas[:limite]
+            ultima = filas[-1]
+            clave = (
+                ultima.titulo
+                if orden == ORDEN_NOMBRE
+                else ultima.creada_en.isoformat(sep=" ")
+            )
+            siguiente = _codificar_cursor(orden, clave, ultima.id_tarea)
+
+        return PaginaTareas([_a_entidad(fila) for fila in filas], siguiente)
+
+    def cambios_desde(self, id_usuario: int, revision: int = 0) -> CambiosTareas:
+        """Recorre el registro del usuario desde el final hasta `revision`."""
+        if revision < 0:
+            raise ValueError("revision no puede ser negativa.")
+
+        recientes: list[tuple[int, bool, int]] = []
+        with self._lock:
+            for id_tarea, (rev, eliminada) in reversed(
+                self._cambios.get(id_usuario, {}).items()
+            ):
+                if rev <= revision:
+                    break
+                recientes.append((rev, eliminada, id_tarea))
+            recientes.reverse()
+            tareas = [
+                self._tareas[id_tarea]
+                for _rev, eliminada, id_tarea in recientes
+                if not eliminada
+            ]
+        eliminadas = [id_tarea for _rev, eliminada, id_tarea in recientes if eliminada]
+        ultima = recientes[-1][0] if recientes else revision
+        return CambiosTareas(ultima, tareas, eliminadas)
+
+    def contar_tareas(self, id_usuario: int) -> EstadisticasTareas:
+        with self._lock:
+            return EstadisticasTareas(
+                pendientes=len(self._por_estado.get((id_usuario, False), ())),
+                completadas=len(self._por_estado.get((id_usuario, True), ())),
+            )
+
+    def buscar_tareas(
+        self,
+        id_usuario: int,
+        consulta: str,
+        limite: int = LIMITE_BUSQUEDA_POR_DEFECTO,
+        completada: bool | None = None,
+    ) -> list[Tarea]:
+        """Subcadena sin distinguir mayúsculas, en orden por fecha (sin FTS5)."""
+        texto = (consulta or "").strip().lower()
+        if not texto or limite <= 0:
+            return []
+
+        encontradas: list[Tarea] = []
+        with self._lock:
+            for fila in self._recorrer(id_usuario, ORDEN_FECHA, completada):
+                if (
+                    texto in fila.titulo.lower()
+                    or texto in (fila.descripcion or "").lower()
+                ):
+                    encontradas.append(_a_entidad(fila))
+                    if len(encontradas) >= limite:
+                        break
+        return encontradas
+
+    def limpiar_cache(self) -> None:
+        """Sin caché que limpiar; existe por compatibilidad de interfaz."""
+
+    # ---------------- Índices ----------------
+
+    def _recorrer(
+        self,
+        id_usuario: int,
+        orden: str,
+        completada: bool | None,
+        desde: tuple | None = None,
+    ) -> Iterator[TareaLectura]:
+        """Filas del usuario en `orden`, estrictamente después de `desde`."""
+        if orden == ORDEN_NOMBRE:
+            indice = self._por_nombre.get(id_usuario, [])
+            inicio = bisect_right(indice, desde) if desde is not None else 0
+            claves = indice[inicio:]
+        else:
+            indice = self._por_fecha.get(id_usuario, [])
+            fin = bisect_left(indice, desde) if desde is not None else len(indice)
+            claves = reversed(indice[:fin])
+
+        estado = (
+            self._por_estado.get((id_usuario, bool(completada)), set())
+            if completada is not None
+            else None
+        )
+        for _clave, id_tarea in claves:
+            if estado is None or id_tarea in estado:
+                yield self._tareas[id_tarea]
+
+    def _fila_del_usuario(self, id_usuario: int, id_tarea: int) -> TareaLectura | None:
+        fila = self._tareas.get(id_tarea)
+        return fila if fila is not None and fila.id_usuario == id_usuario else None
+
+    def _insertar(
+        self,
+        id_usuario: int,
+        titulo: str,
+        descripcion: str | None,
+    ) -> TareaLectura:
+        ahora = _ahora()
+        fila = TareaLectura(
+            id_tarea=self._siguiente_tarea,
+            id_usuario=id_usuario,
+            titulo=titulo,
+            descripcion=descripcion,
+            completada=False,
+            creada_en=ahora,
+            actualizada_en=ahora,
+        )
+        self._siguiente_tarea += 1
+        self._agregar_a_indices(fila)
+        return fila
+
+    def _marcar(self, id_usuario: int, id_tarea: int, completada: bool) -> bool:
+        fila = self._fila_del_usuario(id_usuario, id_tarea)
+        if fila is None:
+            return False
+        self._por_estado[(id_usuario, fila.completada)].discard(id_tarea)
+        fila = fila._replace(completada=completada, actualizada_en=_ahora())
+        self._tareas[id_tarea] = fila
+        self._por_estado.setdefault((id_usuario, completada), set()).add(id_tarea)
+        self._registrar_cambio(id_usuario, id_tarea, False)
+        return True
+
+    def _agregar_a_indices(self, fila: TareaLectura) -> None:
+        id_usuario, id_tarea = fila.id_usuario, fila.id_tarea
+        self._tareas[id_tarea] = fila
+        insort(self._por_fecha.setdefault(id_usuario, []), (fila.creada_en, id_tarea))
+        insort(
+            self._por_nombre.setdefault(id_usuario, []),
+            (_clave_nombre(fila.titulo), id_tarea),
+        )
+        self._por_estado.setdefault((id_usuario, fila.completada), set()).add(id_tarea)
+        self._por_titulo.setdefault(id_usuario, {})[fila.titulo] = id_tarea
+        self._registrar_cambio(id_usuario, id_tarea, False)
+
+    def _quitar_de_indices(self, fila: TareaLectura) -> None:
+        id_usuario, id_tarea = fila.id_usuario, fila.id_tarea
+        del self._tareas[id_tarea]
+        _quitar_ordenado(self._por_fecha[id_usuario], (fila.creada_en, id_tarea))
+        _quitar_ordenado(
+            self._por_nombre[id_usuario], (_clave_nombre(fila.titulo), id_tarea)
+        )
+        self._por_estado[(id_usuario, fila.completada)].discard(id_tarea)
+        del self._por_titulo[id_usuario][fila.titulo]
+        self._registrar_cambio(id_usuario, id_tarea, True)
+
+    def _registrar_cambio(
+        self,
+        id_usuario: int,
+        id_tarea: int,
+        eliminada: bool,
+    ) -> None:
+        self._revision += 1
+        cambios = self._cambios.setdefault(id_usuario, {})
+        cambios.pop(id_tarea, None)
+        cambios[id_tarea] = (self._revision, eliminada)
+
+
+def _quitar_ordenado(indice: list, clave: tuple) -> None:
+    posicion = bisect_left(indice, clave)
+    if posicion < len(indice) and indice[posicion] == clave:
+        del indice[posicion]
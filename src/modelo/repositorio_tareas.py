@@ -1,19 +1,75 @@
 # src/modelo/repositorio_tareas.py
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional
+import base64
+import json
+import operator
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
+from typing import Iterable, Iterator, NamedTuple, Optional, Union
 
-from sqlalchemy import select
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Integer,
+    MetaData,
+    Select,
+    String,
+    Table,
+    Text,
+    bindparam,
+    delete,
+    func,
+    literal_column,
+    select,
+    text,
+    tuple_,
+    type_coerce,
+    update,
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import sessionmaker
 
 from src.modelo.bd_model import Tarea, Usuario
 
 try:
-    from src.modelo.conexion import SessionLocal  # type: ignore
+    from src.modelo.conexion import SessionLectura, SessionLocal  # type: ignore
 except ImportError:  # pragma: no cover
     SessionLocal = None  # type: ignore
+    SessionLectura = None  # type: ignore
+
+
+MSG_TITULO_VACIO = "El título no puede estar vacío."
+MSG_USUARIO_NO_EXISTE = "El usuario no existe."
+MSG_TITULO_DUPLICADO = "Ya existe una tarea con ese título para este usuario."
+MSG_TAREA_NO_EXISTE = "La tarea no existe."
+MSG_TAREA_CREADA = "Tarea creada correctamente."
+MSG_TAREA_ACTUALIZADA = "Tarea actualizada correctamente."
+MSG_TAREA_ELIMINADA = "Tarea eliminada correctamente."
+MSG_ESTADO_ACTUALIZADO = "Estado actualizado correctamente."
+MSG_CURSOR_INVALIDO = "Cursor de paginación inválido."
+
+LIMITE_PAGINA_POR_DEFECTO = 50
+LIMITE_BUSQUEDA_POR_DEFECTO = 100
+TAMANO_LOTE_INSERCION = 500
+TAMANO_LOTE_IDS = 500  # muy por debajo del límite de variables de SQLite
+TAMANO_LOTE_ITERACION = 1000
+TAMANO_CACHE_TAREAS = 256
+
+ORDEN_FECHA = "fecha"
+ORDEN_NOMBRE = "nombre"
+ORDENES = (ORDEN_FECHA, ORDEN_NOMBRE)
+
+OP_CREAR = "crear"
+OP_EDITAR = "editar"
+OP_ELIMINAR = "eliminar"
+OP_MARCAR = "marcar"
+OPERACIONES = (OP_CREAR, OP_EDITAR, OP_ELIMINAR, OP_MARCAR)
 
 
 @dataclass(frozen=True)
@@ -24,6 +80,391 @@ class ResultadoOperacion:
     mensaje: str = ""
 
 
+@dataclass(frozen=True)
+class PaginaTareas:
+    """Una página del listado; `siguiente_cursor` es None en la última."""
+
+    tareas: list[Tarea] = field(default_factory=list)
+    siguiente_cursor: str | None = None
+
+    @property
+    def hay_mas(self) -> bool:
+        return self.siguiente_cursor is not None
+
+
+@dataclass(frozen=True)
+class ResultadoFilaLote:
+    """Resultado de un elemento de `crear_tareas_lote` (indice = posición)."""
+
+    indice: int
+    titulo: str
+    ok: bool
+    mensaje: str = ""
+    id_tarea: int | None = None
+
+
+@dataclass(frozen=True)
+class ResultadoLote:
+    """Resultado por fila de una creación en lote."""
+
+    filas: tuple[ResultadoFilaLote, ...] = ()
+
+    @property
+    def creadas(self) -> int:
+        return sum(1 for fila in self.filas if fila.ok)
+
+    @property
+    def fallidas(self) -> tuple[ResultadoFilaLote, ...]:
+        return tuple(fila for fila in self.filas if not fila.ok)
+
+
+ItemLote = Union[str, tuple[str, Optional[str]]]
+"""Elemento de un lote: título, o (título, descripción)."""
+
+
+@dataclass(frozen=True)
+class EstadisticasTareas:
+    """Contadores de las tarjetas del dashboard."""
+
+    pendientes: int = 0
+    completadas: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.pendientes + self.completadas
+
+
+@dataclass(frozen=True)
+class OperacionEscritura:
+    """
+    Escritura diferida para `aplicar_operaciones` (ver ColaEscrituraTareas).
+
+    OP_CREAR usa titulo/descripcion; OP_EDITAR, id_tarea/titulo/descripcion;
+    OP_MARCAR, id_tarea/completada; OP_ELIMINAR, id_tarea.
+    """
+
+    tipo: str
+    id_usuario: int
+    id_tarea: int | None = None
+    titulo: str | None = None
+    descripcion: str | None = None
+    completada: bool = False
+
+
+@dataclass(frozen=True)
+class CambiosTareas:
+    """
+    Delta de `cambios_desde`: tareas creadas o modificadas (estado actual) e
+    ids eliminados. `revision` es la que se pasa en la siguiente consulta.
+    """
+
+    revision: int
+    tareas: list[TareaLectura] = field(default_factory=list)
+    eliminadas: list[int] = field(default_factory=list)
+
+    @property
+    def hay_cambios(self) -> bool:
+        return bool(self.tareas or self.eliminadas)
+
+
+ResultadoEscritura = Union[tuple[Optional[Tarea], str], ResultadoOperacion]
+"""(tarea, mensaje) para OP_CREAR; ResultadoOperacion para el resto."""
+
+
+class TareaLectura(NamedTuple):
+    """
+    Fila de solo lectura para listados (mismos atributos que Tarea).
+
+    Sin estado ORM ni entrada en el identity map: una tupla inmutable con
+    `__slots__ = ()`. NamedTuple en lugar de dataclass(frozen, slots) porque
+    se construye sin un `object.__setattr__` por campo (~6x más rápido).
+    """
+
+    id_tarea: int
+    id_usuario: int
+    titulo: str
+    descripcion: str | None
+    completada: bool
+    creada_en: datetime
+    actualizada_en: datetime
+
+
+# Columnas de la tabla (no atributos ORM) en el orden de los campos del DTO.
+COLUMNAS_LECTURA = tuple(Tarea.__table__.c[campo] for campo in TareaLectura._fields)
+
+
+# Sentencias de las rutas calientes: se construyen una sola vez con parámetros
+# ligados, así cada llamada reutiliza la clave de caché memoizada y el SQL
+# compilado (compiled cache de SQLAlchemy) sin reconstruir el select().
+
+
+@lru_cache(maxsize=None)
+def stmt_listado(
+    orden: str = ORDEN_FECHA,
+    *,
+    por_estado: bool = False,
+    paginado: bool = False,
+    desde_cursor: bool = False,
+    columnas: bool = False,
+) -> Select:
+    """
+    Listado de tareas del usuario; una sentencia constante por combinación.
+
+    - orden "fecha": creada_en desc, id_tarea desc (ix_tareas_usuario_creada o
+      ix_tareas_usuario_completada si `por_estado`).
+    - orden "nombre": titulo COLLATE NOCASE, id_tarea
+      (ix_tareas_usuario_titulo_nocase).
+
+    Parámetros: id_usuario; completada (por_estado); limite (paginado);
+    cursor_clave y cursor_id_tarea (desde_cursor). Las sentencias paginadas
+    agregan la columna `clave_cursor` con el valor crudo de la clave de orden
+    (creada_en como texto: el valor por defecto del servidor no lleva
+    microsegundos y un datetime ligado sí). Con `columnas` se seleccionan
+    COLUMNAS_LECTURA en lugar de la entidad Tarea.
+    """
+    if orden == ORDEN_NOMBRE:
+        clave = Tarea.titulo.collate("NOCASE")
+        cruda = Tarea.titulo
+        orden_por = (clave.asc(), Tarea.id_tarea.asc())
+        despues, despues_o_igual = operator.gt, operator.ge
+    else:
+        clave = Tarea.creada_en
+        cruda = type_coerce(Tarea.creada_en, String)
+        orden_por = (clave.desc(), Tarea.id_tarea.desc())
+        despues, despues_o_igual = operator.lt, operator.le
+
+    stmt = select(*COLUMNAS_LECTURA) if columnas else select(Tarea)
+    stmt = stmt.where(Tarea.id_usuario == bindparam("id_usuario"))
+    if por_estado:
+        stmt = stmt.where(Tarea.completada == bindparam("completada"))
+    if desde_cursor:
+        cursor_clave = bindparam("cursor_clave", type_=String)
+        # La primera condición acota el rango del índice; la comparación de
+        # filas desempata por id_tarea.
+        stmt = stmt.where(
+            despues_o_igual(clave, cursor_clave),
+            despues(
+                tuple_(clave, Tarea.id_tarea),
+                tuple_(cursor_clave, bindparam("cursor_id_tarea")),
+            ),
+        )
+    if paginado:
+        stmt = stmt.add_columns(cruda.label("clave_cursor"))
+        stmt = stmt.limit(bindparam("limite"))
+    return stmt.order_by(*orden_por)
+
+
+STMT_LISTAR_TAREAS: Select = stmt_listado(ORDEN_FECHA)
+"""Tareas del usuario, más recientes primero. Parámetros: id_usuario."""
+
+STMT_LISTAR_TAREAS_POR_ESTADO: Select = stmt_listado(ORDEN_FECHA, por_estado=True)
+"""HU08 sobre ix_tareas_usuario_completada. Parámetros: id_usuario, completada."""
+
+STMT_CONTAR_TAREAS: Select = (
+    select(Tarea.completada, func.count())
+    .where(Tarea.id_usuario == bindparam("id_usuario"))
+    .group_by(Tarea.completada)
+)
+"""Tareas por estado; solo lee ix_tareas_usuario_completada. Parámetros: id_usuario."""
+
+# Recorridos completos (iter_tareas) por keyset sobre la clave primaria: cada
+# lote es un rango de id_tarea (de la tabla o de ix_tareas_id_usuario), sin
+# ordenar en memoria ni mantener un cursor abierto entre lotes.
+STMT_ITERAR_TAREAS: Select = (
+    select(*COLUMNAS_LECTURA)
+    .where(Tarea.id_tarea > bindparam("ultimo"))
+    .order_by(Tarea.id_tarea)
+    .limit(bindparam("tamano_lote"))
+)
+"""Siguiente lote de todas las tareas. Parámetros: ultimo, tamano_lote."""
+
+STMT_ITERAR_TAREAS_USUARIO: Select = STMT_ITERAR_TAREAS.where(
+    Tarea.id_usuario == bindparam("id_usuario")
+)
+"""Siguiente lote de un usuario. Parámetros: id_usuario, ultimo, tamano_lote."""
+
+# Inserción en lote: los títulos que chocan con uq_tareas_usuario_titulo se
+# omiten (no abortan el lote) y RETURNING dice cuáles se insertaron.
+STMT_INSERTAR_TAREAS_LOTE = (
+    sqlite_insert(Tarea.__table__)
+    .on_conflict_do_nothing(index_elements=["id_usuario", "titulo"])
+    .returning(Tarea.id_tarea, Tarea.titulo)
+)
+
+# Operaciones por conjunto de ids (Core, sin cargar entidades). `ids` se
+# expande a IN (?, ?, ...) y actualizada_en lo mantiene el onupdate de la
+# columna. En UPDATE los nombres de columna están reservados para SET, por
+# eso los parámetros se llaman `usuario` / `estado`.
+_TAREAS_DEL_USUARIO_POR_IDS = (
+    Tarea.id_usuario == bindparam("usuario"),
+    Tarea.id_tarea.in_(bindparam("ids", expanding=True)),
+)
+
+STMT_MARCAR_TAREAS_LOTE = (
+    update(Tarea.__table__)
+    .where(*_TAREAS_DEL_USUARIO_POR_IDS)
+    .values(completada=bindparam("estado"))
+)
+"""Parámetros: usuario, ids, estado."""
+
+STMT_ELIMINAR_TAREAS_LOTE = delete(Tarea.__table__).where(*_TAREAS_DEL_USUARIO_POR_IDS)
+"""Parámetros: usuario, ids."""
+
+# Escrituras de una tarea: una sola sentencia por (id_usuario, id_tarea); si
+# rowcount es 0 la tarea no existe o no es del usuario.
+_TAREA_DEL_USUARIO = (
+    Tarea.id_usuario == bindparam("usuario"),
+    Tarea.id_tarea == bindparam("tarea"),
+)
+
+STMT_EDITAR_TAREA = (
+    update(Tarea.__table__)
+    .where(*_TAREA_DEL_USUARIO)
+    .values(
+        titulo=bindparam("titulo_nuevo"),
+        descripcion=bindparam("descripcion_nueva"),
+    )
+)
+"""Parámetros: usuario, tarea, titulo_nuevo, descripcion_nueva."""
+
+STMT_MARCAR_TAREA = (
+    update(Tarea.__table__)
+    .where(*_TAREA_DEL_USUARIO)
+    .values(completada=bindparam("estado"))
+)
+"""Parámetros: usuario, tarea, estado."""
+
+STMT_ELIMINAR_TAREA = delete(Tarea.__table__).where(*_TAREA_DEL_USUARIO)
+"""Parámetros: usuario, tarea."""
+
+
+# Búsqueda de texto completo (migración 5). tareas_fts no forma parte de
+# Base.metadata: la crea la migración como tabla virtual FTS5.
+TABLA_FTS = "tareas_fts"
+PESO_FTS_TITULO = 10.0
+PESO_FTS_DESCRIPCION = 1.0
+
+_TAREAS_FTS = Table(
+    TABLA_FTS,
+    MetaData(),
+    Column("rowid", Integer),
+    Column("titulo", String),
+    Column("descripcion", Text),
+)
+
+STMT_EXISTE_FTS = text(
+    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :nombre"
+).bindparams(nombre=TABLA_FTS)
+
+
+@lru_cache(maxsize=None)
+def stmt_buscar_tareas(por_estado: bool = False) -> Select:
+    """
+    Búsqueda FTS5 ordenada por relevancia (bm25; el título pesa más).
+
+    Parámetros: id_usuario, consulta (sintaxis FTS5, ver `consulta_fts`),
+    limite; completada si `por_estado`.
+    """
+    fts = literal_column(TABLA_FTS)
+    stmt = (
+        select(Tarea)
+        .join(_TAREAS_FTS, _TAREAS_FTS.c.rowid == Tarea.id_tarea)
+        .where(
+            fts.op("MATCH")(bindparam("consulta")),
+            Tarea.id_usuario == bindparam("id_usuario"),
+        )
+    )
+    if por_estado:
+        stmt = stmt.where(Tarea.completada == bindparam("completada"))
+    return stmt.order_by(
+        func.bm25(fts, PESO_FTS_TITULO, PESO_FTS_DESCRIPCION),
+        Tarea.id_tarea.desc(),
+    ).limit(bindparam("limite"))
+
+
+# Registro de cambios (migración 6): como tareas_fts, lo crea la migración y
+# lo mantienen triggers; una fila por (id_usuario, id_tarea) con su última
+# revisión.
+TABLA_CAMBIOS = "tareas_cambios"
+
+_TAREAS_CAMBIOS = Table(
+    TABLA_CAMBIOS,
+    MetaData(),
+    Column("revision", Integer),
+    Column("id_usuario", Integer),
+    Column("id_tarea", Integer),
+    Column("eliminada", Boolean),
+)
+
+STMT_CAMBIOS_DESDE: Select = (
+    select(
+        _TAREAS_CAMBIOS.c.revision,
+        _TAREAS_CAMBIOS.c.id_tarea.label("id_cambio"),
+        _TAREAS_CAMBIOS.c.eliminada,
+        *COLUMNAS_LECTURA,
+    )
+    .select_from(
+        _TAREAS_CAMBIOS.outerjoin(
+            Tarea.__table__,
+            (Tarea.id_tarea == _TAREAS_CAMBIOS.c.id_tarea)
+            & (Tarea.id_usuario == _TAREAS_CAMBIOS.c.id_usuario),
+        )
+    )
+    .where(
+        _TAREAS_CAMBIOS.c.id_usuario == bindparam("id_usuario"),
+        _TAREAS_CAMBIOS.c.revision > bindparam("revision"),
+    )
+    .order_by(_TAREAS_CAMBIOS.c.revision)
+)
+"""Cambios posteriores a una revisión (ix_tareas_cambios_usuario_revision).
+Parámetros: id_usuario, revision."""
+
+
+def consulta_fts(texto: str | None) -> str:
+    """
+    Texto del usuario -> consulta FTS5: cada palabra entre comillas (sin
+    operadores) y con `*` para coincidir por prefijo; todas deben aparecer.
+    """
+    return " ".join(f'"{palabra}"*' for palabra in re.findall(r"\w+", texto or ""))
+
+
+def normalizar_orden(orden: str | None) -> str:
+    """HU10: "fecha" (por defecto) o "nombre"; ValueError si no se reconoce."""
+    orden = (orden or ORDEN_FECHA).strip().lower()
+    if orden not in ORDENES:
+        raise ValueError(f"Orden no soportado: {orden!r}.")
+    return orden
+
+
+def _codificar_cursor(*clave) -> str:
+    """Cursor opaco (base64 url-safe) con la clave de orden de la última fila."""
+    datos = json.dumps(list(clave), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(datos).decode("ascii").rstrip("=")
+
+
+def _decodificar_cursor(cursor: str, longitud: int) -> list:
+    """Inversa de `_codificar_cursor`; ValueError si el cursor no es válido."""
+    try:
+        relleno = "=" * (-len(cursor) % 4)
+        clave = json.loads(base64.urlsafe_b64decode(cursor + relleno))
+    except (TypeError, ValueError) as exc:
+        raise ValueError(MSG_CURSOR_INVALIDO) from exc
+
+    if not isinstance(clave, list) or len(clave) != longitud:
+        raise ValueError(MSG_CURSOR_INVALIDO)
+    return clave
+
+
+def normalizar_titulo(titulo: str | None) -> str:
+    """Título sin espacios laterales ("" si es None)."""
+    return (titulo or "").strip()
+
+
+def normalizar_descripcion(descripcion: str | None) -> str | None:
+    """Descripción sin espacios laterales (None se conserva)."""
+    return (descripcion or "").strip() if descripcion is not None else None
+
+
 class RepositorioTareasSQLite:
     """
     Repositorio (SQLite + SQLAlchemy) para CRUD de tareas.
@@ -31,11 +472,34 @@ class RepositorioTareasSQLite:
     - Maneja transacciones.
     - Controla errores de integridad (duplicados).
     - Evita que la capa lógica escriba SQL o maneje sesiones.
+    - Lecturas (listar/obtener) por `session_factory_lectura`; escrituras por
+      `session_factory` (escritor único).
+    - usar_fts=False fuerza la búsqueda por subcadena aunque exista tareas_fts.
     """
 
-    def __init__(self, session_factory: Optional[sessionmaker] = None) -> None:
+    def __init__(
+        self,
+        session_factory: Optional[sessionmaker] = None,
+        session_factory_lectura: Optional[sessionmaker] = None,
+        tamano_cache: int = TAMANO_CACHE_TAREAS,
+        usar_fts: bool = True,
+    ) -> None:
+        # None: se detecta en la 1.ª búsqueda
+        self._fts_disponible: bool | None = None if usar_fts else False
+
+        # Caché LRU de obtener_tarea: id_tarea -> Tarea desasociada. Cada
+        # escritura incrementa la generación; una lectura que empezó antes de
+        # una escritura no guarda su resultado (evita reinsertar datos viejos).
+        if tamano_cache < 0:
+            raise ValueError("tamano_cache no puede ser negativo.")
+        self._tamano_cache = int(tamano_cache)
+        self._cache_tareas: OrderedDict[int, Tarea] = OrderedDict()
+        self._cache_generacion = 0
+        self._cache_lock = threading.Lock()
+
         if session_factory is not None:
             self._session_factory = session_factory
+            self._session_factory_lectura = session_factory_lectura or session_factory
             return
 
         if SessionLocal is None:
@@ -45,6 +509,9 @@ class RepositorioTareasSQLite:
             )
 
         self._session_factory = SessionLocal
+        self._session_factory_lectura = (
+            session_factory_lectura or SessionLectura or SessionLocal
+        )
 
     def crear_tarea(
         self,
@@ -52,50 +519,427 @@ class RepositorioTareasSQLite:
         titulo: str,
         descripcion: str | None = None,
     ) -> tuple[Tarea | None, str]:
-        titulo = (titulo or "").strip()
-        descripcion = (descripcion or "").strip() if descripcion is not None else None
+        titulo = normalizar_titulo(titulo)
+        descripcion = normalizar_descripcion(descripcion)
 
         if not titulo:
-            return None, "El título no puede estar vacío."
+            return None, MSG_TITULO_VACIO
 
         try:
             with self._session_factory.begin() as session:
-                if session.get(Usuario, id_usuario) is None:
-                    return None, "El usuario no existe."
-
-                tarea = Tarea(
-                    id_usuario=id_usuario,
-                    titulo=titulo,
-                    descripcion=descripcion,
-                    completada=False,
+                tarea, mensaje = self._crear_en_sesion(
+                    session, id_usuario, titulo, descripcion
                 )
-                session.add(tarea)
-                session.flush()  # genera id_tarea
-                session.refresh(tarea)  # asegura valores actualizados
+        except IntegrityError:
+            return None, MSG_TITULO_DUPLICADO
 
-                # ✅ CLAVE: evita DetachedInstanceError tras commit/cierre de sesión
-                session.expunge(tarea)
+        if tarea is not None:
+            self._invalidar_cache([tarea.id_tarea])
+        return tarea, mensaje
 
-                return tarea, "Tarea creada correctamente."
-        except IntegrityError:
-            return None, "Ya existe una tarea con ese título para este usuario."
+    @staticmethod
+    def _crear_en_sesion(
+        session,
+        id_usuario: int,
+        titulo: str,
+        descripcion: str | None,
+    ) -> tuple[Tarea | None, str]:
+        if session.get(Usuario, id_usuario) is None:
+            return None, MSG_USUARIO_NO_EXISTE
+
+        tarea = Tarea(
+            id_usuario=id_usuario,
+            titulo=titulo,
+            descripcion=descripcion,
+            completada=False,
+        )
+        session.add(tarea)
+        session.flush()  # genera id_tarea
+        session.refresh(tarea)  # asegura valores actualizados
+
+        # ✅ CLAVE: evita DetachedInstanceError tras commit/cierre de sesión
+        session.expunge(tarea)
+        return tarea, MSG_TAREA_CREADA
+
+    def crear_tareas_lote(
+        self,
+        id_usuario: int,
+        items: Iterable[ItemLote],
+        tamano_lote: int = TAMANO_LOTE_INSERCION,
+    ) -> ResultadoLote:
+        """
+        Crea muchas tareas en una sola transacción.
+
+        Se inserta con executemany por bloques de `tamano_lote` filas. Un título
+        vacío o duplicado (ya existente o repetido dentro del lote) se informa
+        en su fila y no aborta el resto.
+        """
+        if tamano_lote <= 0:
+            raise ValueError("tamano_lote debe ser mayor que 0.")
+
+        filas: list[ResultadoFilaLote | None] = []
+        pendientes: list[tuple[int, dict]] = []  # (indice, valores)
+        vistos: set[str] = set()
+        for indice, item in enumerate(items):
+            titulo, descripcion = (item, None) if isinstance(item, str) else item
+            titulo = normalizar_titulo(titulo)
+            if not titulo:
+                filas.append(ResultadoFilaLote(indice, titulo, False, MSG_TITULO_VACIO))
+                continue
+            if titulo in vistos:
+                filas.append(
+                    ResultadoFilaLote(indice, titulo, False, MSG_TITULO_DUPLICADO)
+                )
+                continue
+
+            vistos.add(titulo)
+            filas.append(None)  # se resuelve tras insertar
+            valores = {
+                "id_usuario": id_usuario,
+                "titulo": titulo,
+                "descripcion": normalizar_descripcion(descripcion),
+                "completada": False,
+            }
+            pendientes.append((indice, valores))
+
+        insertadas: dict[str, int] = {}
+        usuario_existe = True
+        if pendientes:
+            with self._session_factory.begin() as session:
+                usuario_existe = session.get(Usuario, id_usuario) is not None
+                if usuario_existe:
+                    valores = [v for _indice, v in pendientes]
+                    insertadas = self._insertar_lote(session, valores, tamano_lote)
+            self._invalidar_cache(insertadas.values())
+
+        for indice, valores in pendientes:
+            titulo = valores["titulo"]
+            id_tarea = insertadas.get(titulo)
+            if id_tarea is not None:
+                mensaje = MSG_TAREA_CREADA
+            elif usuario_existe:
+                mensaje = MSG_TITULO_DUPLICADO
+            else:
+                mensaje = MSG_USUARIO_NO_EXISTE
+            filas[indice] = ResultadoFilaLote(
+                indice, titulo, id_tarea is not None, mensaje, id_tarea
+            )
+
+        return ResultadoLote(tuple(filas))
+
+    @staticmethod
+    def _insertar_lote(
+        session,
+        valores: list[dict],
+        tamano_lote: int,
+    ) -> dict[str, int]:
+        """executemany por bloques; devuelve {titulo: id_tarea} de las insertadas."""
+        insertadas: dict[str, int] = {}
+        for inicio in range(0, len(valores), tamano_lote):
+            bloque = valores[inicio : inicio + tamano_lote]
+            for id_tarea, titulo in session.execute(STMT_INSERTAR_TAREAS_LOTE, bloque):
+                insertadas[titulo] = id_tarea
+        return insertadas
 
     def listar_tareas(self, id_usuario: int) -> list[Tarea]:
-        with self._session_factory() as session:
-            stmt = (
-                select(Tarea)
-                .where(Tarea.id_usuario == id_usuario)
-                .order_by(Tarea.creada_en.desc())
+        with self._session_factory_lectura() as session:
+            params = {"id_usuario": id_usuario}
+            return list(session.execute(STMT_LISTAR_TAREAS, params).scalars().all())
+
+    def listar_tareas_por_estado(
+        self,
+        id_usuario: int,
+        completada: bool,
+    ) -> list[Tarea]:
+        """
+        HU08: tareas pendientes (completada=False) o completadas (True).
+
+        El filtro y el orden los resuelve el índice
+        (id_usuario, completada, creada_en): solo se leen filas del estado pedido.
+        """
+        with self._session_factory_lectura() as session:
+            params = {"id_usuario": id_usuario, "completada": bool(completada)}
+            resultado = session.execute(STMT_LISTAR_TAREAS_POR_ESTADO, params)
+            return list(resultado.scalars().all())
+
+    def listar_tareas_ordenadas(
+        self,
+        id_usuario: int,
+        orden: str = ORDEN_FECHA,
+        completada: bool | None = None,
+    ) -> list[Tarea]:
+        """
+        HU10: tareas ordenadas en SQL por "fecha" o "nombre".
+
+        "nombre" usa COLLATE NOCASE (insensible a mayúsculas ASCII) sobre
+        ix_tareas_usuario_titulo_nocase, así el orden sale de recorrer el índice.
+        `completada` (opcional) combina el filtro HU08.
+        """
+        orden = normalizar_orden(orden)
+        params: dict = {"id_usuario": id_usuario}
+        if completada is not None:
+            params["completada"] = bool(completada)
+        stmt = stmt_listado(orden, por_estado=completada is not None)
+
+        with self._session_factory_lectura() as session:
+            return list(session.execute(stmt, params).scalars().all())
+
+    def listar_tareas_lectura(
+        self,
+        id_usuario: int,
+        orden: str = ORDEN_FECHA,
+        completada: bool | None = None,
+    ) -> list[TareaLectura]:
+        """
+        Como `listar_tareas_ordenadas`, pero sin hidratar entidades: solo las
+        columnas de TareaLectura, para vistas que únicamente muestran datos.
+        """
+        orden = normalizar_orden(orden)
+        params: dict = {"id_usuario": id_usuario}
+        if completada is not None:
+            params["completada"] = bool(completada)
+        stmt = stmt_listado(orden, por_estado=completada is not None, columnas=True)
+
+        # Connection.execute: filas crudas, sin la capa de carga de la Session.
+        with self._session_factory_lectura() as session:
+            filas = session.connection().execute(stmt, params)
+            return list(map(TareaLectura._make, filas))
+
+    def iter_tareas(
+        self,
+        id_usuario: int | None = None,
+        tamano_lote: int = TAMANO_LOTE_ITERACION,
+    ) -> Iterator[TareaLectura]:
+        """
+        Recorre las tareas (todas, o las de `id_usuario`) como TareaLectura,
+        en orden de id_tarea, sin materializar el listado.
+
+        Cada lote de `tamano_lote` filas es una consulta por keyset
+        (`id_tarea > último visto`) en su propia sesión corta, así la memoria
+        no crece con el total de filas y entre lotes no queda ningún lock de
+        lectura: los escritores no esperan aunque el generador quede en pausa.
+        No es una instantánea: las filas nuevas con id mayor aparecen y las
+        eliminadas antes de su lote no.
+        """
+        if tamano_lote <= 0:
+            raise ValueError("tamano_lote debe ser mayor que 0.")
+        return self._iter_tareas(id_usuario, tamano_lote)
+
+    def _iter_tareas(
+        self,
+        id_usuario: int | None,
+        tamano_lote: int,
+    ) -> Iterator[TareaLectura]:
+        if id_usuario is None:
+            stmt, params = STMT_ITERAR_TAREAS, {}
+        else:
+            stmt, params = STMT_ITERAR_TAREAS_USUARIO, {"id_usuario": id_usuario}
+
+        params["tamano_lote"] = tamano_lote
+        ultimo = 0  # id_tarea empieza en 1
+        while True:
+            params["ultimo"] = ultimo
+            with self._session_factory_lectura() as session:
+                lote = session.connection().execute(stmt, params).all()
+            if not lote:
+                return
+            ultimo = lote[-1].id_tarea
+            yield from map(TareaLectura._make, lote)
+            if len(lote) < tamano_lote:
+                return
+
+    def listar_tareas_pagina(
+        self,
+        id_usuario: int,
+        limite: int = LIMITE_PAGINA_POR_DEFECTO,
+        cursor: str | None = None,
+        *,
+        orden: str = ORDEN_FECHA,
+        completada: bool | None = None,
+    ) -> PaginaTareas:
+        """
+        Página de tareas por keyset, en el orden de `listar_tareas_ordenadas`.
+
+        `cursor` es el `siguiente_cursor` de la página anterior (None = primera
+        página) y solo vale para el mismo `orden`. Cada página es una búsqueda
+        acotada en el índice, así que su costo no depende de cuántas tareas
+        tenga el usuario.
+        """
+        if limite <= 0:
+            raise ValueError("limite debe ser mayor que 0.")
+        orden = normalizar_orden(orden)
+
+        # Se pide una fila de más para saber si hay página siguiente.
+        params: dict = {"id_usuario": id_usuario, "limite": limite + 1}
+        if completada is not None:
+            params["completada"] = bool(completada)
+        if cursor is not None:
+            orden_cursor, clave, id_tarea = _decodificar_cursor(cursor, 3)
+            if orden_cursor != orden:
+                raise ValueError(MSG_CURSOR_INVALIDO)
+            params["cursor_clave"] = str(clave)
+            params["cursor_id_tarea"] = int(id_tarea)
+
+        stmt = stmt_listado(
+            orden,
+            por_estado=completada is not None,
+            paginado=True,
+            desde_cursor=cursor is not None,
+        )
+        with self._session_factory_lectura() as session:
+            filas = session.execute(stmt, params).all()
+
+        siguiente = None
+        if len(filas) > limite:
+            filas = filas[:limite]
+            ultima = filas[-1]
+            siguiente = _codificar_cursor(
+                orden, ultima.clave_cursor, ultima.Tarea.id_tarea
             )
-            return list(session.execute(stmt).scalars().all())
+
+        return PaginaTareas([fila.Tarea for fila in filas], siguiente)
+
+    def contar_tareas(self, id_usuario: int) -> EstadisticasTareas:
+        """Total/pendientes/completadas con un único GROUP BY completada."""
+        with self._session_factory_lectura() as session:
+            params = {"id_usuario": id_usuario}
+            conteos = dict(session.execute(STMT_CONTAR_TAREAS, params).tuples().all())
+        return EstadisticasTareas(
+            pendientes=int(conteos.get(False, 0)),
+            completadas=int(conteos.get(True, 0)),
+        )
+
+    def buscar_tareas(
+        self,
+        id_usuario: int,
+        consulta: str,
+        limite: int = LIMITE_BUSQUEDA_POR_DEFECTO,
+        completada: bool | None = None,
+    ) -> list[Tarea]:
+        """
+        Busca `consulta` en título y descripción.
+
+        Con FTS5 cada palabra coincide por prefijo y los resultados salen por
+        relevancia. Sin FTS5 se conserva el comportamiento anterior: subcadena
+        sin distinguir mayúsculas, en el orden por fecha.
+        """
+        texto = (consulta or "").strip()
+        if not texto or limite <= 0:
+            return []
+
+        expresion = consulta_fts(texto)
+        if not expresion or not self._hay_fts():
+            return self._buscar_subcadena(id_usuario, texto, limite, completada)
+
+        params: dict = {
+            "id_usuario": id_usuario,
+            "consulta": expresion,
+            "limite": limite,
+        }
+        if completada is not None:
+            params["completada"] = bool(completada)
+        stmt = stmt_buscar_tareas(por_estado=completada is not None)
+
+        with self._session_factory_lectura() as session:
+            return list(session.execute(stmt, params).scalars().all())
+
+    def _hay_fts(self) -> bool:
+        if self._fts_disponible is None:
+            with self._session_factory_lectura() as session:
+                existe = session.execute(STMT_EXISTE_FTS).first()
+            self._fts_disponible = existe is not None
+        return self._fts_disponible
+
+    def _buscar_subcadena(
+        self,
+        id_usuario: int,
+        texto: str,
+        limite: int,
+        completada: bool | None,
+    ) -> list[Tarea]:
+        texto = texto.lower()
+        encontradas = [
+            t
+            for t in self.listar_tareas_ordenadas(id_usuario, completada=completada)
+            if texto in (t.titulo or "").lower()
+            or texto in (t.descripcion or "").lower()
+        ]
+        return encontradas[:limite]
+
+    def cambios_desde(self, id_usuario: int, revision: int = 0) -> CambiosTareas:
+        """
+        Lo que cambió en las tareas del usuario después de `revision`.
+
+        Se recorre ix_tareas_cambios_usuario_revision desde `revision`: el
+        costo depende de cuántas tareas cambiaron, no de cuántas hay. Cada
+        tarea aparece una vez (su último cambio); las eliminadas, solo por id.
+        Con `revision=0` se obtienen todas las tareas actuales.
+        """
+        if revision < 0:
+            raise ValueError("revision no puede ser negativa.")
+
+        tareas: list[TareaLectura] = []
+        eliminadas: list[int] = []
+        ultima = revision
+        params = {"id_usuario": id_usuario, "revision": revision}
+        with self._session_factory_lectura() as session:
+            for fila in session.connection().execute(STMT_CAMBIOS_DESDE, params):
+                ultima = fila.revision
+                if fila.eliminada or fila.id_tarea is None:
+                    eliminadas.append(fila.id_cambio)
+                else:
+                    tareas.append(TareaLectura._make(fila[3:]))
+        return CambiosTareas(ultima, tareas, eliminadas)
 
     def obtener_tarea(self, id_usuario: int, id_tarea: int) -> Tarea | None:
-        with self._session_factory() as session:
-            stmt = select(Tarea).where(
-                Tarea.id_usuario == id_usuario,
-                Tarea.id_tarea == id_tarea,
-            )
-            return session.execute(stmt).scalar_one_or_none()
+        """
+        Una tarea por clave primaria, solo si pertenece a `id_usuario`.
+
+        Las últimas `tamano_cache` tareas leídas se conservan (LRU) hasta que
+        una escritura de este repositorio las invalida, así reabrir el mismo
+        diálogo no vuelve a SQLite. La entidad está desasociada y se comparte
+        entre llamadas: tratarla como de solo lectura. Las escrituras hechas
+        fuera del repositorio no invalidan el caché (ver `limpiar_cache`).
+        """
+        with self._cache_lock:
+            tarea = self._cache_tareas.get(id_tarea)
+            if tarea is not None:
+                self._cache_tareas.move_to_end(id_tarea)
+            generacion = self._cache_generacion
+
+        if tarea is None:
+            with self._session_factory_lectura() as session:
+                tarea = session.get(Tarea, id_tarea)
+            if tarea is None:
+                return None
+            self._guardar_en_cache(tarea, generacion)
+
+        return tarea if tarea.id_usuario == id_usuario else None
+
+    def limpiar_cache(self) -> None:
+        """Vacía el caché de obtener_tarea (p. ej. tras escribir por fuera)."""
+        self._invalidar_cache(None)
+
+    def _guardar_en_cache(self, tarea: Tarea, generacion: int) -> None:
+        if self._tamano_cache == 0:
+            return
+        with self._cache_lock:
+            if generacion != self._cache_generacion:
+                return  # hubo una escritura mientras se leía
+            self._cache_tareas[tarea.id_tarea] = tarea
+            self._cache_tareas.move_to_end(tarea.id_tarea)
+            while len(self._cache_tareas) > self._tamano_cache:
+                self._cache_tareas.popitem(last=False)
+
+    def _invalidar_cache(self, ids: Iterable[int] | None) -> None:
+        """Descarta `ids` del caché (todas las entradas si es None)."""
+        with self._cache_lock:
+            self._cache_generacion += 1
+            if ids is None:
+                self._cache_tareas.clear()
+                return
+            for id_tarea in ids:
+                self._cache_tareas.pop(id_tarea, None)
 
     def editar_tarea(
         self,
@@ -104,37 +948,30 @@ class RepositorioTareasSQLite:
         nuevo_titulo: str,
         nueva_descripcion: str | None = None,
     ) -> ResultadoOperacion:
-        nuevo_titulo = (nuevo_titulo or "").strip()
-        nueva_descripcion = (
-            (nueva_descripcion or "").strip() if nueva_descripcion is not None else None
-        )
+        nuevo_titulo = normalizar_titulo(nuevo_titulo)
+        nueva_descripcion = normalizar_descripcion(nueva_descripcion)
 
         if not nuevo_titulo:
-            return ResultadoOperacion(False, "El título no puede estar vacío.")
+            return ResultadoOperacion(False, MSG_TITULO_VACIO)
 
+        params = {
+            "usuario": id_usuario,
+            "tarea": id_tarea,
+            "titulo_nuevo": nuevo_titulo,
+            "descripcion_nueva": nueva_descripcion,
+        }
         try:
-            with self._session_factory.begin() as session:
-                tarea = self._get_tarea(session, id_usuario, id_tarea)
-                if tarea is None:
-                    return ResultadoOperacion(False, "La tarea no existe.")
-
-                tarea.titulo = nuevo_titulo
-                tarea.descripcion = nueva_descripcion
-                return ResultadoOperacion(True, "Tarea actualizada correctamente.")
+            if not self._escribir_tarea(STMT_EDITAR_TAREA, params):
+                return ResultadoOperacion(False, MSG_TAREA_NO_EXISTE)
+            return ResultadoOperacion(True, MSG_TAREA_ACTUALIZADA)
         except IntegrityError:
-            return ResultadoOperacion(
-                False,
-                "Ya existe una tarea con ese título para este usuario.",
-            )
+            return ResultadoOperacion(False, MSG_TITULO_DUPLICADO)
 
     def eliminar_tarea(self, id_usuario: int, id_tarea: int) -> ResultadoOperacion:
-        with self._session_factory.begin() as session:
-            tarea = self._get_tarea(session, id_usuario, id_tarea)
-            if tarea is None:
-                return ResultadoOperacion(False, "La tarea no existe.")
-
-            session.delete(tarea)
-            return ResultadoOperacion(True, "Tarea eliminada correctamente.")
+        params = {"usuario": id_usuario, "tarea": id_tarea}
+        if not self._escribir_tarea(STMT_ELIMINAR_TAREA, params):
+            return ResultadoOperacion(False, MSG_TAREA_NO_EXISTE)
+        return ResultadoOperacion(True, MSG_TAREA_ELIMINADA)
 
     def marcar_completada(
         self,
@@ -142,18 +979,139 @@ class RepositorioTareasSQLite:
         id_tarea: int,
         completada: bool,
     ) -> ResultadoOperacion:
-        with self._session_factory.begin() as session:
-            tarea = self._get_tarea(session, id_usuario, id_tarea)
-            if tarea is None:
-                return ResultadoOperacion(False, "La tarea no existe.")
+        params = {"usuario": id_usuario, "tarea": id_tarea, "estado": bool(completada)}
+        if not self._escribir_tarea(STMT_MARCAR_TAREA, params):
+            return ResultadoOperacion(False, MSG_TAREA_NO_EXISTE)
+        return ResultadoOperacion(True, MSG_ESTADO_ACTUALIZADO)
 
-            tarea.completada = bool(completada)
-            return ResultadoOperacion(True, "Estado actualizado correctamente.")
+    def aplicar_operaciones(
+        self,
+        operaciones: Iterable[OperacionEscritura],
+    ) -> list[ResultadoEscritura]:
+        """
+        Aplica varias escrituras en una sola transacción (un commit).
 
-    @staticmethod
-    def _get_tarea(session, id_usuario: int, id_tarea: int) -> Tarea | None:
-        stmt = select(Tarea).where(
-            Tarea.id_usuario == id_usuario,
-            Tarea.id_tarea == id_tarea,
+        Cada operación corre en su propio SAVEPOINT: un título duplicado o
+        vacío, o una tarea inexistente, solo afecta a su resultado. Devuelve un
+        resultado por operación, en orden, con los mismos valores que el
+        método individual equivalente.
+        """
+        operaciones = list(operaciones)
+        for op in operaciones:
+            if op.tipo not in OPERACIONES:
+                raise ValueError(f"Operación no soportada: {op.tipo!r}.")
+
+        resultados: list[ResultadoEscritura] = []
+        try:
+            with self._session_factory.begin() as session:
+                for op in operaciones:
+                    resultados.append(self._aplicar_en_sesion(session, op))
+        finally:
+            tocadas = [op.id_tarea for op in operaciones if op.id_tarea is not None]
+            creadas = [
+                r[0].id_tarea for r in resultados if isinstance(r, tuple) and r[0]
+            ]
+            self._invalidar_cache(tocadas + creadas)
+        return resultados
+
+    def _aplicar_en_sesion(
+        self,
+        session,
+        op: OperacionEscritura,
+    ) -> ResultadoEscritura:
+        if op.tipo == OP_CREAR:
+            titulo = normalizar_titulo(op.titulo)
+            if not titulo:
+                return None, MSG_TITULO_VACIO
+            try:
+                with session.begin_nested():
+                    return self._crear_en_sesion(
+                        session,
+                        op.id_usuario,
+                        titulo,
+                        normalizar_descripcion(op.descripcion),
+                    )
+            except IntegrityError:
+                return None, MSG_TITULO_DUPLICADO
+
+        params = {"usuario": op.id_usuario, "tarea": op.id_tarea}
+        if op.tipo == OP_EDITAR:
+            titulo = normalizar_titulo(op.titulo)
+            if not titulo:
+                return ResultadoOperacion(False, MSG_TITULO_VACIO)
+            stmt, exito = STMT_EDITAR_TAREA, MSG_TAREA_ACTUALIZADA
+            params["titulo_nuevo"] = titulo
+            params["descripcion_nueva"] = normalizar_descripcion(op.descripcion)
+        elif op.tipo == OP_MARCAR:
+            stmt, exito = STMT_MARCAR_TAREA, MSG_ESTADO_ACTUALIZADO
+            params["estado"] = bool(op.completada)
+        else:  # OP_ELIMINAR
+            stmt, exito = STMT_ELIMINAR_TAREA, MSG_TAREA_ELIMINADA
+
+        try:
+            with session.begin_nested():
+                if session.execute(stmt, params).rowcount == 0:
+                    return ResultadoOperacion(False, MSG_TAREA_NO_EXISTE)
+        except IntegrityError:
+            return ResultadoOperacion(False, MSG_TITULO_DUPLICADO)
+        return ResultadoOperacion(True, exito)
+
+    def _escribir_tarea(self, stmt, params: dict) -> bool:
+        """Ejecuta un UPDATE/DELETE de una tarea; True si afectó a una fila."""
+        try:
+            with self._session_factory.begin() as session:
+                return session.execute(stmt, params).rowcount > 0
+        finally:
+            self._invalidar_cache([params["tarea"]])
+
+    def marcar_completadas_lote(
+        self,
+        id_usuario: int,
+        ids: Iterable[int],
+        completada: bool = True,
+        tamano_lote: int = TAMANO_LOTE_IDS,
+    ) -> int:
+        """
+        Marca varias tareas del usuario en una transacción.
+
+        Un UPDATE por bloque de `tamano_lote` ids; los ids inexistentes o de
+        otro usuario se ignoran. Devuelve cuántas tareas se actualizaron.
+        """
+        params = {"usuario": id_usuario, "estado": bool(completada)}
+        return self._ejecutar_por_ids(STMT_MARCAR_TAREAS_LOTE, params, ids, tamano_lote)
+
+    def eliminar_tareas_lote(
+        self,
+        id_usuario: int,
+        ids: Iterable[int],
+        tamano_lote: int = TAMANO_LOTE_IDS,
+    ) -> int:
+        """Elimina varias tareas del usuario; devuelve cuántas se eliminaron."""
+        params = {"usuario": id_usuario}
+        return self._ejecutar_por_ids(
+            STMT_ELIMINAR_TAREAS_LOTE, params, ids, tamano_lote
         )
-        return session.execute(stmt).scalar_one_or_none()
+
+    def _ejecutar_por_ids(
+        self,
+        stmt,
+        params: dict,
+        ids: Iterable[int],
+        tamano_lote: int,
+    ) -> int:
+        if tamano_lote <= 0:
+            raise ValueError("tamano_lote debe ser mayor que 0.")
+
+        ids = sorted({int(id_tarea) for id_tarea in ids})
+        if not ids:
+            return 0
+
+        afectadas = 0
+        try:
+            with self._session_factory.begin() as session:
+                for inicio in range(0, len(ids), tamano_lote):
+                    bloque = {**params, "ids": ids[inicio : inicio + tamano_lote]}
+                    afectadas += session.execute(stmt, bloque).rowcount
+        finally:
+            self._invalidar_cache(ids)
+        return afectadas
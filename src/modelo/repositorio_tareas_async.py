@@ -0,0 +1,152 @@
+# src/modelo/repositorio_tareas_async.py
+from __future__ import annotations
+
+from typing import Optional
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.modelo.bd_model import Tarea, Usuario
+from src.modelo.repositorio_tareas import (
+    MSG_ESTADO_ACTUALIZADO,
+    MSG_TAREA_ACTUALIZADA,
+    MSG_TAREA_CREADA,
+    MSG_TAREA_ELIMINADA,
+    MSG_TAREA_NO_EXISTE,
+    MSG_TITULO_DUPLICADO,
+    MSG_TITULO_VACIO,
+    MSG_USUARIO_NO_EXISTE,
+    STMT_EDITAR_TAREA,
+    STMT_ELIMINAR_TAREA,
+    STMT_LISTAR_TAREAS,
+    STMT_MARCAR_TAREA,
+    ResultadoOperacion,
+    normalizar_descripcion,
+    normalizar_titulo,
+)
+
+try:
+    from src.modelo.conexion import AsyncSessionLocal  # type: ignore
+except ImportError:  # pragma: no cover
+    AsyncSessionLocal = None  # type: ignore
+
+
+class AsyncRepositorioTareasSQLite:
+    """
+    Variante asyncio (SQLAlchemy asyncio + aiosqlite) de RepositorioTareasSQLite.
+
+    Mismas operaciones, reglas y mensajes; pensada para integraciones con
+    event loop (qasync, servidores headless, procesos batch).
+    """
+
+    def __init__(self, session_factory: Optional[async_sessionmaker] = None) -> None:
+        if session_factory is not None:
+            self._session_factory = session_factory
+            return
+
+        if AsyncSessionLocal is None:
+            raise RuntimeError(
+                "No se encontró AsyncSessionLocal en src/modelo/conexion.py. "
+                "Inyecta un async_sessionmaker en el repositorio."
+            )
+
+        self._session_factory = AsyncSessionLocal
+
+    async def crear_tarea(
+        self,
+        id_usuario: int,
+        titulo: str,
+        descripcion: str | None = None,
+    ) -> tuple[Tarea | None, str]:
+        titulo = normalizar_titulo(titulo)
+        descripcion = normalizar_descripcion(descripcion)
+
+        if not titulo:
+            return None, MSG_TITULO_VACIO
+
+        try:
+            async with self._session_factory.begin() as session:
+                if await session.get(Usuario, id_usuario) is None:
+                    return None, MSG_USUARIO_NO_EXISTE
+
+                tarea = Tarea(
+                    id_usuario=id_usuario,
+                    titulo=titulo,
+                    descripcion=descripcion,
+                    completada=False,
+                )
+                session.add(tarea)
+                await session.flush()
+                await session.refresh(tarea)
+                session.expunge(tarea)
+
+                return tarea, MSG_TAREA_CREADA
+        except IntegrityError:
+            return None, MSG_TITULO_DUPLICADO
+
+    async def listar_tareas(self, id_usuario: int) -> list[Tarea]:
+        async with self._session_factory() as session:
+            params = {"id_usuario": id_usuario}
+            resultado = await session.execute(STMT_LISTAR_TAREAS, params)
+            return list(resultado.scalars().all())
+
+    async def obtener_tarea(self, id_usuario: int, id_tarea: int) -> Tarea | None:
+        async with self._session_factory() as session:
+            return await self._get_tarea(session, id_usuario, id_tarea)
+
+    async def editar_tarea(
+        self,
+        id_usuario: int,
+        id_tarea: int,
+        nuevo_titulo: str,
+        nueva_descripcion: str | None = None,
+    ) -> ResultadoOperacion:
+        nuevo_titulo = normalizar_titulo(nuevo_titulo)
+        nueva_descripcion = normalizar_descripcion(nueva_descripcion)
+
+        if not nuevo_titulo:
+            return ResultadoOperacion(False, MSG_TITULO_VACIO)
+
+        params = {
+            "usuario": id_usuario,
+            "tarea": id_tarea,
+            "titulo_nuevo": nuevo_titulo,
+            "descripcion_nueva": nueva_descripcion,
+        }
+        try:
+            if not await self._escribir_tarea(STMT_EDITAR_TAREA, params):
+                return ResultadoOperacion(False, MSG_TAREA_NO_EXISTE)
+            return ResultadoOperacion(True, MSG_TAREA_ACTUALIZADA)
+        except IntegrityError:
+            return ResultadoOperacion(False, MSG_TITULO_DUPLICADO)
+
+    async def eliminar_tarea(
+        self,
+        id_usuario: int,
+        id_tarea: int,
+    ) -> ResultadoOperacion:
+        params = {"usuario": id_usuario, "tarea": id_tarea}
+        if not await self._escribir_tarea(STMT_ELIMINAR_TAREA, params):
+            return ResultadoOperacion(False, MSG_TAREA_NO_EXISTE)
+        return ResultadoOperacion(True, MSG_TAREA_ELIMINADA)
+
+    async def marcar_completada(
+        self,
+        id_usuario: int,
+        id_tarea: int,
+        completada: bool,
+    ) -> ResultadoOperacion:
+        params = {"usuario": id_usuario, "tarea": id_tarea, "estado": bool(completada)}
+        if not await self._escribir_tarea(STMT_MARCAR_TAREA, params):
+            return ResultadoOperacion(False, MSG_TAREA_NO_EXISTE)
+        return ResultadoOperacion(True, MSG_ESTADO_ACTUALIZADO)
+
+    async def _escribir_tarea(self, stmt, params: dict) -> bool:
+        async with self._session_factory.begin() as session:
+            return (await session.execute(stmt, params)).rowcount > 0
+
+    @staticmethod
+    async def _get_tarea(session, id_usuario: int, id_tarea: int) -> Tarea | None:
+        # Búsqueda por clave primaria; la pertenencia se comprueba en la fila.
+        tarea = await session.get(Tarea, id_tarea)
+        return tarea if tarea is not None and tarea.id_usuario == id_usuario else None
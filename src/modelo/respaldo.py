@@ -0,0 +1,232 @@
+# src/modelo/respaldo.py
+"""
+Respaldo en caliente de la BD con la API de backup online de sqlite3.
+
+La copia se hace por pasos de `paginas_por_paso` páginas desde un hilo en
+segundo plano, con una pausa entre pasos para no bloquear a la UI ni a los
+escritores. La conexión de origen sale del engine de lectura (mismos PRAGMAs
+que el resto de la app) y cada instantánea se escribe primero como
+`.parcial` y se renombra al terminar; solo se conservan las
+`max_instantaneas` más recientes.
+
+Con la API de backup, un commit de otra conexión (el escritor) reinicia la
+copia desde la página 0. En WAL la copia se hace dentro de una transacción de
+lectura (una instantánea fija), así las escrituras no la reinician. En otros
+modos de journal (perfil `safe`) eso bloquearía a los escritores durante toda
+la copia, por lo que se cuentan los reinicios y, pasados `max_reinicios`, el
+respaldo falla con un error claro en lugar de no terminar nunca.
+
+Usage:
+    servicio = ServicioRespaldo(PROJECT_ROOT / "respaldos")
+    futuro = servicio.respaldar_en_segundo_plano()
+    resultado = futuro.result()
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+from sqlalchemy.engine import Engine
+
+from src.modelo.conexion import get_engine_lectura
+
+PREFIJO_INSTANTANEA = "DB-"
+EXTENSION_INSTANTANEA = ".sqlite"
+MSG_RESPALDO_REINICIADO = (
+    "El respaldo se reinició {reinicios} veces por escrituras concurrentes; "
+    "reintentar con menos actividad o con el perfil fast (WAL)."
+)
+
+
+@dataclass(frozen=True)
+class ProgresoRespaldo:
+    """Avance de un respaldo en curso."""
+
+    destino: Path
+    paginas_copiadas: int
+    paginas_totales: int
+    segundos: float
+
+    @property
+    def porcentaje(self) -> float:
+        if self.paginas_totales <= 0:
+            return 100.0
+        return 100.0 * self.paginas_copiadas / self.paginas_totales
+
+    @property
+    def paginas_por_segundo(self) -> float:
+        return self.paginas_copiadas / self.segundos if self.segundos > 0 else 0.0
+
+
+@dataclass(frozen=True)
+class ResultadoRespaldo:
+    """Resumen de un respaldo terminado."""
+
+    destino: Path
+    bytes: int
+    paginas: int
+    segundos: float
+    eliminadas: tuple[Path, ...] = ()
+    reinicios: int = 0
+
+    @property
+    def mb_por_segundo(self) -> float:
+        if self.segundos <= 0:
+            return 0.0
+        return self.bytes / (1024 * 1024) / self.segundos
+
+
+class ServicioRespaldo:
+    """Genera instantáneas rotativas de la BD sin detener la aplicación."""
+
+    def __init__(
+        self,
+        directorio: Path | str,
+        *,
+        engine: Engine | None = None,
+        paginas_por_paso: int = 256,
+        pausa_s: float = 0.005,
+        max_instantaneas: int = 5,
+        max_reinicios: int = 5,
+        al_progresar: Callable[[ProgresoRespaldo], None] | None = None,
+    ) -> None:
+        if paginas_por_paso <= 0:
+            raise ValueError("paginas_por_paso debe ser mayor que 0.")
+        if max_instantaneas <= 0:
+            raise ValueError("max_instantaneas debe ser mayor que 0.")
+        if max_reinicios < 0:
+            raise ValueError("max_reinicios no puede ser negativo.")
+
+        self.directorio = Path(directorio)
+        self._engine = engine
+        self.paginas_por_paso = int(paginas_por_paso)
+        self.pausa_s = float(pausa_s)
+        self.max_instantaneas = int(max_instantaneas)
+        self.max_reinicios = int(max_reinicios)
+        self.al_progresar = al_progresar
+        self._lock = threading.Lock()
+
+    @property
+    def engine(self) -> Engine:
+        return self._engine or get_engine_lectura()
+
+    def instantaneas(self) -> list[Path]:
+        """Instantáneas existentes, de la más antigua a la más reciente."""
+        if not self.directorio.exists():
+            return []
+        patron = f"{PREFIJO_INSTANTANEA}*{EXTENSION_INSTANTANEA}"
+        return sorted(self.directorio.glob(patron))
+
+    def respaldar(self) -> ResultadoRespaldo:
+        """Ejecuta un respaldo completo en el hilo actual."""
+        with self._lock:  # un respaldo a la vez por servicio
+            self.directorio.mkdir(parents=True, exist_ok=True)
+            marca = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+            destino = self.directorio / (
+                f"{PREFIJO_INSTANTANEA}{marca}{EXTENSION_INSTANTANEA}"
+            )
+            parcial = destino.with_name(destino.name + ".parcial")
+
+            inicio = time.perf_counter()
+            paginas, reinicios = self._copiar(parcial, destino, inicio)
+            parcial.replace(destino)
+            segundos = time.perf_counter() - inicio
+
+            return ResultadoRespaldo(
+                destino=destino,
+                bytes=destino.stat().st_size,
+                paginas=paginas,
+                segundos=segundos,
+                eliminadas=tuple(self._rotar()),
+                reinicios=reinicios,
+            )
+
+    def respaldar_en_segundo_plano(self) -> Future:
+        """Lanza `respaldar()` en un hilo daemon y devuelve un Future."""
+        futuro: Future = Future()
+
+        def _trabajo() -> None:
+            if not futuro.set_running_or_notify_cancel():
+                return
+            try:
+                futuro.set_result(self.respaldar())
+            except BaseException as exc:  # noqa: BLE001
+                futuro.set_exception(exc)
+
+        threading.Thread(target=_trabajo, name="respaldo-sqlite", daemon=True).start()
+        return futuro
+
+    def _copiar(
+        self,
+        parcial: Path,
+        destino: Path,
+        inicio: float,
+    ) -> tuple[int, int]:
+        """Copia a `parcial`; devuelve (páginas, reinicios)."""
+        totales = 0
+        copiadas_antes = -1
+        reinicios = 0
+
+        def _progreso(_status: int, restantes: int, total: int) -> None:
+            nonlocal totales, copiadas_antes, reinicios
+            totales = total
+            # Sin reinicios las páginas copiadas solo crecen entre pasos.
+            copiadas = total - restantes
+            if copiadas <= copiadas_antes:
+                reinicios += 1
+                if reinicios > self.max_reinicios:
+                    raise RuntimeError(
+                        MSG_RESPALDO_REINICIADO.format(reinicios=reinicios)
+                    )
+            copiadas_antes = copiadas
+            if self.al_progresar is not None:
+                self.al_progresar(
+                    ProgresoRespaldo(
+                        destino=destino,
+                        paginas_copiadas=total - restantes,
+                        paginas_totales=total,
+                        segundos=time.perf_counter() - inicio,
+                    )
+                )
+            if restantes and self.pausa_s > 0:
+                time.sleep(self.pausa_s)  # cede el lock de lectura entre pasos
+
+        # Conexión del pool (lector mode=ro por defecto): mismos PRAGMAs que la app
+        # y sin ocupar la conexión del escritor.
+        origen = self.engine.raw_connection()
+        fuente = origen.driver_connection
+        copia = sqlite3.connect(parcial)
+        instantanea = False
+        try:
+            modo = fuente.execute("PRAGMA journal_mode").fetchone()[0]
+            if str(modo).lower() == "wal":
+                # Transacción de lectura abierta: todos los pasos leen la misma
+                # instantánea y los commits del escritor no reinician la copia.
+                fuente.execute("BEGIN")
+                fuente.execute("SELECT count(*) FROM sqlite_master").fetchall()
+                instantanea = True
+            fuente.backup(copia, pages=self.paginas_por_paso, progress=_progreso)
+        except BaseException:
+            copia.close()
+            parcial.unlink(missing_ok=True)
+            raise
+        finally:
+            if instantanea:
+                fuente.rollback()
+            origen.close()
+        copia.close()
+        return totales, reinicios
+
+    def _rotar(self) -> list[Path]:
+        existentes = self.instantaneas()
+        sobrantes = existentes[: max(0, len(existentes) - self.max_instantaneas)]
+        for ruta in sobrantes:
+            ruta.unlink(missing_ok=True)
+        return sobrantes
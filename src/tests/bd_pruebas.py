@@ -0,0 +1,103 @@
+# src/tests/bd_pruebas.py
+"""
+Infraestructura de pruebas sobre SQLite en memoria.
+
+Cada grupo de pruebas abre una conexión con una transacción externa; cada
+prueba corre dentro de un SAVEPOINT que se revierte al terminar. No se toca
+DB.sqlite y los workers en paralelo no comparten archivo.
+"""
+
+from __future__ import annotations
+
+import unittest
+
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.modelo.conexion import URL_MEMORIA, _create_engine, init_db
+
+
+class BDPruebas:
+    """
+    BD en memoria con transacción externa + SAVEPOINT por prueba.
+
+    Usage:
+        bd = BDPruebas()
+        bd.abrir()
+        bd.iniciar_prueba()
+        ...  # usar bd.session_factory
+        bd.revertir_prueba()
+        bd.cerrar()
+    """
+
+    def __init__(self, url: str = URL_MEMORIA) -> None:
+        self.url = url
+        self.engine: Engine | None = None
+        self.conexion: Connection | None = None
+        self.session_factory: sessionmaker | None = None
+        self._transaccion = None
+        self._savepoint = None
+
+    def abrir(self) -> None:
+        # Engine propio (fuera del registro) para no compartir datos entre grupos.
+        self.engine = _create_engine(self.url)
+        init_db(engine=self.engine)
+
+        self.conexion = self.engine.connect()
+        self._transaccion = self.conexion.begin()
+        self.session_factory = sessionmaker(
+            bind=self.conexion,
+            autoflush=False,
+            autocommit=False,
+            future=True,
+            class_=Session,
+            join_transaction_mode="create_savepoint",
+        )
+
+    def iniciar_prueba(self) -> None:
+        self._savepoint = self.conexion.begin_nested()
+
+    def revertir_prueba(self) -> None:
+        if self._savepoint is not None and self._savepoint.is_active:
+            self._savepoint.rollback()
+        self._savepoint = None
+
+    def cerrar(self) -> None:
+        if self._transaccion is not None and self._transaccion.is_active:
+            self._transaccion.rollback()
+        if self.conexion is not None:
+            self.conexion.close()
+        if self.engine is not None:
+            self.engine.dispose()
+        self.conexion = None
+        self.engine = None
+        self.session_factory = None
+
+
+class PruebaConBDMemoria(unittest.TestCase):
+    """
+    TestCase base: BD en memoria por clase y SAVEPOINT revertido por prueba.
+
+    Los datos creados en setUpClass (después de super().setUpClass()) quedan
+    en la transacción externa y son visibles para todas las pruebas.
+    """
+
+    bd: BDPruebas
+    session_factory: sessionmaker
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.bd = BDPruebas()
+        cls.bd.abrir()
+        cls.session_factory = cls.bd.session_factory
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.bd.cerrar()
+        super().tearDownClass()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.bd.iniciar_prueba()
+        self.addCleanup(self.bd.revertir_prueba)
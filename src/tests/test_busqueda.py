@@ -0,0 +1,82 @@
+# src/tests/test_busqueda.py
+from __future__ import annotations
+
+from src.logica.task_manager import TaskManager
+from src.modelo.bd_model import Usuario
+from src.modelo.repositorio_tareas import RepositorioTareasSQLite, consulta_fts
+from src.tests.bd_pruebas import PruebaConBDMemoria
+
+
+class TestBusquedaTareas(PruebaConBDMemoria):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.repo = RepositorioTareasSQLite(session_factory=cls.session_factory)
+        cls.manager = TaskManager(repositorio=cls.repo)
+
+        with cls.session_factory.begin() as session:
+            usuario = Usuario(username="busqueda", password_hash="x")
+            otro = Usuario(username="busqueda_otro", password_hash="x")
+            session.add_all([usuario, otro])
+            session.flush()
+            cls.id_usuario = usuario.id_usuario
+            cls.id_otro = otro.id_usuario
+
+    def _titulos(self, consulta: str, **kwargs) -> list[str]:
+        tareas = self.manager.buscar_tareas(self.id_usuario, consulta, **kwargs)
+        return [t.titulo for t in tareas]
+
+    def test_consulta_fts_prefijos_sin_operadores(self) -> None:
+        self.assertEqual('"com"* "pan"* "OR"*', consulta_fts('com "pan" OR'))
+        self.assertEqual('"a"* "b"*', consulta_fts("a-b"))
+        self.assertEqual("", consulta_fts("  ¿?  "))
+
+    def test_busca_por_prefijo_en_titulo_y_descripcion(self) -> None:
+        self.manager.crear_tarea(self.id_usuario, "Comprar pan", "")
+        self.manager.crear_tarea(self.id_usuario, "Estudiar", "comprobar apuntes")
+        self.manager.crear_tarea(self.id_usuario, "Correr", "")
+        self.manager.crear_tarea(self.id_otro, "Comprar leche", "")
+
+        self.assertEqual({"Comprar pan", "Estudiar"}, set(self._titulos("comp")))
+        self.assertEqual(["Comprar pan"], self._titulos("compr pa"))
+        self.assertEqual([], self._titulos(""))
+
+    def test_titulo_pesa_mas_que_descripcion(self) -> None:
+        self.manager.crear_tarea(self.id_usuario, "Notas", "revisar informe")
+        self.manager.crear_tarea(self.id_usuario, "Informe mensual", "")
+
+        self.assertEqual(["Informe mensual", "Notas"], self._titulos("informe"))
+
+    def test_ignora_tildes_y_respeta_limite_y_estado(self) -> None:
+        for i in range(3):
+            self.manager.crear_tarea(self.id_usuario, f"Canción {i}", "")
+        tarea = self.manager.crear_tarea(self.id_usuario, "Canción final", "")
+        self.manager.marcar_completada(self.id_usuario, tarea.id_tarea, True)
+
+        self.assertEqual(4, len(self._titulos("cancion")))
+        self.assertEqual(2, len(self._titulos("cancion", limite=2)))
+        self.assertEqual(["Canción final"], self._titulos("cancion", completada=True))
+
+    def test_triggers_mantienen_el_indice(self) -> None:
+        tarea = self.manager.crear_tarea(self.id_usuario, "Viejo título", "")
+        self.manager.editar_tarea(self.id_usuario, tarea.id_tarea, "Nuevo título", "")
+        self.assertEqual([], self._titulos("viejo"))
+        self.assertEqual(["Nuevo título"], self._titulos("nuevo"))
+
+        self.manager.eliminar_tarea(self.id_usuario, tarea.id_tarea)
+        self.assertEqual([], self._titulos("nuevo"))
+
+    def test_sin_fts_usa_subcadena(self) -> None:
+        self.manager.crear_tarea(self.id_usuario, "Comprar pan", "")
+        self.manager.crear_tarea(self.id_usuario, "Otra", "sin PAN")
+        manager = TaskManager(
+            repositorio=RepositorioTareasSQLite(
+                session_factory=self.session_factory, usar_fts=False
+            )
+        )
+
+        def titulos(consulta: str) -> list[str]:
+            return [t.titulo for t in manager.buscar_tareas(self.id_usuario, consulta)]
+
+        self.assertEqual({"Comprar pan", "Otra"}, set(titulos("pan")))
+        self.assertEqual(["Comprar pan"], titulos("rar p"))
@@ -0,0 +1,133 @@
+# src/tests/test_cambios.py
+from __future__ import annotations
+
+import unittest
+
+from src.logica.task_manager import TaskManager
+from src.modelo.bd_model import Usuario
+from src.modelo.repositorio_memoria import RepositorioTareasMemoria
+from src.modelo.repositorio_tareas import (
+    OP_CREAR,
+    OP_ELIMINAR,
+    STMT_CAMBIOS_DESDE,
+    OperacionEscritura,
+    RepositorioTareasSQLite,
+)
+from src.tests.bd_pruebas import PruebaConBDMemoria
+
+
+class TestCambiosDesde(PruebaConBDMemoria):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.repo = RepositorioTareasSQLite(session_factory=cls.session_factory)
+        cls.manager = TaskManager(repositorio=cls.repo)
+
+        with cls.session_factory.begin() as session:
+            usuario = Usuario(username="cambios", password_hash="x")
+            otro = Usuario(username="cambios_otro", password_hash="x")
+            session.add_all([usuario, otro])
+            session.flush()
+            cls.id_usuario = usuario.id_usuario
+            cls.id_otro = otro.id_usuario
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.repo.limpiar_cache()
+
+    def test_revision_cero_devuelve_todo_y_luego_nada(self) -> None:
+        self.manager.crear_tarea(self.id_usuario, "A", "")
+        self.manager.crear_tarea(self.id_usuario, "B", "")
+
+        inicial = self.manager.cambios_desde(self.id_usuario)
+        self.assertEqual(["A", "B"], [t.titulo for t in inicial.tareas])
+        self.assertGreater(inicial.revision, 0)
+
+        sin_cambios = self.manager.cambios_desde(self.id_usuario, inicial.revision)
+        self.assertFalse(sin_cambios.hay_cambios)
+        self.assertEqual(inicial.revision, sin_cambios.revision)
+
+    def test_delta_con_ediciones_y_lapidas(self) -> None:
+        a = self.manager.crear_tarea(self.id_usuario, "A", "")
+        b = self.manager.crear_tarea(self.id_usuario, "B", "")
+        self.manager.crear_tarea(self.id_usuario, "C", "")
+        base = self.manager.cambios_desde(self.id_usuario).revision
+
+        self.manager.marcar_completada(self.id_usuario, a.id_tarea, True)
+        self.manager.editar_tarea(self.id_usuario, a.id_tarea, "A2", "")
+        self.manager.eliminar_tarea(self.id_usuario, b.id_tarea)
+        self.manager.crear_tarea(self.id_otro, "Ajena", "")
+
+        delta = self.manager.cambios_desde(self.id_usuario, base)
+        # Una fila por tarea, con su estado actual.
+        self.assertEqual([(a.id_tarea, "A2", True)], [
+            (t.id_tarea, t.titulo, t.completada) for t in delta.tareas
+        ])
+        self.assertEqual([b.id_tarea], delta.eliminadas)
+        self.assertGreater(delta.revision, base)
+
+    def test_escrituras_en_lote_quedan_registradas(self) -> None:
+        base = self.manager.cambios_desde(self.id_usuario).revision
+        self.manager.crear_tareas_lote(self.id_usuario, ["X", "Y", "X"])
+        lote = self.manager.cambios_desde(self.id_usuario, base)
+        self.assertEqual(["X", "Y"], [t.titulo for t in lote.tareas])
+
+        ids = [t.id_tarea for t in lote.tareas]
+        self.manager.eliminar_tareas_lote(self.id_usuario, ids)
+        borrado = self.manager.cambios_desde(self.id_usuario, lote.revision)
+        self.assertEqual([], borrado.tareas)
+        self.assertEqual(sorted(ids), sorted(borrado.eliminadas))
+
+    def test_aplicar_operaciones_registra_creadas_y_eliminadas(self) -> None:
+        tarea = self.manager.crear_tarea(self.id_usuario, "Vieja", "")
+        base = self.manager.cambios_desde(self.id_usuario).revision
+
+        self.repo.aplicar_operaciones([
+            OperacionEscritura(OP_CREAR, self.id_usuario, titulo="Nueva"),
+            OperacionEscritura(OP_ELIMINAR, self.id_usuario, tarea.id_tarea),
+        ])
+
+        delta = self.manager.cambios_desde(self.id_usuario, base)
+        self.assertEqual(["Nueva"], [t.titulo for t in delta.tareas])
+        self.assertEqual([tarea.id_tarea], delta.eliminadas)
+
+    def test_revision_negativa_es_invalida(self) -> None:
+        with self.assertRaises(ValueError):
+            self.manager.cambios_desde(self.id_usuario, -1)
+
+    def test_consulta_usa_indice_por_usuario_y_revision(self) -> None:
+        sql = str(STMT_CAMBIOS_DESDE.compile())
+        params = (self.id_usuario, 0)
+        with self.session_factory() as session:
+            plan = session.connection().exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {sql}", params
+            ).all()
+        detalle = " ".join(fila[-1] for fila in plan)
+        self.assertIn("ix_tareas_cambios_usuario_revision", detalle)
+        self.assertNotIn("TEMP B-TREE", detalle)
+
+
+class TestCambiosMemoria(unittest.TestCase):
+    def test_misma_semantica_que_sqlite(self) -> None:
+        repo = RepositorioTareasMemoria()
+        id_usuario = repo.agregar_usuario()
+        id_otro = repo.agregar_usuario()
+        a, _ = repo.crear_tarea(id_usuario, "A")
+        b, _ = repo.crear_tarea(id_usuario, "B")
+        base = repo.cambios_desde(id_usuario).revision
+
+        repo.marcar_completada(id_usuario, a.id_tarea, True)
+        repo.editar_tarea(id_usuario, a.id_tarea, "A2")
+        repo.eliminar_tarea(id_usuario, b.id_tarea)
+        repo.crear_tarea(id_otro, "Ajena")
+
+        delta = repo.cambios_desde(id_usuario, base)
+        self.assertEqual([(a.id_tarea, "A2", True)], [
+            (t.id_tarea, t.titulo, t.completada) for t in delta.tareas
+        ])
+        self.assertEqual([b.id_tarea], delta.eliminadas)
+        self.assertFalse(repo.cambios_desde(id_usuario, delta.revision).hay_cambios)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,200 @@
+# src/tests/test_cola_escritura.py
+from __future__ import annotations
+
+import unittest
+
+from src.modelo.bd_model import Usuario
+from src.modelo.cola_escritura import MSG_COLA_CERRADA, ColaEscrituraTareas
+from src.modelo.repositorio_memoria import RepositorioTareasMemoria
+from src.modelo.repositorio_tareas import (
+    MSG_ESTADO_ACTUALIZADO,
+    MSG_TAREA_CREADA,
+    MSG_TAREA_NO_EXISTE,
+    MSG_TITULO_DUPLICADO,
+    MSG_TITULO_VACIO,
+    OP_CREAR,
+    OP_EDITAR,
+    OP_MARCAR,
+    OperacionEscritura,
+    RepositorioTareasSQLite,
+)
+from src.tests.bd_pruebas import PruebaConBDMemoria
+
+ESPERA_LARGA_MS = 60_000  # el hilo no vacía por tiempo durante la prueba
+
+
+class RepositorioContador(RepositorioTareasSQLite):
+    """Cuenta las transacciones de `aplicar_operaciones`."""
+
+    lotes: list[int]
+
+    def aplicar_operaciones(self, operaciones):
+        operaciones = list(operaciones)
+        self.lotes.append(len(operaciones))
+        return super().aplicar_operaciones(operaciones)
+
+
+class TestAplicarOperaciones(PruebaConBDMemoria):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.repo = RepositorioContador(session_factory=cls.session_factory)
+        with cls.session_factory.begin() as session:
+            usuario = Usuario(username="cola", password_hash="x")
+            session.add(usuario)
+            session.flush()
+            cls.id_usuario = usuario.id_usuario
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.repo.lotes = []
+        self.repo.limpiar_cache()
+        self.cola = ColaEscrituraTareas(
+            self.repo, max_operaciones=1000, max_espera_ms=ESPERA_LARGA_MS
+        )
+        self.addCleanup(self.cola.cerrar)
+
+    def test_un_savepoint_por_operacion(self) -> None:
+        existente, _ = self.repo.crear_tarea(self.id_usuario, "Existente")
+        resultados = self.repo.aplicar_operaciones(
+            [
+                OperacionEscritura(OP_CREAR, self.id_usuario, titulo="Nueva"),
+                OperacionEscritura(OP_CREAR, self.id_usuario, titulo="Existente"),
+                OperacionEscritura(OP_CREAR, self.id_usuario, titulo="  "),
+                OperacionEscritura(
+                    OP_EDITAR, self.id_usuario, existente.id_tarea, titulo="Nueva"
+                ),
+                OperacionEscritura(
+                    OP_MARCAR, self.id_usuario, existente.id_tarea, completada=True
+                ),
+                OperacionEscritura(OP_MARCAR, self.id_usuario, 999_999),
+            ]
+        )
+
+        self.assertEqual(MSG_TAREA_CREADA, resultados[0][1])
+        self.assertEqual((None, MSG_TITULO_DUPLICADO), resultados[1])
+        self.assertEqual((None, MSG_TITULO_VACIO), resultados[2])
+        self.assertEqual(MSG_TITULO_DUPLICADO, resultados[3].mensaje)
+        self.assertEqual(MSG_ESTADO_ACTUALIZADO, resultados[4].mensaje)
+        self.assertEqual(MSG_TAREA_NO_EXISTE, resultados[5].mensaje)
+
+        tareas = {t.titulo: t for t in self.repo.listar_tareas(self.id_usuario)}
+        self.assertEqual({"Existente", "Nueva"}, set(tareas))
+        self.assertTrue(tareas["Existente"].completada)
+
+        with self.assertRaises(ValueError):
+            self.repo.aplicar_operaciones([OperacionEscritura("otra", 1)])
+
+    def test_vaciar_aplica_todo_en_una_transaccion(self) -> None:
+        futuros = [self.cola.crear_tarea(self.id_usuario, f"T{i}") for i in range(5)]
+        futuros.append(self.cola.crear_tarea(self.id_usuario, "T0"))
+        self.assertEqual(6, self.cola.pendientes)
+        self.assertEqual([], self.repo.listar_tareas(self.id_usuario))
+
+        self.assertEqual(6, self.cola.vaciar())
+        self.assertEqual([6], self.repo.lotes)
+        self.assertEqual(
+            [MSG_TAREA_CREADA] * 5 + [MSG_TITULO_DUPLICADO],
+            [f.result()[1] for f in futuros],
+        )
+        self.assertEqual(5, len(self.repo.listar_tareas(self.id_usuario)))
+
+    def test_coalesce_escrituras_repetidas_de_una_tarea(self) -> None:
+        tarea, _ = self.repo.crear_tarea(self.id_usuario, "Clics")
+        marcas = [
+            self.cola.marcar_completada(self.id_usuario, tarea.id_tarea, estado)
+            for estado in (True, False, True)
+        ]
+        ediciones = [
+            self.cola.editar_tarea(self.id_usuario, tarea.id_tarea, titulo)
+            for titulo in ("A", "B")
+        ]
+        self.assertEqual(2, self.cola.pendientes)
+
+        self.cola.vaciar()
+        self.assertEqual([2], self.repo.lotes)
+        self.assertTrue(all(f.result().ok for f in marcas + ediciones))
+        final = self.repo.obtener_tarea(self.id_usuario, tarea.id_tarea)
+        self.assertEqual(("B", True), (final.titulo, final.completada))
+
+    def test_operacion_intermedia_del_usuario_corta_la_coalescencia(self) -> None:
+        tarea, _ = self.repo.crear_tarea(self.id_usuario, "A")
+        primera = self.cola.editar_tarea(self.id_usuario, tarea.id_tarea, "Y")
+        crear = self.cola.crear_tarea(self.id_usuario, "X")
+        segunda = self.cola.editar_tarea(self.id_usuario, tarea.id_tarea, "X")
+
+        # Mismo resultado que en orden de llamada: el crear no choca con "X".
+        self.assertEqual(3, self.cola.vaciar())
+        self.assertTrue(primera.result().ok)
+        self.assertEqual(MSG_TAREA_CREADA, crear.result()[1])
+        self.assertEqual(MSG_TITULO_DUPLICADO, segunda.result().mensaje)
+        final = self.repo.obtener_tarea(self.id_usuario, tarea.id_tarea)
+        self.assertEqual("Y", final.titulo)
+
+    def test_operacion_de_otro_usuario_no_corta_la_coalescencia(self) -> None:
+        with self.session_factory.begin() as session:
+            otro = Usuario(username="cola_otro", password_hash="x")
+            session.add(otro)
+            session.flush()
+            id_otro = otro.id_usuario
+        tarea, _ = self.repo.crear_tarea(self.id_usuario, "A")
+
+        self.cola.editar_tarea(self.id_usuario, tarea.id_tarea, "B")
+        ajena = self.cola.crear_tarea(id_otro, "B")
+        self.cola.editar_tarea(self.id_usuario, tarea.id_tarea, "C")
+
+        self.assertEqual(2, self.cola.vaciar())
+        self.assertEqual(MSG_TAREA_CREADA, ajena.result()[1])
+        final = self.repo.obtener_tarea(self.id_usuario, tarea.id_tarea)
+        self.assertEqual("C", final.titulo)
+
+    def test_eliminar_corta_la_coalescencia(self) -> None:
+        tarea, _ = self.repo.crear_tarea(self.id_usuario, "Borrar")
+        antes = self.cola.marcar_completada(self.id_usuario, tarea.id_tarea, True)
+        eliminar = self.cola.eliminar_tarea(self.id_usuario, tarea.id_tarea)
+        despues = self.cola.marcar_completada(self.id_usuario, tarea.id_tarea, False)
+
+        self.assertEqual(3, self.cola.vaciar())
+        self.assertTrue(antes.result().ok)
+        self.assertTrue(eliminar.result().ok)
+        self.assertEqual(MSG_TAREA_NO_EXISTE, despues.result().mensaje)
+
+    def test_futuro_cancelado_no_se_aplica(self) -> None:
+        futuro = self.cola.crear_tarea(self.id_usuario, "Cancelada")
+        self.assertTrue(futuro.cancel())
+        self.assertEqual(0, self.cola.vaciar())
+        self.assertEqual([], self.repo.listar_tareas(self.id_usuario))
+
+
+class TestColaEscrituraEnSegundoPlano(unittest.TestCase):
+    def setUp(self) -> None:
+        self.repo = RepositorioTareasMemoria()
+        self.id_usuario = self.repo.agregar_usuario()
+
+    def test_vacia_al_llegar_a_max_operaciones(self) -> None:
+        cola = ColaEscrituraTareas(
+            self.repo, max_operaciones=3, max_espera_ms=ESPERA_LARGA_MS
+        )
+        self.addCleanup(cola.cerrar)
+        futuros = [cola.crear_tarea(self.id_usuario, f"T{i}") for i in range(3)]
+
+        for futuro in futuros:
+            self.assertIsNotNone(futuro.result(timeout=5)[0])
+
+    def test_vacia_al_vencer_max_espera(self) -> None:
+        cola = ColaEscrituraTareas(self.repo, max_operaciones=100, max_espera_ms=10)
+        self.addCleanup(cola.cerrar)
+        tarea, _ = cola.crear_tarea(self.id_usuario, "Sola").result(timeout=5)
+        self.assertEqual("Sola", tarea.titulo)
+
+    def test_cerrar_aplica_lo_pendiente_y_rechaza_nuevas(self) -> None:
+        cola = ColaEscrituraTareas(
+            self.repo, max_operaciones=100, max_espera_ms=ESPERA_LARGA_MS
+        )
+        futuro = cola.crear_tarea(self.id_usuario, "Al salir")
+        cola.cerrar()
+
+        self.assertTrue(futuro.done())
+        self.assertEqual(1, self.repo.contar_tareas(self.id_usuario).total)
+        with self.assertRaisesRegex(RuntimeError, MSG_COLA_CERRADA):
+            cola.crear_tarea(self.id_usuario, "Tarde")
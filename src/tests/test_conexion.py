@@ -0,0 +1,204 @@
+# src/tests/test_conexion.py
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from src.modelo.bd_model import Usuario
+from src.modelo.conexion import (
+    ENV_PERFIL,
+    PERFILES,
+    URL_MEMORIA,
+    _create_engine,
+    cerrar_engines,
+    get_engine,
+    get_engine_lectura,
+    get_session_factory,
+    init_db,
+    resolver_perfil,
+    url_solo_lectura,
+)
+from src.modelo.repositorio_tareas import RepositorioTareasSQLite
+from src.tests.bd_pruebas import BDPruebas
+
+
+class TestPerfilesSQLite(unittest.TestCase):
+    def test_perfil_por_defecto_es_safe(self) -> None:
+        with mock.patch.dict(os.environ, {}, clear=False):
+            os.environ.pop(ENV_PERFIL, None)
+            self.assertIs(PERFILES["safe"], resolver_perfil())
+
+    def test_perfil_desde_variable_de_entorno(self) -> None:
+        with mock.patch.dict(os.environ, {ENV_PERFIL: "FAST"}):
+            self.assertIs(PERFILES["fast"], resolver_perfil())
+
+    def test_perfil_desconocido_falla(self) -> None:
+        with self.assertRaises(ValueError):
+            resolver_perfil("turbo")
+
+    def test_engine_fast_aplica_wal(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            url = f"sqlite:///{Path(tmp) / 'perfil.sqlite'}"
+            engine = _create_engine(url, perfil="fast")
+            try:
+                with engine.connect() as conn:
+                    modo = conn.execute(text("PRAGMA journal_mode")).scalar()
+                    sync = conn.execute(text("PRAGMA synchronous")).scalar()
+                    self.assertEqual("wal", str(modo).lower())
+                    self.assertEqual(1, sync)  # NORMAL
+            finally:
+                engine.dispose()
+
+    def test_engine_safe_mantiene_rollback_journal(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            url = f"sqlite:///{Path(tmp) / 'perfil.sqlite'}"
+            engine = _create_engine(url, perfil="safe")
+            try:
+                with engine.connect() as conn:
+                    modo = conn.execute(text("PRAGMA journal_mode")).scalar()
+                    sync = conn.execute(text("PRAGMA synchronous")).scalar()
+                    self.assertEqual("delete", str(modo).lower())
+                    self.assertEqual(2, sync)  # FULL
+            finally:
+                engine.dispose()
+
+
+class TestRegistroEngines(unittest.TestCase):
+    def tearDown(self) -> None:
+        cerrar_engines()
+
+    def test_importar_modulos_no_crea_engine(self) -> None:
+        codigo = (
+            "import src.modelo.conexion as c;"
+            "import src.modelo.repositorio_tareas;"
+            "import src.logica.login_logica;"
+            "print(len(c._ENGINES))"
+        )
+        salida = subprocess.run(
+            [sys.executable, "-c", codigo],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parents[2],
+        )
+        self.assertEqual("0", salida.stdout.strip())
+
+    def test_un_engine_por_url(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            url_a = f"sqlite:///{Path(tmp) / 'a.sqlite'}"
+            url_b = f"sqlite:///{Path(tmp) / 'b.sqlite'}"
+
+            self.assertIs(get_engine(url_a), get_engine(url_a))
+            self.assertIsNot(get_engine(url_a), get_engine(url_b))
+            self.assertIs(get_session_factory(url_a), get_session_factory(url_a))
+
+            init_db(url_b)
+            with get_session_factory(url_b)() as session:
+                tablas = session.execute(
+                    text("SELECT name FROM sqlite_master WHERE type='table'")
+                ).scalars()
+                self.assertIn("tareas", set(tablas))
+            cerrar_engines()
+
+
+class TestBDMemoria(unittest.TestCase):
+    def tearDown(self) -> None:
+        cerrar_engines()
+
+    def test_url_memoria_comparte_bd_entre_sesiones(self) -> None:
+        init_db(URL_MEMORIA)
+        factory = get_session_factory(URL_MEMORIA)
+
+        with factory.begin() as session:
+            session.add(Usuario(username="memoria", password_hash="x"))
+
+        with factory() as session:
+            total = session.query(Usuario).filter_by(username="memoria").count()
+            self.assertEqual(1, total)
+
+    def test_savepoint_revierte_cambios_de_la_prueba(self) -> None:
+        bd = BDPruebas()
+        bd.abrir()
+        try:
+            bd.iniciar_prueba()
+            with bd.session_factory.begin() as session:
+                session.add(Usuario(username="temporal", password_hash="x"))
+            with bd.session_factory() as session:
+                self.assertEqual(1, session.query(Usuario).count())
+            bd.revertir_prueba()
+
+            with bd.session_factory() as session:
+                self.assertEqual(0, session.query(Usuario).count())
+        finally:
+            bd.cerrar()
+
+
+class TestLecturaEscritura(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.url = f"sqlite:///{Path(tmp.name) / 'rw.sqlite'}"
+        self.addCleanup(cerrar_engines)
+        init_db(self.url)
+
+    def test_url_memoria_no_se_convierte(self) -> None:
+        self.assertEqual(URL_MEMORIA, url_solo_lectura(URL_MEMORIA))
+        self.assertIs(get_engine(URL_MEMORIA), get_engine_lectura(URL_MEMORIA))
+
+    def test_escritor_unico_y_lectores_solo_lectura(self) -> None:
+        escritor = get_engine(self.url)
+        lector = get_engine_lectura(self.url)
+
+        self.assertEqual(1, escritor.pool.size())
+        self.assertIsNot(escritor, lector)
+        with lector.connect() as conn:
+            with self.assertRaises(OperationalError):
+                conn.execute(text("DELETE FROM tareas"))
+
+    def test_repositorio_lee_por_lectores(self) -> None:
+        factory = get_session_factory(self.url)
+        with factory.begin() as session:
+            usuario = Usuario(username="rw", password_hash="x")
+            session.add(usuario)
+            session.flush()
+            id_usuario = usuario.id_usuario
+
+        lectura = sessionmaker(bind=get_engine_lectura(self.url))
+        repo = RepositorioTareasSQLite(factory, session_factory_lectura=lectura)
+        tarea, _ = repo.crear_tarea(id_usuario, "Leer desde lector", "")
+
+        listadas = repo.listar_tareas(id_usuario)
+        self.assertEqual([tarea.id_tarea], [t.id_tarea for t in listadas])
+        self.assertIsNotNone(repo.obtener_tarea(id_usuario, tarea.id_tarea))
+
+    def test_iter_tareas_en_pausa_no_bloquea_escrituras(self) -> None:
+        # Perfil safe (rollback journal, sin busy_timeout): un lock de lectura
+        # abierto haría fallar al escritor con "database is locked".
+        factory = get_session_factory(self.url)
+        with factory.begin() as session:
+            usuario = Usuario(username="iter", password_hash="x")
+            session.add(usuario)
+            session.flush()
+            id_usuario = usuario.id_usuario
+        lectura = sessionmaker(bind=get_engine_lectura(self.url))
+        repo = RepositorioTareasSQLite(factory, session_factory_lectura=lectura)
+        ids = [repo.crear_tarea(id_usuario, f"T{i}")[0].id_tarea for i in range(5)]
+
+        generador = repo.iter_tareas(id_usuario, tamano_lote=2)
+        self.assertEqual(ids[0], next(generador).id_tarea)
+
+        nueva, _ = repo.crear_tarea(id_usuario, "Durante el recorrido")
+        self.assertIsNotNone(nueva)
+        self.assertTrue(repo.eliminar_tarea(id_usuario, ids[4]).ok)
+
+        resto = [fila.id_tarea for fila in generador]
+        self.assertEqual(ids[1:4] + [nueva.id_tarea], resto)
@@ -0,0 +1,128 @@
+# src/tests/test_instrumentacion.py
+from __future__ import annotations
+
+import unittest
+
+from src.logica.task_manager import TaskManager
+from src.modelo.bd_model import Usuario
+from src.modelo.instrumentacion import InstrumentadorSQL, normalizar_sentencia
+from src.modelo.repositorio_tareas import MSG_TAREA_NO_EXISTE, RepositorioTareasSQLite
+from src.tests.bd_pruebas import PruebaConBDMemoria
+
+
+class TestNormalizarSentencia(unittest.TestCase):
+    def test_colapsa_literales_y_listas(self) -> None:
+        sql = (
+            "SELECT *  FROM tareas\n"
+            " WHERE id_tarea IN (?, ?, ?) AND titulo = 'x' LIMIT 10"
+        )
+        self.assertEqual(
+            "SELECT * FROM tareas WHERE id_tarea IN (?) AND titulo = ? LIMIT ?",
+            normalizar_sentencia(sql),
+        )
+
+
+class TestInstrumentadorSQL(PruebaConBDMemoria):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.repo = RepositorioTareasSQLite(session_factory=cls.session_factory)
+        cls.manager = TaskManager(repositorio=cls.repo)
+        with cls.session_factory.begin() as session:
+            usuario = Usuario(username="instr", password_hash="x")
+            session.add(usuario)
+            session.flush()
+            cls.id_usuario = usuario.id_usuario
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.repo.limpiar_cache()  # los ids se reutilizan tras cada SAVEPOINT
+        self.instr = InstrumentadorSQL(umbral_lento_ms=10_000)
+        self.instr.adjuntar(self.bd.engine)
+        self.addCleanup(self.instr.desadjuntar)
+
+    def test_listar_emite_una_consulta(self) -> None:
+        self.manager.crear_tarea(self.id_usuario, "Uno", "")
+        self.manager.crear_tarea(self.id_usuario, "Dos", "")
+
+        with self.instr.medir():
+            self.manager.listar_tareas(self.id_usuario)
+            snap = self.instr.snapshot()
+
+        self.assertLessEqual(snap.ejecuciones_de("SELECT"), 1)
+        self.assertEqual(0, snap.lentas)
+
+    def test_snapshot_agrega_por_sentencia(self) -> None:
+        for _ in range(5):
+            self.manager.listar_tareas(self.id_usuario)
+
+        snap = self.instr.snapshot()
+        selects = [e for e in snap.sentencias if e.sentencia.startswith("SELECT")]
+        self.assertEqual(1, len(selects))
+        self.assertEqual(5, selects[0].ejecuciones)
+        self.assertEqual(5, sum(selects[0].histograma.values()))
+        self.assertLessEqual(selects[0].p50_ms, selects[0].p99_ms)
+        self.assertIn("SELECT", snap.como_texto())
+
+    def test_umbral_lento_registra_en_log(self) -> None:
+        self.instr.umbral_lento_ms = 0.0
+        with self.assertLogs("src.modelo.instrumentacion", level="WARNING"):
+            self.manager.listar_tareas(self.id_usuario)
+        self.assertGreaterEqual(self.instr.snapshot().lentas, 1)
+
+    def test_sentencias_reutilizan_compiled_cache(self) -> None:
+        tarea = self.manager.crear_tarea(self.id_usuario, "Cache", "")
+        self.manager.listar_tareas(self.id_usuario)  # calienta el compiled cache
+
+        self.instr.reiniciar()
+        for _ in range(10):
+            self.manager.listar_tareas(self.id_usuario)
+            self.repo.limpiar_cache()  # fuerza la lectura por clave primaria
+            self.repo.obtener_tarea(self.id_usuario, tarea.id_tarea)
+
+        snap = self.instr.snapshot()
+        self.assertGreaterEqual(snap.cache_aciertos, 19)
+        self.assertGreaterEqual(snap.tasa_aciertos_cache, 0.95)
+
+    def test_escrituras_de_una_tarea_no_cargan_la_entidad(self) -> None:
+        tarea = self.manager.crear_tarea(self.id_usuario, "Sin carga", "")
+
+        with self.instr.medir():
+            self.assertTrue(
+                self.repo.editar_tarea(self.id_usuario, tarea.id_tarea, "Editada").ok
+            )
+            self.assertTrue(
+                self.repo.marcar_completada(self.id_usuario, tarea.id_tarea, True).ok
+            )
+            self.assertTrue(
+                self.repo.eliminar_tarea(self.id_usuario, tarea.id_tarea).ok
+            )
+            snap = self.instr.snapshot()
+
+        self.assertEqual(0, snap.ejecuciones_de("SELECT"))
+        self.assertEqual(2, snap.ejecuciones_de("UPDATE tareas"))
+        self.assertEqual(1, snap.ejecuciones_de("DELETE FROM tareas"))
+
+        res = self.repo.marcar_completada(self.id_usuario, tarea.id_tarea, False)
+        self.assertFalse(res.ok)
+        self.assertEqual(MSG_TAREA_NO_EXISTE, res.mensaje)
+
+    def test_obtener_tarea_repetida_no_vuelve_a_sqlite(self) -> None:
+        tarea = self.manager.crear_tarea(self.id_usuario, "Dialogo", "")
+
+        with self.instr.medir():
+            for _ in range(5):
+                self.assertIsNotNone(
+                    self.repo.obtener_tarea(self.id_usuario, tarea.id_tarea)
+                )
+            self.assertIsNone(self.repo.obtener_tarea(-1, tarea.id_tarea))
+            snap = self.instr.snapshot()
+        self.assertEqual(1, snap.ejecuciones_de("SELECT"))
+
+        # Una escritura invalida la entrada: la siguiente lectura ve el cambio.
+        self.repo.editar_tarea(self.id_usuario, tarea.id_tarea, "Editada")
+        with self.instr.medir():
+            editada = self.repo.obtener_tarea(self.id_usuario, tarea.id_tarea)
+            snap = self.instr.snapshot()
+        self.assertEqual("Editada", editada.titulo)
+        self.assertEqual(1, snap.ejecuciones_de("SELECT"))
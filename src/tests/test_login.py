@@ -1,6 +1,8 @@
 from src.logica.login_logica import LoginLogica
-from src.modelo.conexion import SessionLocal
 from src.modelo.bd_model import Usuario
+from src.tests.bd_pruebas import BDPruebas
+
+bd = BDPruebas()
 
 
 # =====================================================
@@ -8,10 +10,11 @@ from src.modelo.bd_model import Usuario
 # =====================================================
 def setup_module():
     """
-    Crea usuarios de prueba para los casos felices.
+    Crea usuarios de prueba para los casos felices (BD en memoria).
     """
-    session = SessionLocal()
-    login_local = LoginLogica()
+    bd.abrir()
+    session = bd.session_factory()
+    login_local = LoginLogica(session_factory=bd.session_factory)
 
     usuarios_prueba = [
         ("admin", "1234"),
@@ -33,12 +36,21 @@ def setup_module():
     session.close()
 
 
+def teardown_module():
+    bd.cerrar()
+
+
 # =====================================================
 # SETUP PARA CADA TEST (se ejecuta antes de cada prueba)
 # =====================================================
 def setup_function():
     global login
-    login = LoginLogica()
+    bd.iniciar_prueba()
+    login = LoginLogica(session_factory=bd.session_factory)
+
+
+def teardown_function():
+    bd.revertir_prueba()
 
 
 # =====================================================
@@ -0,0 +1,125 @@
+# src/tests/test_mantenimiento.py
+from __future__ import annotations
+
+import sqlite3
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from sqlalchemy.orm import sessionmaker
+
+from src.modelo.bd_model import Usuario
+from src.modelo.conexion import _create_engine, init_db
+from src.modelo.mantenimiento import MantenimientoBD
+from src.modelo.repositorio_tareas import RepositorioTareasSQLite
+
+
+class TestMantenimientoBD(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.ruta = Path(tmp.name) / "mant.sqlite"
+        # Como el escritor de la app: una conexión, busy_timeout de 5 s.
+        self.engine = _create_engine(
+            f"sqlite:///{self.ruta}", perfil="fast", tamano_pool=1
+        )
+        self.addCleanup(self.engine.dispose)
+        init_db(engine=self.engine)
+
+        factory = sessionmaker(bind=self.engine)
+        with factory.begin() as session:
+            usuario = Usuario(username="mant", password_hash="x")
+            session.add(usuario)
+            session.flush()
+            self.id_usuario = usuario.id_usuario
+        self.repo = RepositorioTareasSQLite(session_factory=factory)
+
+    def test_migracion_activa_auto_vacuum_incremental(self) -> None:
+        self.assertTrue(MantenimientoBD(self.engine).estado().incremental)
+
+    def test_reclama_paginas_de_tareas_eliminadas(self) -> None:
+        ids = []
+        for i in range(150):
+            tarea, _ = self.repo.crear_tarea(self.id_usuario, f"T{i}", "x" * 1000)
+            ids.append(tarea.id_tarea)
+        for id_tarea in ids:
+            self.repo.eliminar_tarea(self.id_usuario, id_tarea)
+
+        mantenimiento = MantenimientoBD(self.engine, paginas_por_porcion=8)
+        libres = mantenimiento.estado().freelist_count
+        self.assertGreater(libres, 8)
+
+        porcion = mantenimiento.ejecutar_porcion()
+        self.assertEqual(8, porcion.paginas_liberadas)
+        self.assertEqual(libres - 8, mantenimiento.estado().freelist_count)
+
+        resultado = mantenimiento.ejecutar_en_reposo(presupuesto_s=5.0)
+
+        liberadas = sum(p.paginas_liberadas for p in resultado.porciones)
+        self.assertEqual(libres - 8, liberadas)
+        self.assertGreater(resultado.bytes_recuperados, 0)
+        self.assertTrue(resultado.optimizado)
+        self.assertEqual(0, mantenimiento.estado().freelist_count)
+
+    def test_porcion_se_limita_a_las_paginas_libres(self) -> None:
+        for i in range(10):
+            tarea, _ = self.repo.crear_tarea(self.id_usuario, f"T{i}", "x" * 1000)
+            self.repo.eliminar_tarea(self.id_usuario, tarea.id_tarea)
+
+        mantenimiento = MantenimientoBD(self.engine, paginas_por_porcion=1000)
+        libres = mantenimiento.estado().freelist_count
+        self.assertGreater(libres, 0)
+
+        porcion = mantenimiento.ejecutar_porcion()
+
+        self.assertEqual(min(1000, libres), porcion.paginas_liberadas)
+        self.assertEqual(0, mantenimiento.estado().freelist_count)
+
+    def _liberar_paginas(self) -> None:
+        for i in range(20):
+            tarea, _ = self.repo.crear_tarea(self.id_usuario, f"T{i}", "x" * 1000)
+            self.repo.eliminar_tarea(self.id_usuario, tarea.id_tarea)
+
+    def test_se_omite_si_el_escritor_esta_en_uso(self) -> None:
+        self._liberar_paginas()
+        mantenimiento = MantenimientoBD(self.engine)
+
+        with self.engine.connect():
+            inicio = time.perf_counter()
+            resultado = mantenimiento.ejecutar_en_reposo()
+
+        self.assertTrue(resultado.omitido)
+        self.assertLess(time.perf_counter() - inicio, 1.0)
+        self.assertEqual((), resultado.porciones)
+
+    def test_se_omite_sin_esperar_si_la_bd_esta_bloqueada(self) -> None:
+        self._liberar_paginas()
+        mantenimiento = MantenimientoBD(self.engine)
+        otra = sqlite3.connect(self.ruta, isolation_level=None)
+        self.addCleanup(otra.close)
+        otra.execute("BEGIN IMMEDIATE")
+
+        inicio = time.perf_counter()
+        resultado = mantenimiento.ejecutar_en_reposo()
+
+        self.assertTrue(resultado.omitido)
+        self.assertLess(time.perf_counter() - inicio, 1.0)  # busy_timeout es 5 s
+        otra.execute("ROLLBACK")
+        with self.engine.connect() as conn:
+            espera = conn.exec_driver_sql("PRAGMA busy_timeout").scalar()
+        self.assertEqual(5_000, espera)  # se restaura para la app
+
+    def test_en_segundo_plano_devuelve_futuro(self) -> None:
+        self._liberar_paginas()
+        mantenimiento = MantenimientoBD(self.engine)
+
+        resultado = mantenimiento.ejecutar_en_segundo_plano(5.0).result(timeout=30)
+
+        self.assertFalse(resultado.omitido)
+        self.assertEqual(0, mantenimiento.estado().freelist_count)
+
+    def test_sin_paginas_libres_no_hace_nada(self) -> None:
+        resultado = MantenimientoBD(self.engine).ejecutar_en_reposo()
+        self.assertEqual((), resultado.porciones)
+        self.assertEqual(resultado.bytes_antes, resultado.bytes_despues)
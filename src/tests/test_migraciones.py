@@ -0,0 +1,140 @@
+# src/tests/test_migraciones.py
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.modelo.conexion import _create_engine, cerrar_engines, init_db
+from src.modelo.migraciones import MIGRACIONES, aplicar_migraciones, version_actual
+
+# Esquema "antiguo": tablas sin los índices compuestos de tareas
+ESQUEMA_LEGADO = (
+    "CREATE TABLE usuarios ("
+    " id_usuario INTEGER PRIMARY KEY AUTOINCREMENT,"
+    " username VARCHAR(50) NOT NULL UNIQUE,"
+    " password_hash VARCHAR(255) NOT NULL,"
+    " creado_en DATETIME NOT NULL DEFAULT (datetime('now','localtime')))",
+    "CREATE TABLE tareas ("
+    " id_tarea INTEGER PRIMARY KEY AUTOINCREMENT,"
+    " id_usuario INTEGER NOT NULL REFERENCES usuarios (id_usuario),"
+    " titulo VARCHAR(120) NOT NULL,"
+    " descripcion TEXT,"
+    " completada BOOLEAN NOT NULL DEFAULT 0,"
+    " creada_en DATETIME NOT NULL DEFAULT (datetime('now','localtime')),"
+    " actualizada_en DATETIME NOT NULL DEFAULT (datetime('now','localtime')),"
+    " CONSTRAINT uq_tareas_usuario_titulo UNIQUE (id_usuario, titulo))",
+)
+
+
+class TestMigraciones(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.url = f"sqlite:///{Path(self._tmp.name) / 'legado.sqlite'}"
+        self.engine = _create_engine(self.url)
+        self.addCleanup(self.engine.dispose)
+
+    def _indices(self) -> set[str]:
+        with self.engine.connect() as conn:
+            return set(
+                conn.exec_driver_sql(
+                    "SELECT name FROM sqlite_master WHERE type='index'"
+                ).scalars()
+            )
+
+    def _tablas(self) -> set[str]:
+        with self.engine.connect() as conn:
+            return set(
+                conn.exec_driver_sql(
+                    "SELECT name FROM sqlite_master WHERE type='table'"
+                ).scalars()
+            )
+
+    def test_bd_existente_recibe_indices_y_estadisticas(self) -> None:
+        with self.engine.begin() as conn:
+            for sentencia in ESQUEMA_LEGADO:
+                conn.exec_driver_sql(sentencia)
+
+        aplicadas = aplicar_migraciones(self.engine)
+
+        ultima = max(m.version for m in MIGRACIONES)
+        self.assertEqual(ultima, aplicadas[-1])
+        self.assertIn("ix_tareas_usuario_completada", self._indices())
+        self.assertIn("ix_tareas_usuario_creada", self._indices())
+        self.assertIn("ix_tareas_usuario_titulo_nocase", self._indices())
+        with self.engine.connect() as conn:
+            columnas = [
+                fila[2]
+                for fila in conn.exec_driver_sql(
+                    "PRAGMA index_info(ix_tareas_usuario_completada)"
+                )
+            ]
+        self.assertEqual(["id_usuario", "completada", "creada_en"], columnas)
+        with self.engine.connect() as conn:
+            self.assertEqual(ultima, version_actual(conn))
+            stat = conn.exec_driver_sql(
+                "SELECT count(*) FROM sqlite_master WHERE name='sqlite_stat1'"
+            ).scalar()
+            self.assertEqual(1, stat)
+
+    def test_init_db_migra_archivo_en_version_cero(self) -> None:
+        # Lo que hace main.py al arrancar sobre un DB.sqlite anterior.
+        with self.engine.begin() as conn:
+            for sentencia in ESQUEMA_LEGADO:
+                conn.exec_driver_sql(sentencia)
+            self.assertEqual(0, version_actual(conn))
+
+        self.addCleanup(cerrar_engines)
+        init_db(self.url)
+
+        with self.engine.connect() as conn:
+            self.assertEqual(max(m.version for m in MIGRACIONES), version_actual(conn))
+        self.assertTrue({"tareas_fts", "tareas_cambios"} <= self._tablas())
+        self.assertIn("ix_tareas_usuario_creada", self._indices())
+
+    def test_migraciones_son_idempotentes(self) -> None:
+        init_db(engine=self.engine)
+        self.assertEqual([], aplicar_migraciones(self.engine))
+
+    def test_busqueda_fts_indexa_tareas_existentes(self) -> None:
+        with self.engine.begin() as conn:
+            for sentencia in ESQUEMA_LEGADO:
+                conn.exec_driver_sql(sentencia)
+            conn.exec_driver_sql(
+                "INSERT INTO usuarios (username, password_hash) VALUES ('u', 'x')"
+            )
+            conn.exec_driver_sql(
+                "INSERT INTO tareas (id_usuario, titulo) VALUES (1, 'Tarea previa')"
+            )
+
+        aplicar_migraciones(self.engine)
+
+        self.assertIn("tareas_fts", self._tablas())
+        with self.engine.connect() as conn:
+            encontradas = conn.exec_driver_sql(
+                "SELECT rowid FROM tareas_fts WHERE tareas_fts MATCH 'previa'"
+            ).scalars().all()
+        self.assertEqual([1], encontradas)
+
+    def test_registro_de_cambios_incluye_tareas_existentes(self) -> None:
+        with self.engine.begin() as conn:
+            for sentencia in ESQUEMA_LEGADO:
+                conn.exec_driver_sql(sentencia)
+            conn.exec_driver_sql(
+                "INSERT INTO usuarios (username, password_hash) VALUES ('u', 'x')"
+            )
+            conn.exec_driver_sql(
+                "INSERT INTO tareas (id_usuario, titulo) VALUES (1, 'Tarea previa')"
+            )
+
+        aplicar_migraciones(self.engine)
+
+        self.assertIn("tareas_cambios", self._tablas())
+        self.assertIn("ix_tareas_cambios_usuario_revision", self._indices())
+        with self.engine.begin() as conn:
+            conn.exec_driver_sql("DELETE FROM tareas WHERE id_tarea = 1")
+            cambios = conn.exec_driver_sql(
+                "SELECT id_usuario, id_tarea, eliminada FROM tareas_cambios"
+            ).all()
+        self.assertEqual([(1, 1, 1)], cambios)
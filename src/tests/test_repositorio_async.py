@@ -0,0 +1,118 @@
+# src/tests/test_repositorio_async.py
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import tempfile
+import unittest
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.modelo.bd_model import Usuario
+from src.modelo.conexion import _create_async_engine, init_db_async
+from src.modelo.repositorio_tareas import MSG_TAREA_NO_EXISTE, MSG_TITULO_DUPLICADO
+
+HAY_AIOSQLITE = importlib.util.find_spec("aiosqlite") is not None
+
+
+@unittest.skipUnless(HAY_AIOSQLITE, "requiere aiosqlite")
+class TestAsyncRepositorioTareas(unittest.IsolatedAsyncioTestCase):
+    """Mismos casos CRUD que TestTaskManagerConDBMemoria, sobre aiosqlite."""
+
+    async def asyncSetUp(self) -> None:
+        from src.modelo.repositorio_tareas_async import AsyncRepositorioTareasSQLite
+
+        # Archivo temporal: con "sqlite://" todas las tareas compartirían una
+        # única conexión y no podrían ejecutarse en paralelo.
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.engine = _create_async_engine(f"sqlite:///{Path(tmp.name) / 'a.sqlite'}")
+        await init_db_async(engine=self.engine)
+
+        factory = async_sessionmaker(
+            bind=self.engine,
+            autoflush=False,
+            expire_on_commit=False,
+            class_=AsyncSession,
+        )
+        async with factory.begin() as session:
+            usuario = Usuario(username="demo_async", password_hash="x")
+            session.add(usuario)
+            await session.flush()
+            self.id_usuario = usuario.id_usuario
+
+        self.repo = AsyncRepositorioTareasSQLite(session_factory=factory)
+
+    async def asyncTearDown(self) -> None:
+        await self.engine.dispose()
+
+    # HU02
+    async def test_crear_tarea_ok(self) -> None:
+        tarea, _msg = await self.repo.crear_tarea(
+            self.id_usuario, "Comprar pan", "Ir a la tienda"
+        )
+        self.assertIsNotNone(tarea)
+
+        tareas = await self.repo.listar_tareas(self.id_usuario)
+        self.assertEqual(1, len(tareas))
+        self.assertEqual("Comprar pan", tareas[0].titulo)
+
+    async def test_crear_tarea_titulo_vacio_falla(self) -> None:
+        tarea, _msg = await self.repo.crear_tarea(self.id_usuario, "   ", "x")
+        self.assertIsNone(tarea)
+
+    async def test_crear_tarea_duplicada_retorna_none(self) -> None:
+        t1, _ = await self.repo.crear_tarea(self.id_usuario, "Estudiar", "")
+        self.assertIsNotNone(t1)
+
+        t2, msg = await self.repo.crear_tarea(self.id_usuario, "Estudiar", "")
+        self.assertIsNone(t2)
+        self.assertEqual(MSG_TITULO_DUPLICADO, msg)
+
+    # HU04
+    async def test_editar_tarea_ok(self) -> None:
+        tarea, _ = await self.repo.crear_tarea(self.id_usuario, "Original", "A")
+
+        res = await self.repo.editar_tarea(
+            self.id_usuario, tarea.id_tarea, "Editada", "B"
+        )
+        self.assertTrue(res.ok)
+
+        editada = await self.repo.obtener_tarea(self.id_usuario, tarea.id_tarea)
+        self.assertEqual("Editada", editada.titulo)
+        self.assertEqual("B", editada.descripcion)
+
+    # HU05
+    async def test_eliminar_tarea_ok(self) -> None:
+        tarea, _ = await self.repo.crear_tarea(self.id_usuario, "Eliminar", "")
+
+        res = await self.repo.eliminar_tarea(self.id_usuario, tarea.id_tarea)
+        self.assertTrue(res.ok)
+        self.assertEqual([], await self.repo.listar_tareas(self.id_usuario))
+
+        res = await self.repo.eliminar_tarea(self.id_usuario, tarea.id_tarea)
+        self.assertEqual(MSG_TAREA_NO_EXISTE, res.mensaje)
+
+    # HU06
+    async def test_marcar_completada_ok(self) -> None:
+        tarea, _ = await self.repo.crear_tarea(self.id_usuario, "Completar", "")
+
+        res = await self.repo.marcar_completada(self.id_usuario, tarea.id_tarea, True)
+        self.assertTrue(res.ok)
+
+        tareas = await self.repo.listar_tareas(self.id_usuario)
+        self.assertTrue(bool(tareas[0].completada))
+
+    async def test_lecturas_concurrentes(self) -> None:
+        ids = []
+        for i in range(10):
+            tarea, _ = await self.repo.crear_tarea(self.id_usuario, f"T{i}", "")
+            ids.append(tarea.id_tarea)
+
+        listados, *obtenidas = await asyncio.gather(
+            self.repo.listar_tareas(self.id_usuario),
+            *(self.repo.obtener_tarea(self.id_usuario, i) for i in ids),
+        )
+        self.assertEqual(10, len(listados))
+        self.assertEqual(ids, [t.id_tarea for t in obtenidas])
@@ -0,0 +1,148 @@
+# src/tests/test_repositorio_cache.py
+from __future__ import annotations
+
+from src.logica.task_manager import TaskManager
+from src.modelo.bd_model import Usuario
+from src.modelo.repositorio_cache import RepositorioTareasCache
+from src.modelo.repositorio_tareas import (
+    OP_CREAR,
+    OperacionEscritura,
+    RepositorioTareasSQLite,
+)
+from src.tests.bd_pruebas import PruebaConBDMemoria
+
+
+class RelojFalso:
+    def __init__(self) -> None:
+        self.ahora = 0.0
+
+    def __call__(self) -> float:
+        return self.ahora
+
+
+class TestRepositorioTareasCache(PruebaConBDMemoria):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.repo_bd = RepositorioTareasSQLite(session_factory=cls.session_factory)
+        with cls.session_factory.begin() as session:
+            usuarios = [
+                Usuario(username=f"cache_{i}", password_hash="x") for i in range(2)
+            ]
+            session.add_all(usuarios)
+            session.flush()
+            cls.id_usuario, cls.id_otro = (u.id_usuario for u in usuarios)
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.repo_bd.limpiar_cache()
+        self.reloj = RelojFalso()
+        self.repo = RepositorioTareasCache(self.repo_bd, ttl_s=10, reloj=self.reloj)
+        self.manager = TaskManager(repositorio=self.repo)
+
+    def test_lecturas_repetidas_se_sirven_del_cache(self) -> None:
+        self.manager.crear_tarea(self.id_usuario, "Uno", "")
+
+        primera = self.manager.listar_tareas(self.id_usuario)
+        primera.clear()  # la copia devuelta no altera lo guardado
+        segunda = self.manager.listar_tareas(self.id_usuario)
+        self.assertEqual(["Uno"], [t.titulo for t in segunda])
+        self.assertEqual(1, self.manager.contar_tareas(self.id_usuario).total)
+        self.manager.contar_tareas(self.id_usuario)
+
+        stats = self.repo.estadisticas()
+        self.assertEqual((2, 2), (stats.aciertos, stats.fallos))
+        self.assertEqual(0.5, stats.tasa_aciertos)
+        self.assertEqual((1, 2), (stats.usuarios, stats.entradas))
+
+    def test_escrituras_invalidan_solo_al_usuario(self) -> None:
+        tarea = self.manager.crear_tarea(self.id_usuario, "Uno", "")
+        self.manager.crear_tarea(self.id_otro, "Ajena", "")
+        self.manager.listar_tareas(self.id_usuario)
+        self.manager.listar_tareas(self.id_otro)
+
+        self.manager.marcar_completada(self.id_usuario, tarea.id_tarea, True)
+        self.assertTrue(self.manager.listar_tareas(self.id_usuario)[0].completada)
+        self.assertEqual(1, self.manager.contar_tareas(self.id_usuario).completadas)
+
+        self.manager.editar_tarea(self.id_usuario, tarea.id_tarea, "Editada")
+        lectura = self.manager.listar_tareas_lectura(self.id_usuario)
+        self.assertEqual(["Editada"], [f.titulo for f in lectura])
+
+        self.manager.eliminar_tareas_lote(self.id_usuario, [tarea.id_tarea])
+        self.assertEqual([], self.manager.listar_tareas(self.id_usuario))
+
+        # El otro usuario no se invalidó: su listado sigue en caché.
+        fallos = self.repo.estadisticas().fallos
+        self.assertEqual(1, len(self.manager.listar_tareas(self.id_otro)))
+        self.assertEqual(fallos, self.repo.estadisticas().fallos)
+
+    def test_ttl_caduca_las_entradas(self) -> None:
+        self.manager.listar_tareas(self.id_usuario)
+        self.repo_bd.crear_tarea(self.id_usuario, "Por fuera", "")  # sin invalidar
+
+        self.reloj.ahora = 9.0
+        self.assertEqual([], self.manager.listar_tareas(self.id_usuario))
+        self.reloj.ahora = 10.0
+        self.assertEqual(1, len(self.manager.listar_tareas(self.id_usuario)))
+
+    def test_lru_desaloja_al_usuario_menos_reciente(self) -> None:
+        repo = RepositorioTareasCache(self.repo_bd, max_usuarios=1)
+        repo.listar_tareas(self.id_usuario)
+        repo.contar_tareas(self.id_usuario)
+        repo.listar_tareas(self.id_otro)
+
+        stats = repo.estadisticas()
+        self.assertEqual((1, 2), (stats.usuarios, stats.desalojos))
+        repo.listar_tareas(self.id_usuario)
+        self.assertEqual(4, repo.estadisticas().fallos)
+
+        with self.assertRaises(ValueError):
+            RepositorioTareasCache(self.repo_bd, max_usuarios=0)
+
+    def test_entradas_por_usuario_acotadas(self) -> None:
+        repo = RepositorioTareasCache(self.repo_bd, max_entradas=3)
+        for i in range(20):
+            repo.buscar_tareas(self.id_usuario, f"consulta {i}")
+        stats = repo.estadisticas()
+        self.assertEqual((3, 17), (stats.entradas, stats.desalojos))
+
+        # Un acierto refresca la entrada: se desaloja la siguiente más antigua.
+        repo.buscar_tareas(self.id_usuario, "consulta 17")
+        repo.buscar_tareas(self.id_usuario, "otra")
+        aciertos = repo.estadisticas().aciertos
+        repo.buscar_tareas(self.id_usuario, "consulta 17")
+        self.assertEqual(aciertos + 1, repo.estadisticas().aciertos)
+
+        with self.assertRaises(ValueError):
+            RepositorioTareasCache(self.repo_bd, max_entradas=0)
+
+    def test_caducadas_se_purgan_al_guardar(self) -> None:
+        self.repo.buscar_tareas(self.id_usuario, "a")
+        self.repo.buscar_tareas(self.id_usuario, "b")
+        self.reloj.ahora = 10.0
+        self.repo.contar_tareas(self.id_usuario)
+
+        stats = self.repo.estadisticas()
+        self.assertEqual((1, 2, 0), (stats.entradas, stats.caducadas, stats.desalojos))
+
+    def test_delega_el_resto_de_la_interfaz(self) -> None:
+        tarea = self.manager.crear_tarea(self.id_usuario, "Uno", "")
+
+        self.assertEqual(
+            tarea.id_tarea,
+            self.manager.obtener_tarea(self.id_usuario, tarea.id_tarea).id_tarea,
+        )
+        pagina = self.manager.listar_tareas_pagina(self.id_usuario)
+        self.assertEqual([tarea.id_tarea], [t.id_tarea for t in pagina.tareas])
+
+        self.manager.listar_tareas(self.id_usuario)
+        self.repo.limpiar_cache()
+        self.assertEqual(0, self.repo.estadisticas().entradas)
+
+    def test_aplicar_operaciones_invalida_a_los_usuarios(self) -> None:
+        self.assertEqual(0, self.repo.contar_tareas(self.id_usuario).total)
+        self.repo.aplicar_operaciones(
+            [OperacionEscritura(OP_CREAR, self.id_usuario, titulo="Diferida")]
+        )
+        self.assertEqual(1, self.repo.contar_tareas(self.id_usuario).total)
@@ -0,0 +1,200 @@
+# src/tests/test_repositorio_memoria.py
+from __future__ import annotations
+
+import unittest
+
+from src.logica.task_manager import TaskManager
+from src.modelo.bd_model import Usuario
+from src.modelo.repositorio_memoria import RepositorioTareasMemoria
+from src.modelo.repositorio_tareas import (
+    MSG_CURSOR_INVALIDO,
+    MSG_TAREA_NO_EXISTE,
+    MSG_TITULO_DUPLICADO,
+    MSG_TITULO_VACIO,
+    MSG_USUARIO_NO_EXISTE,
+    RepositorioTareasSQLite,
+)
+from src.tests.bd_pruebas import PruebaConBDMemoria
+
+TITULOS = ("beta", "Alfa", "gamma", "alfa 2", "Ñandú", "Delta")
+
+
+def _poblar(repo, id_usuario: int) -> dict[str, int]:
+    """Crea TITULOS, completa dos y devuelve {titulo: id_tarea}."""
+    ids = {
+        t: repo.crear_tarea(id_usuario, t, f"desc {t}")[0].id_tarea for t in TITULOS
+    }
+    repo.marcar_completada(id_usuario, ids["Alfa"], True)
+    repo.marcar_completadas_lote(id_usuario, [ids["gamma"]])
+    return ids
+
+
+def _vistas(repo, id_usuario: int, buscar) -> dict:
+    """Listados, conteos, páginas y búsqueda comparables entre repositorios."""
+    vistas: dict = {"conteo": repo.contar_tareas(id_usuario)}
+    for orden in ("fecha", "nombre"):
+        for completada in (None, False, True):
+            filas = repo.listar_tareas_lectura(id_usuario, orden, completada)
+            vistas[orden, completada] = [(f.titulo, f.completada) for f in filas]
+
+            paginas, cursor = [], None
+            while True:
+                pagina = repo.listar_tareas_pagina(
+                    id_usuario, 2, cursor, orden=orden, completada=completada
+                )
+                paginas.append([t.titulo for t in pagina.tareas])
+                cursor = pagina.siguiente_cursor
+                if cursor is None:
+                    break
+            vistas["paginas", orden, completada] = paginas
+    vistas["busqueda"] = [t.titulo for t in buscar("ALFA")]
+    return vistas
+
+
+class TestRepositorioTareasMemoria(unittest.TestCase):
+    def setUp(self) -> None:
+        self.repo = RepositorioTareasMemoria()
+        self.id_usuario = self.repo.agregar_usuario()
+        self.id_otro = self.repo.agregar_usuario()
+        self.manager = TaskManager(repositorio=self.repo)
+
+    def test_reglas_y_mensajes_de_crud(self) -> None:
+        tarea, _ = self.repo.crear_tarea(self.id_usuario, "  Uno  ", "  d ")
+        self.assertEqual(
+            ("Uno", "d", False), (tarea.titulo, tarea.descripcion, tarea.completada)
+        )
+
+        self.assertEqual(
+            MSG_TITULO_VACIO, self.repo.crear_tarea(self.id_usuario, " ")[1]
+        )
+        self.assertEqual(MSG_USUARIO_NO_EXISTE, self.repo.crear_tarea(99, "Uno")[1])
+        self.assertEqual(
+            MSG_TITULO_DUPLICADO, self.repo.crear_tarea(self.id_usuario, "Uno")[1]
+        )
+        self.assertIsNotNone(self.repo.crear_tarea(self.id_otro, "Uno")[0])
+
+        dos, _ = self.repo.crear_tarea(self.id_usuario, "Dos")
+        res = self.repo.editar_tarea(self.id_usuario, dos.id_tarea, "Uno")
+        self.assertEqual(MSG_TITULO_DUPLICADO, res.mensaje)
+        self.assertTrue(self.repo.editar_tarea(self.id_usuario, dos.id_tarea, "Dos").ok)
+
+        # Tareas de otro usuario: como si no existieran
+        for res in (
+            self.repo.editar_tarea(self.id_otro, tarea.id_tarea, "X"),
+            self.repo.marcar_completada(self.id_otro, tarea.id_tarea, True),
+            self.repo.eliminar_tarea(self.id_otro, tarea.id_tarea),
+        ):
+            self.assertEqual(MSG_TAREA_NO_EXISTE, res.mensaje)
+        self.assertIsNone(self.repo.obtener_tarea(self.id_otro, tarea.id_tarea))
+
+        self.assertTrue(self.repo.eliminar_tarea(self.id_usuario, tarea.id_tarea).ok)
+        self.assertIsNone(self.repo.obtener_tarea(self.id_usuario, tarea.id_tarea))
+        self.assertIsNotNone(self.repo.crear_tarea(self.id_usuario, "Uno")[0])
+
+    def test_entidades_devueltas_no_alteran_el_repositorio(self) -> None:
+        tarea, _ = self.repo.crear_tarea(self.id_usuario, "Uno")
+        tarea.titulo = "Cambiado"
+        listadas = self.repo.listar_tareas(self.id_usuario)
+        listadas[0].completada = True
+
+        obtenida = self.repo.obtener_tarea(self.id_usuario, tarea.id_tarea)
+        self.assertEqual(("Uno", False), (obtenida.titulo, obtenida.completada))
+
+    def test_lote_y_operaciones_por_ids(self) -> None:
+        self.repo.crear_tarea(self.id_usuario, "Existente")
+        lote = self.manager.crear_tareas_lote(
+            self.id_usuario, ["A", ("B", "desc"), " ", "A", "Existente"]
+        )
+        self.assertEqual(2, lote.creadas)
+        self.assertEqual(
+            [MSG_TITULO_VACIO, MSG_TITULO_DUPLICADO, MSG_TITULO_DUPLICADO],
+            [f.mensaje for f in lote.fallidas],
+        )
+        sin_usuario = self.repo.crear_tareas_lote(99, ["A", "A"])
+        self.assertEqual(
+            [MSG_USUARIO_NO_EXISTE, MSG_TITULO_DUPLICADO],
+            [f.mensaje for f in sin_usuario.filas],
+        )
+
+        ids = [f.id_tarea for f in lote.filas if f.ok]
+        ajena, _ = self.repo.crear_tarea(self.id_otro, "Ajena")
+        marcadas = self.manager.marcar_completadas_lote(
+            self.id_usuario, ids + [ajena.id_tarea]
+        )
+        self.assertEqual(2, marcadas)
+        self.assertEqual(2, self.manager.contar_tareas(self.id_usuario).completadas)
+        eliminadas = self.manager.eliminar_tareas_lote(self.id_usuario, ids * 2)
+        self.assertEqual(2, eliminadas)
+        self.assertEqual(1, self.manager.contar_tareas(self.id_usuario).total)
+
+    def test_cursor_de_otro_orden_o_invalido_falla(self) -> None:
+        for i in range(3):
+            self.repo.crear_tarea(self.id_usuario, f"T{i}")
+        pagina = self.repo.listar_tareas_pagina(self.id_usuario, 1)
+
+        with self.assertRaisesRegex(ValueError, MSG_CURSOR_INVALIDO):
+            self.repo.listar_tareas_pagina(
+                self.id_usuario, 1, pagina.siguiente_cursor, orden="nombre"
+            )
+        with self.assertRaisesRegex(ValueError, MSG_CURSOR_INVALIDO):
+            self.repo.listar_tareas_pagina(self.id_usuario, 1, "no-es-un-cursor")
+
+    def test_iter_tareas_en_orden_de_id(self) -> None:
+        ids = _poblar(self.repo, self.id_usuario)
+        self.repo.crear_tarea(self.id_otro, "Ajena")
+
+        filas = list(self.manager.iter_tareas(self.id_usuario, tamano_lote=2))
+        self.assertEqual(sorted(ids.values()), [f.id_tarea for f in filas])
+        self.assertEqual(len(TITULOS) + 1, len(list(self.repo.iter_tareas())))
+
+    def test_iter_tareas_tras_editar_conserva_orden_de_id(self) -> None:
+        ids = _poblar(self.repo, self.id_usuario)
+        primera = min(ids.values())
+        revision = self.repo.cambios_desde(self.id_usuario).revision
+
+        self.manager.editar_tarea(self.id_usuario, primera, "Renombrada", "")
+
+        filas = list(self.manager.iter_tareas(self.id_usuario))
+        self.assertEqual(sorted(ids.values()), [f.id_tarea for f in filas])
+        self.assertEqual("Renombrada", filas[0].titulo)
+        # Una edición es un solo cambio, sin lápida intermedia.
+        cambios = self.repo.cambios_desde(self.id_usuario, revision)
+        self.assertEqual(revision + 1, cambios.revision)
+
+
+class TestParidadConSQLite(PruebaConBDMemoria):
+    """Misma secuencia de operaciones, mismos resultados observables."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.repo_bd = RepositorioTareasSQLite(session_factory=cls.session_factory)
+        with cls.session_factory.begin() as session:
+            usuario = Usuario(username="paridad", password_hash="x")
+            session.add(usuario)
+            session.flush()
+            cls.id_usuario = usuario.id_usuario
+
+    def test_listados_paginas_conteos_y_busqueda(self) -> None:
+        memoria = RepositorioTareasMemoria(usuarios=[self.id_usuario])
+        for repo in (self.repo_bd, memoria):
+            _poblar(repo, self.id_usuario)
+
+        # En memoria no hay FTS5: se compara con la búsqueda por subcadena.
+        en_bd = _vistas(
+            self.repo_bd,
+            self.id_usuario,
+            lambda texto: self.repo_bd._buscar_subcadena(
+                self.id_usuario, texto, 100, None
+            ),
+        )
+        en_memoria = _vistas(
+            memoria,
+            self.id_usuario,
+            lambda texto: memoria.buscar_tareas(self.id_usuario, texto),
+        )
+        self.assertEqual(en_bd, en_memoria)
+        self.assertEqual(
+            ["Alfa", "alfa 2", "beta", "Delta", "gamma", "Ñandú"],
+            [titulo for titulo, _ in en_memoria["nombre", None]],
+        )
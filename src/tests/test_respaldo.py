@@ -0,0 +1,116 @@
+# src/tests/test_respaldo.py
+from __future__ import annotations
+
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from sqlalchemy.orm import sessionmaker
+
+from src.modelo.bd_model import Usuario
+from src.modelo.conexion import _create_engine, init_db
+from src.modelo.repositorio_tareas import RepositorioTareasSQLite
+from src.modelo.respaldo import ServicioRespaldo
+
+
+class TestServicioRespaldo(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+
+        self.ruta = self.dir / "origen.sqlite"
+        self.engine = _create_engine(f"sqlite:///{self.ruta}")
+        self.addCleanup(self.engine.dispose)
+        init_db(engine=self.engine)
+
+        factory = sessionmaker(bind=self.engine)
+        with factory.begin() as session:
+            usuario = Usuario(username="respaldo", password_hash="x")
+            session.add(usuario)
+            session.flush()
+            id_usuario = usuario.id_usuario
+
+        repo = RepositorioTareasSQLite(session_factory=factory)
+        for i in range(200):
+            repo.crear_tarea(id_usuario, f"Tarea {i}", "x" * 200)
+
+    def test_respaldo_en_segundo_plano_copia_datos(self) -> None:
+        progresos = []
+        servicio = ServicioRespaldo(
+            self.dir / "respaldos",
+            engine=self.engine,
+            paginas_por_paso=2,
+            pausa_s=0,
+            al_progresar=progresos.append,
+        )
+
+        resultado = servicio.respaldar_en_segundo_plano().result(timeout=30)
+
+        self.assertTrue(resultado.destino.exists())
+        self.assertGreater(resultado.bytes, 0)
+        self.assertGreater(len(progresos), 1)
+        self.assertEqual(100.0, progresos[-1].porcentaje)
+
+        with sqlite3.connect(resultado.destino) as copia:
+            total = copia.execute("SELECT count(*) FROM tareas").fetchone()[0]
+        self.assertEqual(200, total)
+
+    def test_rotacion_conserva_las_mas_recientes(self) -> None:
+        servicio = ServicioRespaldo(
+            self.dir / "respaldos",
+            engine=self.engine,
+            max_instantaneas=2,
+            pausa_s=0,
+        )
+
+        destinos = [servicio.respaldar().destino for _ in range(3)]
+
+        self.assertEqual(destinos[1:], servicio.instantaneas())
+        self.assertFalse(destinos[0].exists())
+
+    def _escribir_en_cada_paso(self, _progreso) -> None:
+        # Un commit de otra conexión entre pasos, como el escritor de la app.
+        with sqlite3.connect(self.ruta) as escritor:
+            escritor.execute(
+                "INSERT INTO usuarios (username, password_hash) VALUES (?, 'x')",
+                (f"concurrente {self._escrituras}",),
+            )
+        self._escrituras += 1
+
+    def test_escrituras_continuas_fallan_con_error_claro(self) -> None:
+        self._escrituras = 0
+        servicio = ServicioRespaldo(
+            self.dir / "respaldos",
+            engine=self.engine,
+            paginas_por_paso=2,
+            pausa_s=0.001,
+            max_reinicios=3,
+            al_progresar=self._escribir_en_cada_paso,
+        )
+
+        with self.assertRaisesRegex(RuntimeError, "reinició 4 veces"):
+            servicio.respaldar()
+        self.assertEqual([], list((self.dir / "respaldos").iterdir()))
+
+    def test_wal_copia_una_instantanea_sin_reinicios(self) -> None:
+        engine = _create_engine(f"sqlite:///{self.ruta}", perfil="fast")
+        self.addCleanup(engine.dispose)
+        self._escrituras = 0
+        servicio = ServicioRespaldo(
+            self.dir / "respaldos",
+            engine=engine,
+            paginas_por_paso=2,
+            pausa_s=0.001,
+            max_reinicios=0,
+            al_progresar=self._escribir_en_cada_paso,
+        )
+
+        resultado = servicio.respaldar()
+
+        self.assertEqual(0, resultado.reinicios)
+        self.assertGreater(self._escrituras, 1)
+        with sqlite3.connect(resultado.destino) as copia:
+            usuarios = copia.execute("SELECT count(*) FROM usuarios").fetchone()[0]
+        self.assertEqual(1, usuarios)  # la instantánea es la del inicio
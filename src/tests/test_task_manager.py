@@ -1,51 +1,50 @@
 # src/tests/test_task_manager.py
 from __future__ import annotations
 
-import unittest
-
-from sqlalchemy import select
+from datetime import datetime, timedelta
 
 from src.logica.task_manager import TaskManager
 from src.modelo.bd_model import Tarea, Usuario
-from src.modelo.conexion import SessionLocal, init_db
-from src.modelo.repositorio_tareas import RepositorioTareasSQLite
+from src.modelo.conexion import SessionLocal
+from src.modelo.instrumentacion import InstrumentadorSQL
+from src.modelo.repositorio_tareas import (
+    MSG_TITULO_DUPLICADO,
+    MSG_TITULO_VACIO,
+    MSG_USUARIO_NO_EXISTE,
+    STMT_CONTAR_TAREAS,
+    STMT_LISTAR_TAREAS_POR_ESTADO,
+    RepositorioTareasSQLite,
+    TareaLectura,
+)
+from src.tests.bd_pruebas import PruebaConBDMemoria
 
 
-class TestTaskManagerConDBReal(unittest.TestCase):
+class TestTaskManagerConDBMemoria(PruebaConBDMemoria):
     @classmethod
     def setUpClass(cls) -> None:
-        # Asegura que existan tablas en DB.sqlite (raíz)
-        init_db()
+        # BD en memoria; cada prueba se revierte con un SAVEPOINT
+        super().setUpClass()
 
-        cls.repo = RepositorioTareasSQLite(session_factory=SessionLocal)
+        cls.repo = RepositorioTareasSQLite(session_factory=cls.session_factory)
         cls.manager = TaskManager(repositorio=cls.repo)
 
         cls.username_test = "demo_test"
         cls.password_hash_test = "hash_demo_test"
 
-        # Crear (o recuperar) usuario de pruebas
-        with SessionLocal.begin() as session:
-            session.query(Usuario).filter(
-                Usuario.username == cls.username_test
-            ).delete()
-
-            stmt = select(Usuario).where(Usuario.username == cls.username_test)
-            usuario = session.execute(stmt).scalar_one_or_none()
-
-            if usuario is None:
-                usuario = Usuario(
-                    username=cls.username_test,
-                    password_hash=cls.password_hash_test,
-                )
-                session.add(usuario)
-                session.flush()
-
+        # Usuario de pruebas (vive en la transacción externa de la clase)
+        with cls.session_factory.begin() as session:
+            usuario = Usuario(
+                username=cls.username_test,
+                password_hash=cls.password_hash_test,
+            )
+            session.add(usuario)
+            session.flush()
             cls.id_usuario = usuario.id_usuario
 
     def setUp(self) -> None:
-        # Limpia SOLO tareas del usuario de prueba (no toca nada más)
-        with SessionLocal.begin() as session:
-            session.query(Tarea).filter(Tarea.id_usuario == self.id_usuario).delete()
+        super().setUp()
+        # Los ids se reutilizan tras revertir cada SAVEPOINT
+        self.repo.limpiar_cache()
 
     # HU02
     def test_crear_tarea_ok(self) -> None:
@@ -103,9 +102,360 @@ class TestTaskManagerConDBReal(unittest.TestCase):
         tareas = self.manager.listar_tareas(self.id_usuario)
         self.assertTrue(bool(tareas[0].completada))
 
+    # HU08
+    def test_listar_tareas_por_estado(self) -> None:
+        t1 = self.manager.crear_tarea(self.id_usuario, "Pendiente 1", "")
+        t2 = self.manager.crear_tarea(self.id_usuario, "Pendiente 2", "")
+        t3 = self.manager.crear_tarea(self.id_usuario, "Hecha", "")
+        self.manager.marcar_completada(self.id_usuario, t3.id_tarea, True)
+
+        pendientes = self.manager.listar_tareas_por_estado(self.id_usuario, False)
+        completadas = self.manager.listar_tareas_por_estado(self.id_usuario, True)
+
+        self.assertEqual([t2.id_tarea, t1.id_tarea], [t.id_tarea for t in pendientes])
+        self.assertEqual([t3.id_tarea], [t.id_tarea for t in completadas])
+
+    def _plan(self, stmt, **valores) -> str:
+        """EXPLAIN QUERY PLAN de una sentencia con parámetros ligados."""
+        compilada = stmt.compile(dialect=self.bd.engine.dialect)
+        params = compilada.construct_params(valores)
+        args = tuple(params[nombre] for nombre in compilada.positiontup)
+
+        with self.session_factory() as session:
+            return " ".join(
+                str(fila[-1])
+                for fila in session.connection().exec_driver_sql(
+                    f"EXPLAIN QUERY PLAN {compilada.string}", args
+                )
+            )
+
+    def test_filtro_por_estado_usa_indice_sin_ordenar(self) -> None:
+        plan = self._plan(
+            STMT_LISTAR_TAREAS_POR_ESTADO,
+            id_usuario=self.id_usuario,
+            completada=False,
+        )
+        self.assertIn("ix_tareas_usuario_completada", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
+
+    # Estadísticas del dashboard
+    def test_contar_tareas(self) -> None:
+        vacias = self.manager.contar_tareas(self.id_usuario)
+        self.assertEqual(
+            (0, 0, 0), (vacias.total, vacias.pendientes, vacias.completadas)
+        )
+
+        for i in range(3):
+            self.manager.crear_tarea(self.id_usuario, f"Contar {i}", "")
+        tarea = self.manager.listar_tareas(self.id_usuario)[0]
+        self.manager.marcar_completada(self.id_usuario, tarea.id_tarea, True)
+
+        stats = self.manager.contar_tareas(self.id_usuario)
+        self.assertEqual((3, 2, 1), (stats.total, stats.pendientes, stats.completadas))
+
+    def test_contar_tareas_usa_indice_cubriente(self) -> None:
+        plan = self._plan(STMT_CONTAR_TAREAS, id_usuario=self.id_usuario)
+        self.assertIn("COVERING INDEX ix_tareas_usuario_completada", plan)
+
+    # HU10
+    def test_listar_tareas_ordenadas_por_nombre_sin_mayusculas(self) -> None:
+        for titulo in ("beta", "Alfa", "gamma", "ALFB"):
+            self.manager.crear_tarea(self.id_usuario, titulo, "")
+
+        tareas = self.manager.listar_tareas_ordenadas(self.id_usuario, "nombre")
+        self.assertEqual(
+            ["Alfa", "ALFB", "beta", "gamma"], [t.titulo for t in tareas]
+        )
+
+    def test_listar_tareas_ordenadas_combina_estado(self) -> None:
+        for titulo in ("b", "a", "c"):
+            self.manager.crear_tarea(self.id_usuario, titulo, "")
+        c = self.manager.listar_tareas_ordenadas(self.id_usuario, "nombre")[2]
+        self.manager.marcar_completada(self.id_usuario, c.id_tarea, True)
+
+        pendientes = self.manager.listar_tareas_ordenadas(
+            self.id_usuario, "nombre", completada=False
+        )
+        self.assertEqual(["a", "b"], [t.titulo for t in pendientes])
+
+    def test_listar_tareas_ordenadas_orden_desconocido_usa_fecha(self) -> None:
+        t1 = self.manager.crear_tarea(self.id_usuario, "Uno", "")
+        t2 = self.manager.crear_tarea(self.id_usuario, "Dos", "")
+
+        tareas = self.manager.listar_tareas_ordenadas(self.id_usuario, "otro")
+        self.assertEqual([t2.id_tarea, t1.id_tarea], [t.id_tarea for t in tareas])
+
+    def test_listar_tareas_pagina_por_nombre(self) -> None:
+        titulos = ["e", "B", "a", "D", "c", "f", "G"]
+        for titulo in titulos:
+            self.manager.crear_tarea(self.id_usuario, titulo, "")
+
+        vistas = []
+        cursor = None
+        while True:
+            pagina = self.manager.listar_tareas_pagina(
+                self.id_usuario, limite=3, cursor=cursor, orden="nombre"
+            )
+            vistas.extend(t.titulo for t in pagina.tareas)
+            cursor = pagina.siguiente_cursor
+            if cursor is None:
+                break
+
+        self.assertEqual(sorted(titulos, key=str.lower), vistas)
+        with self.assertRaises(ValueError):
+            primera = self.manager.listar_tareas_pagina(
+                self.id_usuario, limite=3, orden="nombre"
+            )
+            self.manager.listar_tareas_pagina(
+                self.id_usuario, limite=3, cursor=primera.siguiente_cursor
+            )
+
+    # Paginación por keyset
+    def test_listar_tareas_pagina_recorre_todo_sin_repetir(self) -> None:
+        # Mismo segundo para varias tareas: el desempate es id_tarea desc.
+        creadas = [
+            self.manager.crear_tarea(self.id_usuario, f"P{i}", "") for i in range(5)
+        ]
+
+        vistas = []
+        pagina = self.manager.listar_tareas_pagina(self.id_usuario, limite=2)
+        vistas.extend(pagina.tareas)
+        while pagina.hay_mas:
+            self.assertEqual(2, len(pagina.tareas))
+            pagina = self.manager.listar_tareas_pagina(
+                self.id_usuario, limite=2, cursor=pagina.siguiente_cursor
+            )
+            vistas.extend(pagina.tareas)
+
+        esperadas = sorted(creadas, key=lambda t: (t.creada_en, t.id_tarea))[::-1]
+        self.assertEqual(
+            [t.id_tarea for t in esperadas], [t.id_tarea for t in vistas]
+        )
+        self.assertIsNone(pagina.siguiente_cursor)
+
+    def test_listar_tareas_pagina_con_fechas_con_microsegundos(self) -> None:
+        base = datetime(2024, 1, 1, 12, 0, 0)
+        with self.session_factory.begin() as session:
+            session.add_all(
+                Tarea(
+                    id_usuario=self.id_usuario,
+                    titulo=f"F{i}",
+                    creada_en=base + timedelta(microseconds=i % 2),
+                )
+                for i in range(4)
+            )
+
+        pagina1 = self.manager.listar_tareas_pagina(self.id_usuario, limite=3)
+        pagina2 = self.manager.listar_tareas_pagina(
+            self.id_usuario, limite=3, cursor=pagina1.siguiente_cursor
+        )
+        ids = [t.id_tarea for t in pagina1.tareas + pagina2.tareas]
+        self.assertEqual(4, len(set(ids)))
+        self.assertFalse(pagina2.hay_mas)
+
+    def test_listar_tareas_pagina_cursor_invalido(self) -> None:
+        with self.assertRaises(ValueError):
+            self.manager.listar_tareas_pagina(self.id_usuario, cursor="no-es-cursor")
+
     # Repositorio sin inyectar
     def test_repo_sin_inyeccion_usa_sessionlocal(self) -> None:
-
-        init_db()
         repo = RepositorioTareasSQLite()
         self.assertIs(repo._session_factory, SessionLocal)  # noqa: SLF001
+
+    # Creación en lote
+    def test_crear_tareas_lote_informa_por_fila(self) -> None:
+        self.manager.crear_tarea(self.id_usuario, "Existente", "")
+
+        resultado = self.manager.crear_tareas_lote(
+            self.id_usuario,
+            [
+                ("Lote 1", "desc"),
+                "Lote 2",
+                ("Existente", None),
+                ("  ", "vacía"),
+                ("Lote 1", "repetida en el lote"),
+                ("Lote 3", None),
+            ],
+            tamano_lote=2,
+        )
+
+        self.assertEqual(3, resultado.creadas)
+        self.assertEqual(
+            [True, True, False, False, False, True],
+            [fila.ok for fila in resultado.filas],
+        )
+        self.assertEqual(list(range(6)), [fila.indice for fila in resultado.filas])
+        self.assertEqual(MSG_TITULO_DUPLICADO, resultado.filas[2].mensaje)
+        self.assertEqual(MSG_TITULO_VACIO, resultado.filas[3].mensaje)
+        self.assertEqual(MSG_TITULO_DUPLICADO, resultado.filas[4].mensaje)
+
+        tareas = {t.titulo: t for t in self.manager.listar_tareas(self.id_usuario)}
+        self.assertEqual(
+            {"Existente", "Lote 1", "Lote 2", "Lote 3"}, set(tareas)
+        )
+        self.assertEqual(tareas["Lote 1"].id_tarea, resultado.filas[0].id_tarea)
+        self.assertEqual("desc", tareas["Lote 1"].descripcion)
+
+    def test_crear_tareas_lote_usuario_inexistente(self) -> None:
+        resultado = self.manager.crear_tareas_lote(999_999, ["A", "B"])
+        self.assertEqual(0, resultado.creadas)
+        self.assertEqual(
+            {MSG_USUARIO_NO_EXISTE}, {fila.mensaje for fila in resultado.filas}
+        )
+
+    def test_marcar_y_eliminar_tareas_lote(self) -> None:
+        with self.session_factory.begin() as session:
+            otro = Usuario(username="otro_lote", password_hash="x")
+            session.add(otro)
+            session.flush()
+            id_otro = otro.id_usuario
+        ajena = self.manager.crear_tarea(id_otro, "Ajena", "")
+
+        lote = self.manager.crear_tareas_lote(
+            self.id_usuario, [f"Masiva {i}" for i in range(5)]
+        )
+        ids = [fila.id_tarea for fila in lote.filas]
+
+        marcadas = self.manager.marcar_completadas_lote(
+            self.id_usuario, ids[:3] + [ajena.id_tarea, 999_999], tamano_lote=2
+        )
+        self.assertEqual(3, marcadas)
+        stats = self.manager.contar_tareas(self.id_usuario)
+        self.assertEqual((2, 3), (stats.pendientes, stats.completadas))
+        self.assertFalse(self.manager.listar_tareas(id_otro)[0].completada)
+
+        eliminadas = self.manager.eliminar_tareas_lote(
+            self.id_usuario, ids + ids[:1] + [ajena.id_tarea], tamano_lote=2
+        )
+        self.assertEqual(5, eliminadas)
+        self.assertEqual([], self.manager.listar_tareas(self.id_usuario))
+        self.assertEqual(1, len(self.manager.listar_tareas(id_otro)))
+        self.assertEqual(0, self.manager.eliminar_tareas_lote(self.id_usuario, []))
+
+    # Filas de solo lectura
+    def test_listar_tareas_lectura_equivale_al_listado_orm(self) -> None:
+        for titulo in ("b", "A", "c"):
+            self.manager.crear_tarea(self.id_usuario, titulo, f"desc {titulo}")
+        completar = self.manager.listar_tareas(self.id_usuario)[0]
+        self.manager.marcar_completada(self.id_usuario, completar.id_tarea, True)
+
+        for orden, completada in (("fecha", None), ("nombre", None), ("nombre", False)):
+            orm = self.manager.listar_tareas_ordenadas(
+                self.id_usuario, orden, completada
+            )
+            filas = self.manager.listar_tareas_lectura(
+                self.id_usuario, orden, completada
+            )
+            self.assertEqual(
+                [
+                    (t.id_tarea, t.titulo, t.descripcion, t.completada, t.creada_en)
+                    for t in orm
+                ],
+                [
+                    (f.id_tarea, f.titulo, f.descripcion, f.completada, f.creada_en)
+                    for f in filas
+                ],
+            )
+
+        fila = filas[0]
+        self.assertIsInstance(fila, TareaLectura)
+        self.assertFalse(hasattr(fila, "__dict__"))
+        with self.assertRaises(AttributeError):
+            fila.titulo = "otro"
+
+    # Recorrido en streaming
+    def test_iter_tareas_recorre_por_lotes_en_orden_de_id(self) -> None:
+        with self.session_factory.begin() as session:
+            otro = Usuario(username="otro_iter", password_hash="x")
+            session.add(otro)
+            session.flush()
+            id_otro = otro.id_usuario
+        ajena = self.manager.crear_tarea(id_otro, "Ajena", "")
+        ids = [
+            self.manager.crear_tarea(self.id_usuario, f"T{i}", "").id_tarea
+            for i in range(5)
+        ]
+
+        filas = list(self.manager.iter_tareas(self.id_usuario, tamano_lote=2))
+        self.assertEqual(ids, [f.id_tarea for f in filas])
+        self.assertIsInstance(filas[0], TareaLectura)
+
+        todas = [f.id_tarea for f in self.manager.iter_tareas(tamano_lote=2)]
+        self.assertEqual(sorted(ids + [ajena.id_tarea]), todas)
+
+        with self.assertRaises(ValueError):
+            self.manager.iter_tareas(self.id_usuario, tamano_lote=0)
+
+    def test_iter_tareas_cerrar_generador_libera_la_sesion(self) -> None:
+        for i in range(3):
+            self.manager.crear_tarea(self.id_usuario, f"T{i}", "")
+
+        generador = self.manager.iter_tareas(self.id_usuario, tamano_lote=1)
+        self.assertEqual("T0", next(generador).titulo)
+        generador.close()
+        with self.assertRaises(StopIteration):
+            next(generador)
+
+        # La sesión de lectura ya se cerró: se puede seguir escribiendo.
+        self.assertIsNotNone(self.manager.crear_tarea(self.id_usuario, "T3", ""))
+        self.assertEqual(4, len(list(self.manager.iter_tareas(self.id_usuario))))
+
+    # Lectura por clave primaria con caché
+    def test_obtener_tarea_verifica_usuario_e_invalida_en_escrituras(self) -> None:
+        tarea = self.manager.crear_tarea(self.id_usuario, "Cache", "")
+        otra = self.manager.crear_tarea(self.id_usuario, "Otra", "")
+
+        self.assertEqual(
+            "Cache", self.manager.obtener_tarea(self.id_usuario, tarea.id_tarea).titulo
+        )
+        self.assertIsNone(self.manager.obtener_tarea(-1, tarea.id_tarea))
+        self.assertIsNone(self.manager.obtener_tarea(self.id_usuario, 999_999))
+
+        self.manager.marcar_completada(self.id_usuario, tarea.id_tarea, True)
+        self.assertTrue(
+            self.manager.obtener_tarea(self.id_usuario, tarea.id_tarea).completada
+        )
+
+        self.manager.obtener_tarea(self.id_usuario, otra.id_tarea)
+        self.manager.marcar_completadas_lote(self.id_usuario, [otra.id_tarea])
+        self.assertTrue(
+            self.manager.obtener_tarea(self.id_usuario, otra.id_tarea).completada
+        )
+
+        self.manager.eliminar_tareas_lote(self.id_usuario, [otra.id_tarea])
+        self.assertIsNone(self.manager.obtener_tarea(self.id_usuario, otra.id_tarea))
+        self.manager.eliminar_tarea(self.id_usuario, tarea.id_tarea)
+        self.assertIsNone(self.manager.obtener_tarea(self.id_usuario, tarea.id_tarea))
+
+    def test_cache_de_obtener_tarea_acotado(self) -> None:
+        repo = RepositorioTareasSQLite(
+            session_factory=self.session_factory, tamano_cache=2
+        )
+        ids = [
+            self.manager.crear_tarea(self.id_usuario, f"T{i}", "").id_tarea
+            for i in range(3)
+        ]
+        for id_tarea in ids + ids[:1]:
+            repo.obtener_tarea(self.id_usuario, id_tarea)
+
+        # Solo las dos más recientes siguen en caché; la desalojada vuelve a la BD.
+        instr = InstrumentadorSQL(umbral_lento_ms=10_000)
+        instr.adjuntar(self.bd.engine)
+        self.addCleanup(instr.desadjuntar)
+        repo.obtener_tarea(self.id_usuario, ids[0])
+        repo.obtener_tarea(self.id_usuario, ids[2])
+        self.assertEqual(0, instr.snapshot().ejecuciones_de("SELECT"))
+        repo.obtener_tarea(self.id_usuario, ids[1])
+        self.assertEqual(1, instr.snapshot().ejecuciones_de("SELECT"))
+
+        sin_cache = RepositorioTareasSQLite(
+            session_factory=self.session_factory, tamano_cache=0
+        )
+        instr.reiniciar()
+        for _ in range(2):
+            self.assertIsNotNone(sin_cache.obtener_tarea(self.id_usuario, ids[0]))
+        self.assertEqual(2, instr.snapshot().ejecuciones_de("SELECT"))
+        with self.assertRaises(ValueError):
+            RepositorioTareasSQLite(
+                session_factory=self.session_factory, tamano_cache=-1
+            )
@@ -13,6 +13,7 @@ from datetime import datetime
 from PyQt6.QtWidgets import QMessageBox
 
 from src.logica.task_manager import TaskManager
+from src.modelo.repositorio_tareas import LIMITE_BUSQUEDA_POR_DEFECTO
 
 
 class ControladorTareasVista:
@@ -110,19 +111,6 @@ class ControladorTareasVista:
         self._orden = modo
         self._refrescar_dashboard()
 
-    def _ordenar_tareas(self, tareas):
-        if self._orden == "nombre":
-            return sorted(
-                tareas,
-                key=lambda t: (getattr(t, "titulo", "") or "").lower(),
-            )
-
-        def key_fecha(t):
-            v = getattr(t, "creada_en", None)
-            return v if v is not None else datetime.min
-
-        return sorted(tareas, key=key_fecha, reverse=True)
-
     # ---------------- CRUD ----------------
 
     def _al_guardar(self, datos: dict):
@@ -216,16 +204,15 @@ class ControladorTareasVista:
         if self._id_usuario is None:
             return
 
-        tareas_all = self._listar_tareas_all()
-        tareas_dict = [self._tarea_a_dict(t) for t in tareas_all]
+        # Lectura por clave primaria (cacheada en el repositorio)
+        tarea = self._task_manager.obtener_tarea(self._id_usuario, int(id_tarea))
+        if tarea is None:
+            return
 
-        for tarea in tareas_dict:
-            if tarea["id_tarea"] == int(id_tarea):
-                self.registrar.cargar_para_edicion(tarea)
-                stack = self.registrar.parent()
-                if stack:
-                    stack.setCurrentWidget(self.registrar)
-                break
+        self.registrar.cargar_para_edicion(self._tarea_a_dict(tarea))
+        stack = self.registrar.parent()
+        if stack:
+            stack.setCurrentWidget(self.registrar)
 
     def _buscar_tareas(self, texto: str):
         """Filtra tareas por título/descripcion + estado y refresca el dashboard."""
@@ -233,24 +220,31 @@ class ControladorTareasVista:
             self._mostrar_tareas([])
             return
 
-        texto = (texto or "").strip().lower()
-
-        tareas = self._listar_tareas_all()
-        tareas = self._aplicar_filtro_estado(tareas)
-        tareas = self._ordenar_tareas(tareas)
+        texto = (texto or "").strip()
 
         if not texto:
-            self._mostrar_tareas([self._tarea_a_dict(t) for t in tareas])
-            return
-
-        filtradas = []
-        for t in tareas:
-            titulo = (getattr(t, "titulo", "") or "").lower()
-            desc = (getattr(t, "descripcion", "") or "").lower()
-            if texto in titulo or texto in desc:
-                filtradas.append(t)
+            tareas = self._listar_tareas_visibles()
+        else:
+            # FTS5 (o subcadena si no está disponible), respetando el filtro HU08.
+            # Se pide una de más para saber si el resultado quedó recortado.
+            limite = LIMITE_BUSQUEDA_POR_DEFECTO
+            tareas = self._task_manager.buscar_tareas(
+                self._id_usuario,
+                texto,
+                limite + 1,
+                completada=self._completada_filtro(),
+            )
+            if len(tareas) > limite:
+                self._mostrar_tareas(
+                    [self._tarea_a_dict(t) for t in tareas[:limite]],
+                    aviso=(
+                        f"Mostrando los {limite} primeros resultados; "
+                        "escribe más palabras para acotar la búsqueda."
+                    ),
+                )
+                return
 
-        self._mostrar_tareas([self._tarea_a_dict(t) for t in filtradas])
+        self._mostrar_tareas([self._tarea_a_dict(t) for t in tareas])
 
     # ---------------- Render / helpers ----------------
 
@@ -261,35 +255,36 @@ class ControladorTareasVista:
             self._mostrar_tareas([])
             return
 
-        tareas_all = self._listar_tareas_all()
-
-        total = len(tareas_all)
-        completadas = sum(1 for t in tareas_all if bool(getattr(t, "completada", False)))
-        pendientes = total - completadas
-
+        # Una consulta agregada; no se materializan las tareas para contarlas
+        stats = self._task_manager.contar_tareas(self._id_usuario)
         self.dashboard.actualizar_estadisticas(
-            total=total,
-            pendientes=pendientes,
-            completadas=completadas,
+            total=stats.total,
+            pendientes=stats.pendientes,
+            completadas=stats.completadas,
         )
 
-        tareas_visibles = self._aplicar_filtro_estado(tareas_all)
-        tareas_visibles = self._ordenar_tareas(tareas_visibles)
+        tareas_visibles = self._listar_tareas_visibles()
         self._mostrar_tareas([self._tarea_a_dict(t) for t in tareas_visibles])
 
-    def _listar_tareas_all(self):
-        return self._task_manager.listar_tareas(self._id_usuario)
-
-    def _aplicar_filtro_estado(self, tareas):
-        if self._filtro_estado is None:
-            return tareas
+    def _completada_filtro(self) -> bool | None:
+        """HU08: filtro actual como valor de `completada` (None = todas)."""
         if self._filtro_estado == "pendientes":
-            return [t for t in tareas if not bool(getattr(t, "completada", False))]
+            return False
         if self._filtro_estado == "completadas":
-            return [t for t in tareas if bool(getattr(t, "completada", False))]
-        return tareas
+            return True
+        return None
+
+    def _listar_tareas_visibles(self):
+        """HU08 + HU10: filtro y orden en SQL; filas TareaLectura (sin ORM)."""
+        return self._task_manager.listar_tareas_lectura(
+            self._id_usuario,
+            self._orden,
+            self._completada_filtro(),
+        )
 
-    def _mostrar_tareas(self, tareas: list[dict]):
+    def _mostrar_tareas(self, tareas: list[dict], aviso: str | None = None):
+        # Cualquier otro listado borra el aviso de búsqueda recortada
+        self.dashboard.mostrar_aviso_busqueda(aviso)
         self.dashboard.mostrar_tareas(tareas)
 
     def _eliminar_tarea(self, id_tarea: int):
@@ -297,12 +292,8 @@ class ControladorTareasVista:
         if self._id_usuario is None:
             return
 
-        titulo = ""
-        tareas_all = self._listar_tareas_all()
-        for t in tareas_all:
-            if int(getattr(t, "id_tarea")) == int(id_tarea):
-                titulo = str(getattr(t, "titulo") or "")
-                break
+        tarea = self._task_manager.obtener_tarea(self._id_usuario, int(id_tarea))
+        titulo = str(tarea.titulo or "") if tarea is not None else ""
 
         texto = (
             f"¿Seguro que deseas eliminar la tarea:\n\n“{titulo}”?\n\n"
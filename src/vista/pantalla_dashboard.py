@@ -500,6 +500,12 @@ class PantallaDashboard(QWidget):
 
         contenido_layout.addSpacing(28)
 
+        # Aviso no modal (p. ej. búsqueda recortada); oculto si no hay texto
+        self.lbl_aviso_busqueda = QLabel("")
+        self.lbl_aviso_busqueda.setProperty("cssClass", "placeholder")
+        self.lbl_aviso_busqueda.setVisible(False)
+        contenido_layout.addWidget(self.lbl_aviso_busqueda)
+
         # ============ COLUMNAS (2 columnas siempre) ============
         columnas = QHBoxLayout()
         columnas.setSpacing(18)
@@ -613,6 +619,11 @@ class PantallaDashboard(QWidget):
         self.stat_pendientes.establecer_valor(pendientes)
         self.stat_completadas.establecer_valor(completadas)
 
+    def mostrar_aviso_busqueda(self, texto: str | None) -> None:
+        """Muestra (o con None oculta) una línea informativa sobre la lista."""
+        self.lbl_aviso_busqueda.setText(texto or "")
+        self.lbl_aviso_busqueda.setVisible(bool(texto))
+
     def mostrar_tareas(self, tareas: list):
         """Muestra las tareas como cards animadas en las secciones."""
         self._limpiar_layout(self.contenedor_pendientes)
@@ -5,10 +5,18 @@ Indice 0: Login | Indice 1: Dashboard | Indice 2: Registrar Tarea
 HU11: Confirmación al cerrar sesión.
 """
 
-from PyQt6.QtWidgets import QMainWindow, QStackedWidget, QMessageBox
+import time
+from concurrent.futures import Future
+
+from PyQt6.QtCore import QEvent, QTimer
+from PyQt6.QtWidgets import QApplication, QMainWindow, QStackedWidget, QMessageBox
+from sqlalchemy.exc import SQLAlchemyError
 
 from src.logica.login_logica import LoginLogica
 from src.logica.task_manager import TaskManager
+from src.modelo.cola_escritura import ColaEscrituraTareas
+from src.modelo.mantenimiento import MantenimientoBD
+from src.modelo.repositorio_cache import RepositorioTareasCache
 from src.vista.pantalla_login import PantallaLogin
 from src.vista.pantalla_dashboard import PantallaDashboard
 from src.vista.pantalla_registrar_tarea import PantallaRegistrarTarea
@@ -22,6 +30,18 @@ class VentanaPrincipal(QMainWindow):
     INDICE_DASHBOARD = 1
     INDICE_REGISTRAR_TAREA = 2
 
+    # Mantenimiento de BD (incremental_vacuum) mientras la app está ociosa:
+    # sin entrada del usuario durante INACTIVIDAD_MANTENIMIENTO_S y sin
+    # escrituras encoladas; corre en un hilo aparte, nunca en el de la UI.
+    INTERVALO_MANTENIMIENTO_MS = 60_000
+    INACTIVIDAD_MANTENIMIENTO_S = 30.0
+    EVENTOS_ENTRADA = (
+        QEvent.Type.KeyPress,
+        QEvent.Type.MouseButtonPress,
+        QEvent.Type.MouseMove,
+        QEvent.Type.Wheel,
+    )
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("OOPRA - Gestor de Tareas")
@@ -31,10 +51,20 @@ class VentanaPrincipal(QMainWindow):
         self._id_usuario_actual: int | None = None
 
         self._login_logica = LoginLogica()
-        self._task_manager = TaskManager()
+        # Listados/conteos por usuario en memoria; las escrituras los invalidan
+        self._repositorio_tareas = RepositorioTareasCache()
+        self._task_manager = TaskManager(repositorio=self._repositorio_tareas)
+        # Escrituras en ráfaga (importaciones, scripts): se agrupan en una
+        # transacción; se vacía al cerrar sesión y al cerrar la ventana.
+        self._cola_escritura = ColaEscrituraTareas(self._repositorio_tareas)
+
+        self._mantenimiento = MantenimientoBD()
+        self._mantenimiento_en_curso: Future | None = None
+        self._ultima_entrada = time.monotonic()
 
         self._configurar_ui()
         self._conectar_senales()
+        self._iniciar_mantenimiento()
 
     def _configurar_ui(self):
         self.stack = QStackedWidget()
@@ -57,6 +87,52 @@ class VentanaPrincipal(QMainWindow):
 
         self.stack.setCurrentIndex(self.INDICE_LOGIN)
 
+    @property
+    def cola_escritura(self) -> ColaEscrituraTareas:
+        return self._cola_escritura
+
+    def closeEvent(self, event):
+        # Ninguna escritura encolada se pierde al salir
+        try:
+            self._cola_escritura.cerrar()
+        except SQLAlchemyError:
+            pass  # el error ya quedó en los Futures de las operaciones
+        super().closeEvent(event)
+
+    def _iniciar_mantenimiento(self):
+        self._timer_mantenimiento = QTimer(self)
+        self._timer_mantenimiento.setInterval(self.INTERVALO_MANTENIMIENTO_MS)
+        self._timer_mantenimiento.timeout.connect(self._mantenimiento_en_reposo)
+        self._timer_mantenimiento.start()
+        app = QApplication.instance()
+        if app is not None:
+            app.installEventFilter(self)
+
+    def eventFilter(self, objeto, evento):
+        if evento.type() in self.EVENTOS_ENTRADA:
+            self._ultima_entrada = time.monotonic()
+        return super().eventFilter(objeto, evento)
+
+    def _en_reposo(self) -> bool:
+        inactivo_s = time.monotonic() - self._ultima_entrada
+        return (
+            inactivo_s >= self.INACTIVIDAD_MANTENIMIENTO_S
+            and self.stack.currentIndex() != self.INDICE_REGISTRAR_TAREA
+            and self._cola_escritura.pendientes == 0
+            and (
+                self._mantenimiento_en_curso is None
+                or self._mantenimiento_en_curso.done()
+            )
+        )
+
+    def _mantenimiento_en_reposo(self):
+        # Sin avisos al usuario; si la BD está ocupada la pasada se omite sola
+        # (sin esperar la conexión ni el lock) y se reintenta en el siguiente ciclo.
+        if self._en_reposo():
+            self._mantenimiento_en_curso = (
+                self._mantenimiento.ejecutar_en_segundo_plano()
+            )
+
     def _conectar_senales(self):
         self.pantalla_login.sesion_iniciada.connect(self._al_iniciar_sesion)
 
@@ -98,6 +174,11 @@ class VentanaPrincipal(QMainWindow):
         if r != QMessageBox.StandardButton.Yes:
             return
 
+        try:
+            self._cola_escritura.vaciar()
+        except SQLAlchemyError:
+            pass  # el error ya quedó en los Futures de las operaciones
+
         self._usuario_actual = ""
         self._id_usuario_actual = None
 